@@ -4,38 +4,89 @@ py-github-analyzer: High-performance async GitHub repository analyzer
 with AI-optimized code extraction and smart .env file support
 """
 
+from __future__ import annotations
+
+import importlib
 import os
-from typing import Any, Dict
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from .exceptions import *
+
+if TYPE_CHECKING:
+    from typing import Any, Final, Optional
 
-try:
     from .async_github_client import AsyncGitHubClient
     from .config import Config
-    from .core import (
-        EmptyRepositoryError,
-        GitHubRepositoryAnalyzer,
-        analyze_repository_async,
-    )
-    from .exceptions import *
+    from .core import GitHubRepositoryAnalyzer, analyze_repository_async
     from .logger import get_logger
     from .utils import TokenUtils, URLParser
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Make sure all required dependencies are installed.")
-    raise
 
-__version__ = "1.0.0"
-__author__ = "Han Jun-hee"
-__email__ = "createbrain2heart@gmail.com"
-__description__ = "High-performance async GitHub repository analyzer with AI-optimized code extraction"
+# Heavy submodules (httpx, rich) are imported on first attribute access
+_LAZY_IMPORTS = {
+    "AsyncGitHubClient": (".async_github_client", "AsyncGitHubClient"),
+    "GitHubRepositoryAnalyzer": (".core", "GitHubRepositoryAnalyzer"),
+    "analyze_repository_async": (".core", "analyze_repository_async"),
+    "Config": (".config", "Config"),
+    "get_logger": (".logger", "get_logger"),
+    "TokenUtils": (".utils", "TokenUtils"),
+    "URLParser": (".utils", "URLParser"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError as e:
+        sys.stderr.write(
+            f"Import error: {e}\nMake sure all required dependencies are installed.\n"
+        )
+        raise
+
+    value = getattr(module, attr)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+__version__: Final[str] = "1.0.0"
+__author__: Final[str] = "Han Jun-hee"
+__email__: Final[str] = "createbrain2heart@gmail.com"
+__description__: Final[str] = "High-performance async GitHub repository analyzer with AI-optimized code extraction"
+
+_BANNER = f"""
+╭─────────────────────────────────────────────────────────────────╮
+│ 🚀 py-github-analyzer v{__version__}                               │
+│                                                                 │
+│ High-performance async GitHub repository analyzer               │
+│ with AI-optimized code extraction and smart .env support       │
+│                                                                 │
+│ Author: {__author__}                                    │
+│ Email: {__email__}                         │
+╰─────────────────────────────────────────────────────────────────╯
+"""
+
+__all__: Final[tuple[str, ...]] = (
     "analyze_repository_async",
     "GitHubRepositoryAnalyzer",
     "AsyncGitHubClient",
     "get_logger",
     "get_version",
     "check_env_file",
+    "check_env_file_async",
+    "check_env_status",
+    "EnvFileStatus",
     "get_token_sources",
+    "get_token_sources_async",
     "URLParser",
     "TokenUtils",
     "Config",
@@ -46,7 +97,39 @@ __all__ = [
     "RateLimitError",
     "RepositoryNotFoundError",
     "ValidationError",
-]
+)
+
+_TOKEN_ENV_VARS = ("GITHUB_TOKEN", "GH_TOKEN")
+_SOURCE_LABELS = {
+    env_var: (f"{env_var} (system)", f"{env_var} (.env)") for env_var in _TOKEN_ENV_VARS
+}
+
+
+class EnvFileStatus(NamedTuple):
+    """.env file and token status returned by check_env_status()"""
+
+    env_files_found: int
+    env_file_paths: tuple[str, ...]
+    token_sources: tuple[str, ...]
+    token_status: str
+    token_type: str
+    error: Optional[str] = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Dict form used by check_env_file()"""
+        result: dict[str, Any] = {
+            "env_files_found": self.env_files_found,
+            "env_file_paths": list(self.env_file_paths),
+            "token_sources": list(self.token_sources),
+            "token_status": self.token_status,
+            "token_type": self.token_type,
+        }
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
+
+_ENV_CHECK_ERROR = EnvFileStatus(0, (), (), "error", "none")
 
 
 def get_version() -> str:
@@ -54,100 +137,154 @@ def get_version() -> str:
     return __version__
 
 
-def check_env_file() -> Dict[str, Any]:
-    """Check .env file status and token availability"""
+def _log_env_error(func_name: str, error: Exception) -> None:
+    """Record a .env/environment read failure before it is folded into a result"""
+    from .logger import get_logger
+
+    get_logger().debug(f"{func_name}: failed to read token sources: {error!r}")
+
+
+def _env_fingerprint() -> tuple[tuple[str, float], ...]:
+    """Identify the visible .env files by path and modification time"""
+    from .utils import TokenUtils
+
+    fingerprint = []
+    for env_file in TokenUtils._find_env_files():
+        try:
+            fingerprint.append((env_file, os.path.getmtime(env_file)))
+        except OSError:
+            continue
+    return tuple(fingerprint)
+
+
+@lru_cache(maxsize=1)
+def _load_env_state(
+    fingerprint: tuple[tuple[str, float], ...]
+) -> tuple[tuple[str, ...], dict[str, str]]:
+    """Parse the fingerprinted .env files once; results are shared, do not mutate"""
+    from .utils import TokenUtils
+
+    env_files = tuple(env_file for env_file, _ in fingerprint)
+    env_vars: dict[str, str] = {}
+    for env_file in env_files:
+        env_vars.update(TokenUtils._parse_env_file(env_file))
+    return env_files, env_vars
+
+
+def _collect_token_state() -> tuple[
+    tuple[str, ...], dict[str, str], list[str], list[str]
+]:
+    """Return (env_files, env_vars, system_sources, dotenv_sources)"""
+    env_files, env_vars = _load_env_state(_env_fingerprint())
+    # os.environ re-encodes keys on every lookup; read each token variable once
+    environ = os.environ
+    system_tokens = {env_var: environ.get(env_var) for env_var in _TOKEN_ENV_VARS}
+    system_sources: list[str] = []
+    dotenv_sources: list[str] = []
+    for env_var in _TOKEN_ENV_VARS:
+        if system_tokens[env_var]:
+            system_sources.append(env_var)
+        if env_vars.get(env_var):
+            dotenv_sources.append(env_var)
+    return env_files, env_vars, system_sources, dotenv_sources
+
+
+def check_env_status(*, include_token_info: bool = True) -> EnvFileStatus:
+    """
+    Check .env file status and token availability
+
+    With include_token_info=False the token is not classified, which skips
+    get_token_info's .env re-read; token_type is then reported as "unknown".
+    Use this for cheap, frequent polling.
+    """
     try:
-        if TokenUtils:
-            env_files = TokenUtils._find_env_files()
-            env_vars = TokenUtils._load_env_variables()
-            
-            token_sources = []
-            for env_var in ["GITHUB_TOKEN", "GH_TOKEN"]:
-                if os.environ.get(env_var):
-                    token_sources.append(f"{env_var} (system)")
-                if env_vars.get(env_var):
-                    token_sources.append(f"{env_var} (.env)")
-            
-            token = TokenUtils.get_github_token()
-            token_info = (
-                TokenUtils.get_token_info(token) if token else {"status": "none"}
-            )
-            
-            return {
-                "env_files_found": len(env_files),
-                "env_file_paths": env_files,
-                "token_sources": token_sources,
-                "token_status": token_info.get("status", "unknown"),
-                "token_type": token_info.get("type", "unknown") if token else "none",
-            }
+        from .utils import TokenUtils
+
+        get_token = TokenUtils.get_github_token
+        get_info = TokenUtils.get_token_info
+
+        env_files, _, system_sources, dotenv_sources = _collect_token_state()
+        
+        token_sources = []
+        for env_var in _TOKEN_ENV_VARS:
+            system_label, dotenv_label = _SOURCE_LABELS[env_var]
+            if env_var in system_sources:
+                token_sources.append(system_label)
+            if env_var in dotenv_sources:
+                token_sources.append(dotenv_label)
+        
+        token = get_token()
+        if token and not include_token_info:
+            token_status, token_type = "provided", "unknown"
+        elif token:
+            token_info = get_info(token)
+            token_status = token_info.get("status", "unknown")
+            token_type = token_info.get("type", "unknown")
         else:
-            return {
-                "env_files_found": 0,
-                "env_file_paths": [],
-                "token_sources": [],
-                "token_status": "utils_unavailable",
-                "token_type": "none",
-            }
-    except Exception as e:
-        return {
-            "env_files_found": 0,
-            "env_file_paths": [],
-            "token_sources": [],
-            "token_status": "error",
-            "token_type": "none",
-            "error": str(e),
-        }
+            token_status = token_type = "none"
+        
+        return EnvFileStatus(
+            len(env_files), env_files, tuple(token_sources), token_status, token_type
+        )
+    except (OSError, ValueError) as e:
+        _log_env_error("check_env_status", e)
+        return _ENV_CHECK_ERROR._replace(error=str(e))
+
 
+def check_env_file(*, include_token_info: bool = True) -> dict[str, Any]:
+    """Check .env file status and token availability (dict form)"""
+    return check_env_status(include_token_info=include_token_info).as_dict()
 
-def get_token_sources() -> Dict[str, Any]:
+
+def get_token_sources() -> dict[str, Any]:
     """Get available token sources"""
     try:
-        if not TokenUtils:
-            return {"sources": [], "error": "TokenUtils not available"}
-        
-        sources = []
-        
+        env_files, _, system_sources, dotenv_sources = _collect_token_state()
+
         # Check system environment variables
-        for env_var in ["GITHUB_TOKEN", "GH_TOKEN"]:
-            if os.environ.get(env_var):
-                sources.append({
-                    "type": "system_environment",
-                    "variable": env_var,
-                    "available": True,
-                })
+        sources = [
+            {
+                "type": "system_environment",
+                "variable": env_var,
+                "available": True,
+            }
+            for env_var in system_sources
+        ]
         
         # Check .env files
-        env_files = TokenUtils._find_env_files()
-        env_vars = TokenUtils._load_env_variables()
-        
-        for env_var in ["GITHUB_TOKEN", "GH_TOKEN"]:
-            if env_vars.get(env_var):
-                sources.append({
-                    "type": "env_file",
-                    "variable": env_var,
-                    "available": True,
-                    "file_count": len(env_files),
-                })
+        sources.extend(
+            {
+                "type": "env_file",
+                "variable": env_var,
+                "available": True,
+                "file_count": len(env_files),
+            }
+            for env_var in dotenv_sources
+        )
         
         return {"sources": sources}
-    except Exception as e:
+    except (OSError, ValueError) as e:
+        _log_env_error("get_token_sources", e)
         return {"sources": [], "error": str(e)}
 
 
-def print_banner():
+async def check_env_file_async(*, include_token_info: bool = True) -> dict[str, Any]:
+    """Run check_env_file() in a worker thread so .env I/O does not block the event loop"""
+    import asyncio
+
+    return await asyncio.to_thread(check_env_file, include_token_info=include_token_info)
+
+
+async def get_token_sources_async() -> dict[str, Any]:
+    """Run get_token_sources() in a worker thread so .env I/O does not block the event loop"""
+    import asyncio
+
+    return await asyncio.to_thread(get_token_sources)
+
+
+def print_banner() -> None:
     """Print package banner"""
-    banner = f"""
-╭─────────────────────────────────────────────────────────────────╮
-│ 🚀 py-github-analyzer v{__version__}                               │
-│                                                                 │
-│ High-performance async GitHub repository analyzer               │
-│ with AI-optimized code extraction and smart .env support       │
-│                                                                 │
-│ Author: {__author__}                                    │
-│ Email: {__email__}                         │
-╰─────────────────────────────────────────────────────────────────╯
-"""
-    print(banner)
+    sys.stdout.write(_BANNER)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 # py_github_analyzer/analysis/api_strategy.py
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..async_github_client import AsyncGitHubClient
 from ..logger import AnalyzerLogger
@@ -12,23 +12,39 @@ class ApiAnalysisStrategy(AnalysisStrategy):
         self._logger = logger
 
     async def execute(self, owner: str, repo: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        files, repo_info, _ = await self.fetch(owner, repo)
+        return files, repo_info
+
+    async def fetch(
+        self, owner: str, repo: str
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], int]:
+        """Same as execute, plus the number of listed files whose download failed"""
         repo_info = await self._client.get_repository_info(owner, repo)
         contents = await self._client.get_repository_contents(owner, repo, recursive=True)
 
         file_paths = [item["path"] for item in contents if item["type"] == "file"]
-        batch_results = await self._client.batch_download_files(owner, repo, file_paths, safe_mode=False)
-
-        files = [
-            {
-                "path": file_path,
-                "content": file_data.get("content", ""),
-                "size": file_data.get("size", 0),
-                "type": "file",
-                "sha": file_data.get("sha", ""),
-            }
-            for file_path, file_data in batch_results.items()
-            if file_data
-        ]
+
+        # Each download becomes a file entry as it arrives, so the raw API results are
+        # released right away; slots keep the listing order regardless of finish order
+        slots: List[Optional[Dict[str, Any]]] = [None] * len(file_paths)
+        positions = {file_path: index for index, file_path in enumerate(file_paths)}
+        async for file_path, file_data in self._client.stream_download_files(
+            owner, repo, file_paths, safe_mode=False
+        ):
+            if file_data:
+                slots[positions[file_path]] = {
+                    "path": file_path,
+                    "content": file_data.get("content", ""),
+                    "size": file_data.get("size", 0),
+                    "type": "file",
+                    "sha": file_data.get("sha", ""),
+                }
+
+        files = [file_info for file_info in slots if file_info is not None]
+
+        failed = len(file_paths) - len(files)
+        if failed:
+            self._logger.warning(f"API analysis could not download {failed} of {len(file_paths)} files")
 
         self._logger.debug(f"API analysis extracted {len(files)} files")
-        return files, repo_info or {}
+        return files, repo_info or {}, failed
@@ -41,10 +41,13 @@ class FallbackAnalysisStrategy(AnalysisStrategy):
         original_error_info: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         try:
-            description = repo_info.get("description") if isinstance(repo_info, dict) else None
-            language = str(repo_info["language"]) if isinstance(repo_info, dict) and repo_info.get("language") else "Unknown"
+            # Checked once here so every field below can use plain .get()
+            if not isinstance(repo_info, dict):
+                repo_info = {}
+            description = repo_info.get("description")
+            language = str(repo_info["language"]) if repo_info.get("language") else "Unknown"
             try:
-                size = int(repo_info.get("size", 0)) if isinstance(repo_info, dict) else 0
+                size = int(repo_info.get("size", 0))
             except (ValueError, TypeError):
                 size = 0
 
@@ -55,10 +58,10 @@ class FallbackAnalysisStrategy(AnalysisStrategy):
                 "description": description,
                 "lang": [language] if language != "Unknown" else ["Unknown"],
                 "size": size,
-                "created": repo_info.get("created_at") if isinstance(repo_info, dict) else None,
-                "updated": repo_info.get("updated_at") if isinstance(repo_info, dict) else None,
-                "stars": repo_info.get("stargazers_count", 0) if isinstance(repo_info, dict) else 0,
-                "forks": repo_info.get("forks_count", 0) if isinstance(repo_info, dict) else 0,
+                "created": repo_info.get("created_at"),
+                "updated": repo_info.get("updated_at"),
+                "stars": repo_info.get("stargazers_count", 0),
+                "forks": repo_info.get("forks_count", 0),
                 "fallback_mode": True,
                 "analysis_mode": "basic_metadata_only",
                 "files": 0,
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Tuple
 from ..async_github_client import AsyncGitHubClient
 from ..exceptions import NetworkError
 from ..logger import AnalyzerLogger
+from ..processing import FileProcessor
 from .strategy import AnalysisStrategy
 
 
@@ -13,14 +14,13 @@ class ZipAnalysisStrategy(AnalysisStrategy):
         self._logger = logger
 
     async def execute(self, owner: str, repo: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-        zip_data = await self._client.download_zip_archive(owner, repo)
-        if not zip_data:
-            raise NetworkError("ZIP download failed - no data received")
-
-        files = [
-            {"path": file_path, "content": file_content, "size": len(file_content), "type": "file"}
-            for file_path, file_content in zip_data.items()
-        ]
+        # tar.gz is read in one forward pass; ZIP needs its trailing central directory first.
+        # Members FileProcessor would drop by path or size are skipped before being read
+        files = await self._client.download_tarball_files(
+            owner, repo, include=FileProcessor.should_include
+        )
+        if not files:
+            raise NetworkError("Archive download failed - no data received")
 
         repo_info = {
             "name": repo,
@@ -29,5 +29,5 @@ class ZipAnalysisStrategy(AnalysisStrategy):
             "default_branch": "main",
         }
 
-        self._logger.debug(f"ZIP analysis extracted {len(files)} files")
+        self._logger.debug(f"Archive analysis extracted {len(files)} files")
         return files, repo_info
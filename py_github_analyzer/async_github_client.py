@@ -5,10 +5,30 @@ High-performance asynchronous GitHub API interaction with optimized access flow
 """
 
 import asyncio
+import hashlib
+import importlib.util
+import inspect
+import os
+import random
+import tempfile
 import time
-import zipfile
-from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple, Union
+from collections import OrderedDict, deque
+from functools import lru_cache, wraps
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import quote
 
 try:
@@ -17,9 +37,24 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
+try:
+    # Drop-in replacement for the stdlib module with SIMD-accelerated decoding
+    import pybase64 as base64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    import base64
+    PYBASE64_AVAILABLE = False
+
+# httpx only needs the h2 package present to negotiate HTTP/2
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+from ._json import ORJSON_AVAILABLE, orjson
+from ._json import dumps as _json_dumps
+from ._json import loads as _json_loads
 from .config import Config
 from .exceptions import (
     AuthenticationError,
+    GitHubAnalyzerError,
     NetworkError,
     PrivateRepositoryError,
     RateLimitExceededError,
@@ -33,36 +68,323 @@ from .exceptions import (
     handle_github_api_error,
 )
 from .logger import AnalyzerLogger
-from .utils import URLParser, ValidationUtils
+from .utils import FileUtils, URLParser, ValidationUtils
+
+
+# Waits before each retry of a file download; only transient failures are retried
+_RETRY_BACKOFF = (0.5, 1.0)
+_RETRIABLE_ERRORS = (NetworkError, AnalyzerTimeoutError)
+
+# Archives are streamed in 1 MiB chunks and spill to disk above 16 MiB
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+_ZIP_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# Token performance profiles, shared read-only by every session
+_PROFILE_LIMITED = MappingProxyType({'zip_threshold': 5, 'performance': 'limited'})
+_PROFILE_MODERATE = MappingProxyType({'zip_threshold': 15, 'performance': 'moderate'})
+_PROFILE_FAST = MappingProxyType({'zip_threshold': 15, 'performance': 'fast'})
+_PROFILE_UNKNOWN = MappingProxyType({'zip_threshold': 5, 'performance': 'unknown'})
+
+# Conditional-GET cache entries kept per client
+_ETAG_CACHE_SIZE = 256
+
+# Longest a request waits for rate limit room before giving up
+_MAX_RATE_LIMIT_WAIT = 300
+
+# Extensions skipped before decompression in ZIP extraction
+_BINARY_EXTENSIONS = frozenset(Config.BINARY_EXTENSIONS)
+
+# Gateway/server failures that are usually gone on a retry
+_RETRYABLE_SERVER_ERRORS = frozenset({500, 502, 503, 504})
+
+# Seconds a /rate_limit result is reused (shorter once the core quota is exhausted)
+_RATE_STATUS_TTL = 5.0
+_RATE_STATUS_EXHAUSTED_TTL = 1.0
+# Core quota seen in response headers is trusted for this many seconds
+_RATE_HEADER_MAX_AGE = 10.0
+
+# GraphQL selection for the caller's GraphQL quota (separate from the REST quota)
+RATE_LIMIT_FRAGMENT = "rateLimit { limit remaining resetAt }"
+
+_RATE_LIMIT_AND_REPO_QUERY = f"""
+query($owner: String!, $name: String!) {{
+  {RATE_LIMIT_FRAGMENT}
+  repository(owner: $owner, name: $name) {{
+    name
+    nameWithOwner
+    description
+    primaryLanguage {{ name }}
+    diskUsage
+    defaultBranchRef {{ name }}
+    isPrivate
+    isArchived
+    isDisabled
+    repositoryTopics(first: 20) {{ nodes {{ topic {{ name }} }} }}
+    licenseInfo {{ name }}
+    createdAt
+    updatedAt
+    url
+  }}
+}}
+"""
+
+# JSON bodies above this size are parsed off the event loop
+_JSON_OFFLOAD_SIZE = 256 * 1024
+
+# Git Trees API entry types mapped to the Contents API names
+_TREE_ENTRY_TYPES = {"blob": "file", "tree": "dir", "commit": "submodule"}
+
+
+def _is_extractable(file_path: str, size: int) -> bool:
+    """Default archive member filter: skip oversized files and known binary extensions"""
+    return (
+        size <= Config.MAX_FILE_SIZE
+        and os.path.splitext(file_path)[1].lower() not in _BINARY_EXTENSIONS
+    )
+
+
+def _response_json(response: "httpx.Response") -> Any:
+    """Parse a JSON response body, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        # orjson parses the raw body; anything that is not bytes goes through httpx
+        content = response.content
+        if isinstance(content, (bytes, bytearray)):
+            return orjson.loads(content)
+    return response.json()
+
+
+async def _response_json_async(response: "httpx.Response") -> Any:
+    """Like _response_json, but parses large bodies (recursive trees, file contents) in a worker thread"""
+    content = response.content
+    if isinstance(content, (bytes, bytearray)) and len(content) > _JSON_OFFLOAD_SIZE:
+        return await asyncio.to_thread(_response_json, response)
+    return _response_json(response)
+
+
+def _rate_state_path() -> Path:
+    """Where rate limit state is kept between runs (XDG cache directory)"""
+    return FileUtils.user_cache_dir() / "rate.json"
+
+
+def _rate_state_key(token: Optional[str]) -> str:
+    """Per-token key for the persisted state; the token itself is never written"""
+    if not token:
+        return "anonymous"
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+def _decode_text(raw: bytes) -> Tuple[str, str]:
+    """Decode file bytes into (text, encoding), trying UTF-8 first"""
+    try:
+        return raw.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        # latin-1 maps every byte, so non-UTF-8 files always decode
+        return raw.decode("latin-1"), "latin-1"
+
+
+def _decode_b64_text(content: str) -> Optional[Tuple[str, str]]:
+    """Decode base64 file content once into (text, encoding); None if it is not valid base64"""
+    try:
+        raw = base64.b64decode(content)
+    except ValueError:
+        return None
+    return _decode_text(raw)
+
+
+@lru_cache(maxsize=1024)
+def _repo_api_url(owner: str, repo: str) -> str:
+    """REST base URL for a repository, built once per owner/repo"""
+    return URLParser.build_api_url(owner, repo)
+
+
+def _contents_url(owner: str, repo: str, path: str) -> str:
+    """Contents API URL for path, with the path percent-encoded"""
+    path = path.strip("/")
+    base = f"{_repo_api_url(owner, repo)}/contents"
+    return f"{base}/{quote(path)}" if path else base
+
+
+def _ref_params(branch: Optional[str]) -> Dict[str, str]:
+    """Query parameters selecting branch (or the default branch when None)"""
+    return {"ref": branch} if branch else {}
+
+
+# Repository payload fields copied by get_repository_info, with their defaults
+_REPO_INFO_FIELDS = (
+    ("description", ""),
+    ("language", "Unknown"),
+    ("size", 0),
+    ("default_branch", "main"),
+    ("private", False),
+    ("archived", False),
+    ("disabled", False),
+    ("created_at", None),
+    ("updated_at", None),
+    ("clone_url", None),
+    ("html_url", None),
+)
+
+
+def _fallback_repository_info(owner: str, repo: str) -> Dict[str, Any]:
+    """Minimal repository info returned when safe mode cannot fetch the real one"""
+    return {
+        "name": repo,
+        "full_name": f"{owner}/{repo}",
+        "description": "",
+        "language": "Unknown",
+        "size": 0,
+        "default_branch": "main",
+        "private": None,
+    }
+
+
+def _safe_mode_fallback(message: str, default: Callable[[Dict[str, Any]], Any]):
+    """
+    Make a client method return default(arguments) instead of raising when it was
+    called with safe_mode=True; message is formatted with the call's arguments
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception as e:
+                # Arguments are only resolved on the failure path
+                bound = signature.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                arguments = bound.arguments
+                if not arguments.get("safe_mode"):
+                    raise
+                self.logger.debug(f"Safe mode: {message.format(**arguments)}: {e}")
+                return default(arguments)
+
+        return wrapper
+
+    return decorator
+
+
+class _SlidingWindowLimiter:
+    """
+    Client-side cap on API calls over a rolling window (an hour by default)
+
+    Calls are counted in per-minute buckets, so recording a call is O(1) and
+    expiring old calls costs one step per elapsed bucket. When the window is
+    full, acquire() sleeps until the oldest bucket drops out, for at most
+    _MAX_RATE_LIMIT_WAIT seconds before raising RateLimitExceededError.
+    """
+
+    def __init__(
+        self,
+        max_calls: int,
+        buckets: int = 60,
+        bucket_seconds: float = 60,
+        logger: Optional[AnalyzerLogger] = None,
+    ):
+        self.max_calls = max_calls
+        self._bucket_seconds = bucket_seconds
+        self._buckets = deque([0] * buckets, maxlen=buckets)
+        self._current = int(time.time() // bucket_seconds)
+        self._total = 0
+        self._logger = logger
+
+    def _advance(self, now: float):
+        """Rotate out buckets that have left the window"""
+        current = int(now // self._bucket_seconds)
+        for _ in range(min(current - self._current, len(self._buckets))):
+            self._total -= self._buckets[0]
+            self._buckets.append(0)
+        self._current = max(current, self._current)
+
+    def _forget_before(self, reset_time: float):
+        """Drop buckets that ended before GitHub's quota reset; those calls no longer count"""
+        first_start = (self._current - len(self._buckets) + 1) * self._bucket_seconds
+        for index in range(len(self._buckets)):
+            if first_start + (index + 1) * self._bucket_seconds > reset_time:
+                break
+            self._total -= self._buckets[index]
+            self._buckets[index] = 0
+
+    async def acquire(self, reset_time: Optional[float] = None) -> int:
+        """
+        Wait for room in the window, then record one call
+        reset_time is GitHub's quota reset; once it has passed, calls made before it
+        are forgotten. Returns the bucket the call was recorded in, for release()
+        """
+        deadline = None
+        while True:
+            now = time.time()
+            self._advance(now)
+            if self._total >= self.max_calls and reset_time is not None and reset_time <= now:
+                self._forget_before(reset_time)
+            if self._total < self.max_calls:
+                self._buckets[-1] += 1
+                self._total += 1
+                return self._current
+            delay = self._bucket_seconds - now % self._bucket_seconds
+            if deadline is None:
+                deadline = now + _MAX_RATE_LIMIT_WAIT
+                if self._logger:
+                    self._logger.warning(
+                        f"Client-side rate limit of {self.max_calls} calls reached, throttling requests"
+                    )
+            if now + delay > deadline:
+                raise RateLimitExceededError(
+                    "Client-side rate limit window still full after waiting",
+                    reset_time=int(reset_time) if reset_time is not None else None,
+                    remaining=0,
+                )
+            await asyncio.sleep(delay)
+
+    def release(self, bucket: int):
+        """Take back a call recorded by acquire(), if its bucket is still in the window"""
+        self._advance(time.time())
+        index = len(self._buckets) - 1 - (self._current - bucket)
+        if 0 <= index < len(self._buckets) and self._buckets[index]:
+            self._buckets[index] -= 1
+            self._total -= 1
 
 
 class AsyncRateLimitManager:
-    """Async-safe GitHub API rate limit management with race condition protection"""
+    """Async GitHub API rate limit management without serializing API calls
+
+    All state updates happen between awaits on a single event loop, so they
+    are already atomic with respect to other coroutines and need no lock.
+    No lock is ever held across a network round-trip, which lets concurrent
+    requests (bounded by the client semaphore) actually run in parallel.
+    """
 
     def __init__(self, token: Optional[str] = None):
         self.token = token
         self.limit = 5000 if token else 60
         self.remaining = self.limit
         self.reset_time = int(time.time()) + 3600
-        self._lock = asyncio.Lock()
-        self._api_call_lock = asyncio.Lock()  # Lock to protect the entire API call process
+        # time.monotonic() of the last response that reported the core quota
+        self.updated_at: Optional[float] = None
 
     async def update_from_headers(self, headers: Dict[str, str]):
         """Update rate limit info from response headers"""
-        async with self._lock:
-            self.limit = int(headers.get("x-ratelimit-limit", self.limit))
-            self.remaining = int(headers.get("x-ratelimit-remaining", self.remaining))
-            self.reset_time = int(headers.get("x-ratelimit-reset", self.reset_time))
+        # Search and other resources have their own quota; only track core
+        if headers.get("x-ratelimit-resource", "core") != "core":
+            return
+
+        # Parse everything first so a malformed header leaves state untouched
+        limit = int(headers.get("x-ratelimit-limit", self.limit))
+        remaining = int(headers.get("x-ratelimit-remaining", self.remaining))
+        reset_time = int(headers.get("x-ratelimit-reset", self.reset_time))
+        self.limit, self.remaining, self.reset_time = limit, remaining, reset_time
+        if "x-ratelimit-remaining" in headers:
+            self.updated_at = time.monotonic()
 
     async def check_rate_limit(self, required_calls: int = 1) -> bool:
         """Check if we have enough API calls remaining"""
-        async with self._lock:
-            return self.remaining >= (required_calls + Config.RATE_LIMIT_BUFFER)
+        return self.remaining >= (required_calls + Config.RATE_LIMIT_BUFFER)
 
     async def consume_calls(self, count: int = 1):
         """Consume API calls from remaining count"""
-        async with self._lock:
-            self.remaining = max(0, self.remaining - count)
+        self.remaining = max(0, self.remaining - count)
 
     def wait_time_until_reset(self) -> int:
         """Calculate wait time until rate limit resets"""
@@ -72,35 +394,31 @@ class AsyncRateLimitManager:
         """Wait for rate limit to reset if necessary"""
         wait_time = self.wait_time_until_reset()
         if wait_time > 0 and self.remaining <= Config.RATE_LIMIT_BUFFER:
-            await asyncio.sleep(min(wait_time, 300))  # Max 5 minutes wait
+            await asyncio.sleep(min(wait_time, _MAX_RATE_LIMIT_WAIT))
 
     async def execute_api_call(self, api_call_func, required_calls: int = 1):
         """
-        Execute API call with atomic rate limit management
-        This prevents race conditions by making the entire check-call-update process atomic
+        Execute API call with rate limit checks
+        The check and the header update are each atomic; the call itself runs unlocked
         """
-        async with self._api_call_lock:
-            # Step 1: Check rate limit
+        # Step 1: Check rate limit
+        if not await self.check_rate_limit(required_calls):
+            await self.wait_for_rate_limit_reset()
+            # Re-check after waiting
             if not await self.check_rate_limit(required_calls):
-                await self.wait_for_rate_limit_reset()
-                # Re-check after waiting
-                if not await self.check_rate_limit(required_calls):
-                    raise RateLimitExceededError(
-                        "Rate limit still exceeded after waiting",
-                        reset_time=self.reset_time,
-                        remaining=self.remaining,
-                    )
+                raise RateLimitExceededError(
+                    "Rate limit still exceeded after waiting",
+                    reset_time=self.reset_time,
+                    remaining=self.remaining,
+                )
 
-            # Step 2: Execute API call
-            try:
-                response = await api_call_func()
-                # Step 3: Update rate limit info from response headers
-                await self.update_from_headers(dict(response.headers))
-                await self.consume_calls(required_calls)
-                return response
-            except Exception as e:
-                # If API call failed, don't consume rate limit calls
-                raise e
+        # Step 2: Execute API call (failed calls don't consume rate limit calls)
+        response = await api_call_func()
+
+        # Step 3: Update rate limit info from response headers
+        await self.update_from_headers(dict(response.headers))
+        await self.consume_calls(required_calls)
+        return response
 
     async def track_safe_api_call(self, response: "httpx.Response"):
         """
@@ -129,6 +447,7 @@ class AsyncGitHubSession:
 
         self.token = token
         self.timeout = timeout
+        self._profile = self._select_token_profile(token)
 
         # Setup HTTP headers for GitHub API with token optimization
         headers = {
@@ -145,9 +464,10 @@ class AsyncGitHubSession:
                 # Classic Token (ghp_*): Use token authentication (standard for classic tokens)
                 headers["Authorization"] = f"token {self.token}"
 
-        # Create httpx client with enhanced connection pooling
+        # Create httpx client with enhanced connection pooling; with HTTP/2 concurrent
+        # requests are multiplexed over a few connections instead of one socket each
         limits = httpx.Limits(
-            max_keepalive_connections=50, max_connections=200, keepalive_expiry=30
+            max_keepalive_connections=50, max_connections=100, keepalive_expiry=60
         )
         timeout_config = httpx.Timeout(timeout)
         self.client = httpx.AsyncClient(
@@ -155,40 +475,90 @@ class AsyncGitHubSession:
             timeout=timeout_config,
             limits=limits,
             follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
         )
 
-    def _get_token_performance_profile(self) -> Dict[str, Any]:
-        """Get token-specific performance profile for optimized processing"""
-        if not self.token:
-            return {'batch_size': 3, 'delay': 1.0, 'performance': 'limited'}
+    @staticmethod
+    def _select_token_profile(token: Optional[str]) -> Mapping[str, Any]:
+        """Pick the performance profile matching the token type"""
+        if not token:
+            return _PROFILE_LIMITED
         
-        if self.token.startswith('github_pat_'):
+        if token.startswith('github_pat_'):
             # Fine-grained Token: Moderate performance settings based on real analysis
-            return {'batch_size': 4, 'delay': 0.8, 'performance': 'moderate'}
-        elif self.token.startswith('ghp_'):
+            return _PROFILE_MODERATE
+        elif token.startswith('ghp_'):
             # Classic Token: Fast performance settings based on real analysis
-            return {'batch_size': 10, 'delay': 0.1, 'performance': 'fast'}
+            return _PROFILE_FAST
         else:
             # Unknown token format: Conservative defaults
-            return {'batch_size': 3, 'delay': 1.0, 'performance': 'unknown'}
+            return _PROFILE_UNKNOWN
+
+    def _get_token_performance_profile(self) -> Mapping[str, Any]:
+        """Get token-specific performance profile for optimized processing (read-only)"""
+        return self._profile
+
+    @staticmethod
+    def _rate_limit_wait_time(response: "httpx.Response") -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, None if not retryable"""
+        if response.status_code not in (403, 429):
+            return None
+
+        headers = response.headers
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                wait_time = float(retry_after)
+            except ValueError:
+                return None
+        elif headers.get("x-ratelimit-remaining") == "0":
+            try:
+                wait_time = float(headers.get("x-ratelimit-reset", "")) - time.time()
+            except ValueError:
+                return None
+        else:
+            return None
+
+        if wait_time > Config.RATE_LIMIT_MAX_BACKOFF:
+            return None
+        return max(wait_time, 0.0)
+
+    @classmethod
+    def _retry_wait_time(cls, response: "httpx.Response", attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retry number attempt (0-based), None if not retryable
+        GitHub's own rate limit headers win; a bare 429 or a 5xx backs off
+        exponentially (1s, 2s, 4s, ...) with up to a second of jitter
+        """
+        status = response.status_code
+        headers = response.headers
+        if status in (403, 429) and (
+            "retry-after" in headers or headers.get("x-ratelimit-remaining") == "0"
+        ):
+            return cls._rate_limit_wait_time(response)
+        if status == 429 or status in _RETRYABLE_SERVER_ERRORS:
+            return min(2 ** attempt + random.random(), Config.RATE_LIMIT_MAX_BACKOFF)
+        return None
 
     async def request(
         self, method: str, url: str, raise_on_error: bool = True, **kwargs
     ) -> httpx.Response:
         """Make async HTTP request with optional error handling"""
+        self._ensure_open()
         try:
             response = await self.client.request(method, url, **kwargs)
 
-            # Handle GitHub API errors only if requested
-            if raise_on_error and not response.is_success:
-                error_data = None
-                try:
-                    if response.content:
-                        error_data = response.json()
-                except:
-                    pass
-                error = handle_github_api_error(response.status_code, error_data, url)
-                raise error
+            # Back off on rate limits and transient server errors only
+            for attempt in range(Config.RATE_LIMIT_RETRIES):
+                wait_time = self._retry_wait_time(response, attempt)
+                if wait_time is None:
+                    break
+                await asyncio.sleep(wait_time)
+                response = await self.client.request(method, url, **kwargs)
+
+            # Handle GitHub API errors only if requested (304 answers a conditional GET)
+            if raise_on_error and not (response.is_success or response.status_code == 304):
+                self._raise_for_response(response, url)
 
             return response
 
@@ -201,12 +571,57 @@ class AsyncGitHubSession:
         except httpx.HTTPError as e:
             raise NetworkError(f"HTTP error: {e}")
 
+    @staticmethod
+    def _raise_for_response(response: "httpx.Response", url: str):
+        """Raise the analyzer exception matching a failed GitHub response"""
+        error_data = None
+        try:
+            if response.content:
+                error_data = _response_json(response)
+        except:
+            pass
+        raise handle_github_api_error(response.status_code, error_data, url, response.headers)
+
     async def get(
         self, url: str, raise_on_error: bool = True, **kwargs
     ) -> httpx.Response:
         """GET request wrapper"""
         return await self.request("GET", url, raise_on_error=raise_on_error, **kwargs)
 
+    async def download_to(
+        self, url: str, file_obj: BinaryIO, raise_on_error: bool = True, **kwargs
+    ) -> httpx.Response:
+        """Stream a GET response body into file_obj instead of buffering it in memory"""
+        self._ensure_open()
+        try:
+            async with self.client.stream("GET", url, **kwargs) as response:
+                if not response.is_success:
+                    if raise_on_error:
+                        await response.aread()
+                        self._raise_for_response(response, url)
+                    return response
+
+                async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    file_obj.write(chunk)
+
+            return response
+
+        except httpx.TimeoutException:
+            raise AnalyzerTimeoutError(
+                f"Request timeout after {self.timeout} seconds", self.timeout
+            )
+        except httpx.ConnectError as e:
+            raise NetworkError(f"Connection error: {e}")
+        except httpx.HTTPError as e:
+            raise NetworkError(f"HTTP error: {e}")
+
+    def _ensure_open(self):
+        """Reject requests on a closed session instead of silently reconnecting"""
+        if self.client.is_closed:
+            raise RuntimeError(
+                "GitHub session is closed; create a new client or use it inside 'async with'"
+            )
+
     async def close(self):
         """Close HTTP session"""
         await self.client.aclose()
@@ -222,20 +637,44 @@ class AsyncGitHubClient:
     """High-performance async GitHub client with optimized parallel processing"""
 
     def __init__(
-        self, token: Optional[str] = None, logger: Optional[AnalyzerLogger] = None
+        self,
+        token: Optional[str] = None,
+        logger: Optional[AnalyzerLogger] = None,
+        concurrency: Optional[int] = None,
+        persist_rate_limit: bool = False,
     ):
         self.token = token
         self.logger = logger or AnalyzerLogger()
         self.rate_limit_manager = AsyncRateLimitManager(token)
 
-        # Initialize session immediately in __init__
+        # Short-lived CLI runs start from the quota the previous run last saw
+        self._persist_rate_limit = persist_rate_limit
+        if persist_rate_limit:
+            self._load_rate_state()
+
+        # Proactive throttle so bursts stay under the hourly quota instead of hitting 403s
+        hourly_limit = Config.AUTHENTICATED_RATE_LIMIT if token else Config.DEFAULT_RATE_LIMIT
+        self._limiter = _SlidingWindowLimiter(
+            hourly_limit - Config.RATE_LIMIT_BUFFER, logger=self.logger
+        )
+
+        # One pooled session for the client's whole lifetime, so every request
+        # reuses kept-alive connections instead of paying a new TCP/TLS handshake
         self.session = AsyncGitHubSession(self.token)
 
-        # Enhanced concurrency limits based on token availability
-        max_concurrent = 100 if self.token else 20
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Cap on in-flight requests; GitHub's abuse detection flags large pile-ups
+        # even under the hourly quota, so unauthenticated callers may want 1-2
+        self._max_concurrent = concurrency or (100 if self.token else 20)
+        self._semaphore = asyncio.Semaphore(self._max_concurrent)
+
+        # (url, params, Accept) -> (etag, response), least recently used first
+        self._etag_cache: "OrderedDict[Tuple[str, Tuple, Optional[str]], Tuple[str, httpx.Response]]" = OrderedDict()
 
-    def _get_token_performance_profile(self) -> Dict[str, Any]:
+        # Last /rate_limit result and the time.monotonic() at which it goes stale
+        self._rate_status: Optional[Dict[str, Any]] = None
+        self._rate_status_expiry = 0.0
+
+    def _get_token_performance_profile(self) -> Mapping[str, Any]:
         """Get token-specific performance profile for batch operations"""
         return self.session._get_token_performance_profile()
 
@@ -244,75 +683,140 @@ class AsyncGitHubClient:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        await self.close()
 
-    async def get_repository_info(
-        self, owner: str, repo: str, safe_mode: bool = False
-    ) -> Dict[str, Any]:
-        """Get basic repository information with enhanced safe mode rate limit tracking"""
-        url = URLParser.build_api_url(owner, repo, "")
+    async def _do_request(
+        self, url: str, safe_mode: bool = False, cache: bool = True, **kwargs
+    ) -> "httpx.Response":
+        """
+        GET url through the rate limit manager, or in safe mode directly while still
+        tracking the call; failures raise either way so _safe_mode_fallback can handle them
+        Every call takes a slot from the client's sliding-window limiter and is
+        bounded by the client's concurrency semaphore
+
+        Responses carrying an ETag are cached and revalidated with If-None-Match;
+        a 304 reply reuses the cached response and does not count against the rate limit
+        The Accept header is part of the key since it changes the representation;
+        cache=False skips the cache for large bodies such as file contents
+        """
+        cache_key = (
+            url,
+            tuple(sorted(kwargs.get("params", {}).items())),
+            kwargs.get("headers", {}).get("Accept"),
+        )
+        cached = self._etag_cache.get(cache_key) if cache else None
+        if cached is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
 
-        try:
-            if safe_mode:
-                # Safe mode: faster but still track rate limit usage
-                response = await self.session.get(url, raise_on_error=False)
+        bucket = await self._limiter.acquire(self.rate_limit_manager.reset_time)
+        async with self._semaphore:
+            if not safe_mode:
+                response = await self.rate_limit_manager.execute_api_call(
+                    lambda: self.session.get(url, **kwargs)
+                )
+            else:
+                response = await self.session.get(url, raise_on_error=False, **kwargs)
                 # Track the API call even in safe mode to maintain accurate rate limit info
                 await self.rate_limit_manager.track_safe_api_call(response)
 
-                if not response.is_success:
-                    return {
-                        "name": repo,
-                        "full_name": f"{owner}/{repo}",
-                        "description": "",
-                        "language": "Unknown",
-                        "size": 0,
-                        "default_branch": "main",
-                        "private": None,
-                    }
-            else:
-                # Use atomic rate limit management for API calls
-                response = await self.rate_limit_manager.execute_api_call(
-                    lambda: self.session.get(url)
-                )
+        if cached is not None and response.status_code == 304:
+            self._limiter.release(bucket)
+            self._etag_cache.move_to_end(cache_key)
+            return cached[1]
+
+        if not response.is_success:
+            self.session._raise_for_response(response, url)
+
+        etag = response.headers.get("etag") if cache else None
+        if etag:
+            self._etag_cache[cache_key] = (etag, response)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return response
+
+    @_safe_mode_fallback(
+        "Failed to get repository info",
+        lambda args: _fallback_repository_info(args["owner"], args["repo"]),
+    )
+    async def get_repository_info(
+        self, owner: str, repo: str, safe_mode: bool = False
+    ) -> Dict[str, Any]:
+        """Get basic repository information with enhanced safe mode rate limit tracking"""
+        url = _repo_api_url(owner, repo)
+        response = await self._do_request(url, safe_mode)
+
+        repo_data = _response_json(response)
+        info = {"name": repo_data["name"], "full_name": repo_data["full_name"]}
+        info.update({key: repo_data.get(key, default) for key, default in _REPO_INFO_FIELDS})
+        info["topics"] = repo_data.get("topics", [])
+        info["license"] = (repo_data.get("license") or {}).get("name")
+        return info
+
+    @_safe_mode_fallback("Failed to resolve default branch of {owner}/{repo}", lambda args: None)
+    async def get_default_branch_sha(
+        self, owner: str, repo: str, safe_mode: bool = False
+    ) -> Optional[str]:
+        """
+        Commit SHA at the tip of the default branch
+        The sha media type returns just the 40-character SHA, and the ETag cache
+        turns repeat lookups into free 304 revalidations
+        """
+        url = f"{_repo_api_url(owner, repo)}/commits/HEAD"
+        response = await self._do_request(
+            url, safe_mode, headers={"Accept": "application/vnd.github.sha"}
+        )
+        return response.text.strip() or None
 
-            repo_data = response.json()
-            return {
-                "name": repo_data["name"],
-                "full_name": repo_data["full_name"],
-                "description": repo_data.get("description", ""),
-                "language": repo_data.get("language", "Unknown"),
-                "size": repo_data.get("size", 0),
-                "default_branch": repo_data.get("default_branch", "main"),
-                "private": repo_data.get("private", False),
-                "archived": repo_data.get("archived", False),
-                "disabled": repo_data.get("disabled", False),
-                "topics": repo_data.get("topics", []),
-                "license": (
-                    repo_data.get("license", {}).get("name")
-                    if repo_data.get("license")
+    @_safe_mode_fallback("Failed to get repository tree", lambda args: None)
+    async def get_repository_tree(
+        self, owner: str, repo: str, branch: str = None, safe_mode: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the full repository listing in one request via the Git Trees API
+        Returns None when the tree is truncated so callers can fall back to the Contents API
+        """
+        ref = branch or "HEAD"
+        url = f"{_repo_api_url(owner, repo)}/git/trees/{quote(ref, safe='')}"
+
+        response = await self._do_request(url, safe_mode, params={"recursive": "1"})
+
+        tree_data = await _response_json_async(response)
+        if tree_data.get("truncated"):
+            self.logger.debug(f"Git tree for {owner}/{repo} is truncated")
+            return None
+
+        html_base = f"https://github.com/{owner}/{repo}"
+        # Percent-encode like _download_raw_file so refs and paths with spaces or '#' stay valid
+        quoted_ref = quote(ref)
+        # Listings can run to tens of thousands of entries, so bind the per-item lookups once
+        entry_types = _TREE_ENTRY_TYPES
+        build_raw_url = URLParser.build_raw_url
+        contents = []
+        append = contents.append
+        for item in tree_data.get("tree", []):
+            item_path = item["path"]
+            quoted_path = quote(item_path)
+            item_type = entry_types.get(item["type"], item["type"])
+            is_file = item_type == "file"
+            append({
+                "name": item_path.rsplit("/", 1)[-1],
+                "path": item_path,
+                "type": item_type,
+                "size": item.get("size", 0),
+                "download_url": (
+                    build_raw_url(owner, repo, quoted_ref, quoted_path)
+                    if is_file
                     else None
                 ),
-                "created_at": repo_data.get("created_at"),
-                "updated_at": repo_data.get("updated_at"),
-                "clone_url": repo_data.get("clone_url"),
-                "html_url": repo_data.get("html_url"),
-            }
-        except Exception as e:
-            if safe_mode:
-                self.logger.debug(f"Safe mode: Failed to get repository info: {e}")
-                return {
-                    "name": repo,
-                    "full_name": f"{owner}/{repo}",
-                    "description": "",
-                    "language": "Unknown",
-                    "size": 0,
-                    "default_branch": "main",
-                    "private": None,
-                }
-            else:
-                raise
+                "git_url": item.get("url"),
+                "html_url": f"{html_base}/{'blob' if is_file else 'tree'}/{quoted_ref}/{quoted_path}",
+                "sha": item.get("sha"),
+            })
+
+        return contents
 
+    @_safe_mode_fallback("Failed to get contents", lambda args: [])
     async def get_repository_contents(
         self,
         owner: str,
@@ -323,102 +827,94 @@ class AsyncGitHubClient:
         safe_mode: bool = False,
     ) -> List[Dict[str, Any]]:
         """Get repository contents via GitHub Contents API with recursive support"""
-        async with self._semaphore:
-            all_contents = []
-
-            # Build initial API URL
-            url = URLParser.build_api_url(owner, repo, "contents")
-            if path:
-                url += f"/{path.strip('/')}"
-            if branch:
-                url += f"?ref={branch}"
-
+        if recursive and not path.strip("/"):
+            # A whole-repository listing is one Git Trees API call instead of one per directory
             try:
-                if safe_mode:
-                    response = await self.session.get(url, raise_on_error=False)
-                    await self.rate_limit_manager.track_safe_api_call(response)
-                    if not response.is_success:
-                        return []
-                else:
-                    response = await self.rate_limit_manager.execute_api_call(
-                        lambda: self.session.get(url)
-                    )
+                tree = await self.get_repository_tree(owner, repo, branch, safe_mode)
+            except Exception as e:
+                self.logger.debug(f"Git Trees API failed, falling back to Contents API: {e}")
+                tree = None
+            if tree is not None:
+                return tree
+
+        all_contents = await self._get_directory_listing(owner, repo, path, branch, safe_mode)
+        if not recursive:
+            return all_contents
+
+        # Walk subdirectories breadth-first, fetching each level's siblings concurrently
+        # (the semaphore inside _get_directory_listing bounds the fan-out)
+        pending = deque(item["path"] for item in all_contents if item["type"] == "dir")
+        while pending:
+            level = list(pending)
+            pending.clear()
+            listings = await asyncio.gather(
+                *(
+                    self._get_directory_listing(owner, repo, dir_path, branch, safe_mode)
+                    for dir_path in level
+                ),
+                return_exceptions=True,
+            )
 
-                contents = response.json()
-
-                # Handle single file response
-                if isinstance(contents, dict):
-                    contents = [contents]
-
-                for item in contents:
-                    all_contents.append({
-                        "name": item["name"],
-                        "path": item["path"],
-                        "type": item["type"],
-                        "size": item.get("size", 0),
-                        "download_url": item.get("download_url"),
-                        "git_url": item.get("git_url"),
-                        "html_url": item.get("html_url"),
-                        "sha": item.get("sha"),
-                    })
-
-                    # Recursively get subdirectory contents
-                    if recursive and item["type"] == "dir":
-                        try:
-                            subcontents = await self.get_repository_contents(
-                                owner, repo, item["path"], branch, recursive, safe_mode
-                            )
-                            all_contents.extend(subcontents)
-                        except Exception as e:
-                            self.logger.debug(f"Failed to get contents for {item['path']}: {e}")
-                            continue
+            for dir_path, listing in zip(level, listings):
+                if isinstance(listing, Exception):
+                    self.logger.debug(f"Failed to get contents for {dir_path}: {listing}")
+                    continue
 
-                return all_contents
+                all_contents.extend(listing)
+                pending.extend(item["path"] for item in listing if item["type"] == "dir")
 
-            except Exception as e:
-                if safe_mode:
-                    self.logger.debug(f"Safe mode: Failed to get contents: {e}")
-                    return []
-                else:
-                    raise
+        return all_contents
+
+    async def _get_directory_listing(
+        self, owner: str, repo: str, path: str, branch: str = None, safe_mode: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Fetch a single Contents API listing (one level, no recursion)"""
+        url = _contents_url(owner, repo, path)
+
+        response = await self._do_request(url, safe_mode, params=_ref_params(branch))
+
+        contents = await _response_json_async(response)
+
+        # Handle single file response
+        if isinstance(contents, dict):
+            contents = [contents]
+
+        return [
+            {
+                "name": item["name"],
+                "path": item["path"],
+                "type": item["type"],
+                "size": item.get("size", 0),
+                "download_url": item.get("download_url"),
+                "git_url": item.get("git_url"),
+                "html_url": item.get("html_url"),
+                "sha": item.get("sha"),
+            }
+            for item in contents
+        ]
 
+    @_safe_mode_fallback("Failed to get file content for {file_path}", lambda args: None)
     async def get_file_content(
         self, owner: str, repo: str, file_path: str, branch: str = None, safe_mode: bool = False
     ) -> Optional[Dict[str, Any]]:
         """Get individual file content with enhanced error handling"""
-        async with self._semaphore:
-            url = URLParser.build_api_url(owner, repo, f"contents/{file_path}")
-            if branch:
-                url += f"?ref={branch}"
+        url = _contents_url(owner, repo, file_path)
 
-            try:
-                if safe_mode:
-                    response = await self.session.get(url, raise_on_error=False)
-                    await self.rate_limit_manager.track_safe_api_call(response)
-                    if not response.is_success:
-                        return None
-                else:
-                    response = await self.rate_limit_manager.execute_api_call(
-                        lambda: self.session.get(url)
-                    )
-
-                file_data = response.json()
-                return {
-                    "name": file_data["name"],
-                    "path": file_data["path"],
-                    "content": file_data.get("content", ""),
-                    "encoding": file_data.get("encoding", "base64"),
-                    "size": file_data.get("size", 0),
-                    "sha": file_data.get("sha"),
-                    "download_url": file_data.get("download_url"),
-                }
+        # File bodies are fetched once per run, so keeping them in the ETag cache only costs memory
+        response = await self._do_request(
+            url, safe_mode, cache=False, params=_ref_params(branch)
+        )
 
-            except Exception as e:
-                if safe_mode:
-                    self.logger.debug(f"Safe mode: Failed to get file content for {file_path}: {e}")
-                    return None
-                else:
-                    raise
+        file_data = await _response_json_async(response)
+        return {
+            "name": file_data["name"],
+            "path": file_data["path"],
+            "content": file_data.get("content", ""),
+            "encoding": file_data.get("encoding", "base64"),
+            "size": file_data.get("size", 0),
+            "sha": file_data.get("sha"),
+            "download_url": file_data.get("download_url"),
+        }
 
     async def batch_download_files(
         self,
@@ -429,73 +925,167 @@ class AsyncGitHubClient:
         batch_size: int = None,
         safe_mode: bool = False,
     ) -> Dict[str, Optional[Dict[str, Any]]]:
-        """Download multiple files in parallel batches with token-optimized performance"""
+        """
+        Download multiple files concurrently with token-optimized performance;
+        results keep the caller's path order (see stream_download_files)
+        """
+        # Pre-seeded so results keep the caller's path order
+        results: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(file_paths)
+        async for file_path, file_data in self.stream_download_files(
+            owner, repo, file_paths, branch, batch_size, safe_mode, allow_archive=True
+        ):
+            results[file_path] = file_data
+        return results
+
+    async def stream_download_files(
+        self,
+        owner: str,
+        repo: str,
+        file_paths: List[str],
+        branch: str = None,
+        batch_size: int = None,
+        safe_mode: bool = False,
+        allow_archive: bool = False,
+    ) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Yield (path, file data or None) for every path as soon as it is downloaded
+        A fixed pool of workers (batch_size, or the client concurrency limit)
+        drains a shared queue in Config.get_file_priority order, so a slow file
+        never holds back the rest; rate limits are handled reactively by the session.
+        With allow_archive, batches above the token's zip threshold are served from
+        the repository ZIP first and only the files it lacks go through the workers;
+        API-only analysis leaves it off so it never downloads the archive
+        """
         if not file_paths:
-            return {}
+            return
 
-        # Get token-specific performance profile for optimized batch processing
         token_profile = self._get_token_performance_profile()
-        effective_batch_size = batch_size or token_profile['batch_size']
-        delay_between_batches = token_profile['delay']
-
-        results = {}
         start_time = time.time()
 
+        # Above the threshold one archive download beats one Contents API call per file
+        if allow_archive and len(file_paths) > token_profile['zip_threshold']:
+            archive_results = await self._download_files_from_zip(
+                owner, repo, file_paths, branch, safe_mode
+            )
+            if archive_results is not None:
+                missing = []
+                for file_path, file_data in archive_results.items():
+                    if file_data is None:
+                        # Dropped from the archive (binary, oversized, undecodable)
+                        missing.append(file_path)
+                    else:
+                        yield file_path, file_data
+                self.logger.info(
+                    f"Batch download via ZIP archive: {len(file_paths) - len(missing)}/"
+                    f"{len(file_paths)} files in {time.time() - start_time:.2f}s"
+                )
+                file_paths = missing
+                if not file_paths:
+                    return
+
         # Log performance optimization info for large batches
         if len(file_paths) > 20:
             self.logger.info(
-                f"Token-optimized batch download: {len(file_paths)} files, "
-                f"batch_size={effective_batch_size}, delay={delay_between_batches}s "
+                f"Token-optimized batch download: {len(file_paths)} files "
                 f"({token_profile['performance']} mode)"
             )
 
-        # Process files in optimized batches
-        for i in range(0, len(file_paths), effective_batch_size):
-            batch = file_paths[i:i + effective_batch_size]
-            
-            # Create download tasks for this batch
-            tasks = []
-            for file_path in batch:
-                task = asyncio.create_task(
-                    self._download_single_file_with_retry(
-                        owner, repo, file_path, branch, safe_mode
-                    )
-                )
-                tasks.append(task)
+        # Highest analysis priority first (README, manifests, entry points), so under
+        # rate pressure the files that matter most are fetched before the long tail;
+        # the index keeps the caller's order among equal priorities
+        queue: "asyncio.PriorityQueue[Tuple[int, int, str]]" = asyncio.PriorityQueue()
+        for index, file_path in enumerate(file_paths):
+            queue.put_nowait((-Config.get_file_priority(file_path), index, file_path))
 
-            # Execute batch concurrently
-            try:
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for file_path, result in zip(batch, batch_results):
-                    if isinstance(result, Exception):
-                        self.logger.debug(f"Failed to download {file_path}: {result}")
-                        results[file_path] = None
-                    else:
-                        results[file_path] = result
+        finished: "asyncio.Queue[Tuple[str, Optional[Dict[str, Any]]]]" = asyncio.Queue()
 
-            except Exception as e:
-                self.logger.debug(f"Batch download failed: {e}")
-                # Mark all files in failed batch as None
-                for file_path in batch:
-                    results[file_path] = None
+        async def worker() -> None:
+            while not queue.empty():
+                _, _, file_path = queue.get_nowait()
+                file_data = None
+                try:
+                    file_data = await self._download_single_file_with_retry(
+                        owner, repo, file_path, branch, safe_mode
+                    )
+                except Exception as e:
+                    self.logger.debug(f"Failed to download {file_path}: {e}")
+                finished.put_nowait((file_path, file_data))
 
-            # Token-specific delay between batches to optimize API usage
-            if i + effective_batch_size < len(file_paths) and delay_between_batches > 0:
-                await asyncio.sleep(delay_between_batches)
+        worker_count = min(batch_size or self._max_concurrent, len(file_paths))
+        workers = [asyncio.ensure_future(worker()) for _ in range(worker_count)]
+        successful_downloads = 0
+        try:
+            for _ in range(len(file_paths)):
+                file_path, file_data = await finished.get()
+                if file_data is not None:
+                    successful_downloads += 1
+                yield file_path, file_data
+        finally:
+            # A consumer that stops early must not leave downloads running
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
         # Performance summary
         elapsed_time = time.time() - start_time
-        successful_downloads = sum(1 for v in results.values() if v is not None)
-        
+
         if len(file_paths) > 10:
             self.logger.info(
                 f"Batch download completed: {successful_downloads}/{len(file_paths)} files "
                 f"in {elapsed_time:.2f}s ({token_profile['performance']} performance)"
             )
 
+    async def _download_files_from_zip(
+        self,
+        owner: str,
+        repo: str,
+        file_paths: List[str],
+        branch: str = None,
+        safe_mode: bool = False,
+    ) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+        """Serve a batch download from the repository ZIP archive, None if unavailable"""
+        try:
+            archive = await self.download_zip_archive(owner, repo, branch or "HEAD", safe_mode)
+        except Exception as e:
+            self.logger.debug(f"ZIP batch download failed, falling back to per-file API: {e}")
+            return None
+
+        if not archive:
+            return None
+
+        results = {}
+        for file_path in file_paths:
+            content = archive.get(file_path)
+            results[file_path] = None if content is None else {
+                "path": file_path,
+                "content": content,
+                "size": len(content),
+                "sha": None,
+                "encoding": "utf-8",
+            }
         return results
 
+    async def _download_raw_file(
+        self, owner: str, repo: str, file_path: str, branch: str = None
+    ) -> Optional[Dict[str, Any]]:
+        """Download a file from raw.githubusercontent.com, None if it is not served there"""
+        url = URLParser.build_raw_url(owner, repo, quote(branch or "HEAD"), quote(file_path))
+
+        async with self._semaphore:
+            response = await self.session.get(url, raise_on_error=False)
+
+        if not response.is_success:
+            return None
+
+        content, encoding = _decode_text(response.content)
+        return {
+            "path": file_path,
+            "content": content,
+            "size": len(content),
+            "sha": None,
+            "encoding": encoding,
+        }
+
     async def _download_single_file_with_retry(
         self,
         owner: str,
@@ -503,100 +1093,196 @@ class AsyncGitHubClient:
         file_path: str,
         branch: str = None,
         safe_mode: bool = False,
-        max_retries: int = 2
     ) -> Optional[Dict[str, Any]]:
-        """Download single file with exponential backoff retry"""
-        
-        for attempt in range(max_retries + 1):
+        """
+        Download single file, retrying only transient network failures with backoff
+        Any other error is permanent for this file and propagates to the caller
+        """
+        for wait_time in _RETRY_BACKOFF:
             try:
-                # Get file content using existing method
-                file_data = await self.get_file_content(owner, repo, file_path, branch, safe_mode)
-                
-                if file_data and file_data.get("content") and file_data.get("encoding") == "base64":
-                    # Decode base64 content
-                    import base64
-                    try:
-                        decoded_content = base64.b64decode(file_data["content"]).decode("utf-8")
-                        return {
-                            "path": file_path,
-                            "content": decoded_content,
-                            "size": len(decoded_content),
-                            "sha": file_data.get("sha"),
-                            "encoding": "utf-8",
-                        }
-                    except (UnicodeDecodeError, base64.binascii.Error):
-                        # Try latin-1 encoding for non-UTF-8 files
-                        try:
-                            decoded_content = base64.b64decode(file_data["content"]).decode("latin-1")
-                            return {
-                                "path": file_path,
-                                "content": decoded_content,
-                                "size": len(decoded_content),
-                                "sha": file_data.get("sha"),
-                                "encoding": "latin-1",
-                            }
-                        except:
-                            # Skip binary or unreadable files
-                            return None
-                elif file_data:
-                    # File exists but couldn't decode content
-                    return {
-                        "path": file_path,
-                        "content": "",
-                        "size": 0,
-                        "sha": file_data.get("sha"),
-                        "encoding": "unknown",
-                    }
-                else:
-                    return None
-                    
-            except Exception as e:
-                if attempt < max_retries:
-                    # Exponential backoff
-                    wait_time = (2 ** attempt) * 0.5
-                    await asyncio.sleep(wait_time)
-                    self.logger.debug(f"Retrying {file_path} (attempt {attempt + 2}): {e}")
-                else:
-                    self.logger.debug(f"Final failure for {file_path}: {e}")
-                    return None
-        
+                return await self._download_single_file(owner, repo, file_path, branch, safe_mode)
+            except _RETRIABLE_ERRORS as e:
+                self.logger.debug(f"Retrying {file_path} in {wait_time}s: {e}")
+                await asyncio.sleep(wait_time)
+
+        try:
+            return await self._download_single_file(owner, repo, file_path, branch, safe_mode)
+        except _RETRIABLE_ERRORS as e:
+            self.logger.debug(f"Final failure for {file_path}: {e}")
+            return None
+
+    async def _download_single_file(
+        self,
+        owner: str,
+        repo: str,
+        file_path: str,
+        branch: str = None,
+        safe_mode: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Download and decode one file; a single attempt with no retry"""
+        # Raw downloads skip JSON, base64 and the API quota; the Contents API is the fallback
+        raw_file = await self._download_raw_file(owner, repo, file_path, branch)
+        if raw_file is not None:
+            return raw_file
+
+        file_data = await self.get_file_content(owner, repo, file_path, branch, safe_mode)
+
+        if file_data and file_data.get("content") and file_data.get("encoding") == "base64":
+            decoded = _decode_b64_text(file_data["content"])
+            if decoded is None:
+                # Skip unreadable files
+                return None
+            decoded_content, encoding = decoded
+            return {
+                "path": file_path,
+                "content": decoded_content,
+                "size": len(decoded_content),
+                "sha": file_data.get("sha"),
+                "encoding": encoding,
+            }
+        elif file_data:
+            # File exists but couldn't decode content
+            return {
+                "path": file_path,
+                "content": "",
+                "size": 0,
+                "sha": file_data.get("sha"),
+                "encoding": "unknown",
+            }
         return None
 
+    @_safe_mode_fallback("ZIP download failed", lambda args: None)
     async def download_zip_archive(
         self, owner: str, repo: str, branch: str = "main", safe_mode: bool = False
     ) -> Optional[Dict[str, str]]:
         """Download repository as ZIP archive with enhanced error handling"""
-        zip_url = f"https://api.github.com/repos/{owner}/{repo}/zipball/{branch}"
+        # Spool the archive to a temp file so large repositories are not held in RAM twice
+        with tempfile.SpooledTemporaryFile(max_size=_ZIP_SPOOL_MAX_SIZE) as archive:
+            fetched = await self._fetch_archive(
+                owner, repo, "zipball", branch, safe_mode, archive
+            )
+            if not fetched:
+                return None
+            return self._extract_zip_files(archive)
+
+    @_safe_mode_fallback("Tarball download failed", lambda args: None)
+    async def download_tarball_files(
+        self,
+        owner: str,
+        repo: str,
+        branch: str = "main",
+        safe_mode: bool = False,
+        include: Optional[Callable[[str, int], bool]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Download repository as tar.gz and return file entries ready for processing
+        include(path, size) decides which members are read; by default binaries and
+        oversized files are skipped
+        """
+        with tempfile.SpooledTemporaryFile(max_size=_ZIP_SPOOL_MAX_SIZE) as archive:
+            fetched = await self._fetch_archive(
+                owner, repo, "tarball", branch, safe_mode, archive
+            )
+            if not fetched:
+                return None
+            return await asyncio.to_thread(
+                self._file_entries, self._iter_tar_files(archive, include)
+            )
+
+    async def _fetch_archive(
+        self,
+        owner: str,
+        repo: str,
+        archive_format: str,
+        branch: str,
+        safe_mode: bool,
+        archive: BinaryIO,
+    ) -> bool:
+        """Stream a zipball/tarball into archive and rewind it; False if GitHub refused it"""
+        archive_url = f"{_repo_api_url(owner, repo)}/{archive_format}/{quote(branch)}"
+
+        if safe_mode:
+            response = await self.session.download_to(archive_url, archive, raise_on_error=False)
+            await self.rate_limit_manager.track_safe_api_call(response)
+            if not response.is_success:
+                return False
+        else:
+            response = await self.rate_limit_manager.execute_api_call(
+                lambda: self.session.download_to(archive_url, archive)
+            )
+
+        if response.status_code != 200:
+            return False
+
+        archive.seek(0)
+        return True
+
+    def _extract_zip_files(self, zip_data: Union[bytes, BinaryIO]) -> Dict[str, str]:
+        """Extract files from ZIP archive (bytes or a seekable file) with enhanced encoding handling"""
+        return dict(self._iter_zip_files(zip_data))
+
+    @staticmethod
+    def _file_entries(members: Iterator[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Build file entries straight from archive members without an intermediate path dict"""
+        return [
+            {"path": file_path, "content": content, "size": len(content), "type": "file"}
+            for file_path, content in members
+        ]
+
+    def _iter_tar_files(
+        self, archive: BinaryIO, include: Optional[Callable[[str, int], bool]] = None
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield (path, text) for each extractable tarball member in a single forward pass"""
+        # Imported here so CLI startup and dry runs don't pay for the archive modules
+        import tarfile
+
+        include = include or _is_extractable
 
         try:
-            if safe_mode:
-                response = await self.session.get(zip_url, raise_on_error=False)
-                await self.rate_limit_manager.track_safe_api_call(response)
-                if not response.is_success:
-                    return None
-            else:
-                response = await self.rate_limit_manager.execute_api_call(
-                    lambda: self.session.get(zip_url)
-                )
+            # Stream mode never seeks, so members are read in archive order
+            with tarfile.open(fileobj=archive, mode="r|gz") as tar_file:
+                for member in tar_file:
+                    if not member.isfile():
+                        continue
 
-            if response.status_code != 200:
-                return None
+                    # Drop the "<owner>-<repo>-<sha>/" top-level directory
+                    file_path = member.name.partition("/")[2]
+                    if not file_path:
+                        continue
+
+                    # Members that would be filtered out anyway are never read
+                    if not include(file_path, member.size):
+                        continue
+
+                    try:
+                        file_obj = tar_file.extractfile(member)
+                        if file_obj is None:
+                            continue
+                        decoded_content, _ = _decode_text(file_obj.read())
+                    except Exception as e:
+                        self.logger.debug(f"Failed to extract {file_path}: {e}")
+                        continue
 
-            return self._extract_zip_files(response.content)
+                    yield file_path, decoded_content
 
+        except tarfile.TarError:
+            self.logger.error("Invalid tarball received")
         except Exception as e:
-            if safe_mode:
-                self.logger.debug(f"Safe mode: ZIP download failed: {e}")
-                return None
-            else:
-                raise
+            self.logger.error(f"Tarball extraction failed: {e}")
 
-    def _extract_zip_files(self, zip_data: bytes) -> Dict[str, str]:
-        """Extract files from ZIP archive with enhanced encoding handling"""
-        files = {}
+    def _iter_zip_files(self, zip_data: Union[bytes, BinaryIO]) -> Iterator[Tuple[str, str]]:
+        """Yield (path, text) for each extractable member, decompressing one at a time"""
+        import zipfile
+        from io import BytesIO
+
+        if isinstance(zip_data, (bytes, bytearray)):
+            zip_data = BytesIO(zip_data)
+
+        binary_extensions = _BINARY_EXTENSIONS
+        max_file_size = Config.MAX_FILE_SIZE
 
         try:
-            with zipfile.ZipFile(BytesIO(zip_data), "r") as zip_file:
+            with zipfile.ZipFile(zip_data, "r") as zip_file:
                 for file_info in zip_file.filelist:
                     if file_info.is_dir():
                         continue
@@ -608,6 +1294,13 @@ class AsyncGitHubClient:
                     if not file_path:
                         continue
 
+                    # Skip binaries and oversized files before decompressing them
+                    if (
+                        file_info.file_size > max_file_size
+                        or os.path.splitext(file_path)[1].lower() in binary_extensions
+                    ):
+                        continue
+
                     try:
                         file_content = zip_file.read(file_info.filename)
 
@@ -619,21 +1312,18 @@ class AsyncGitHubClient:
                             except:
                                 continue
 
-                        files[file_path] = decoded_content
-
                     except Exception as e:
                         self.logger.debug(f"Failed to extract {file_path}: {e}")
                         continue
 
+                    yield file_path, decoded_content
+
         except zipfile.BadZipFile:
             self.logger.error("Invalid ZIP file received")
-            return {}
         except Exception as e:
             self.logger.error(f"ZIP extraction failed: {e}")
-            return {}
-
-        return files
 
+    @_safe_mode_fallback("Repository search failed", lambda args: {"total_count": 0, "items": []})
     async def search_repositories(
         self,
         query: str,
@@ -653,45 +1343,29 @@ class AsyncGitHubClient:
             "page": page,
         }
 
-        try:
-            if safe_mode:
-                response = await self.session.get(url, params=params, raise_on_error=False)
-                await self.rate_limit_manager.track_safe_api_call(response)
-                if not response.is_success:
-                    return {"total_count": 0, "items": []}
-            else:
-                response = await self.rate_limit_manager.execute_api_call(
-                    lambda: self.session.get(url, params=params)
-                )
-
-            search_results = response.json()
+        response = await self._do_request(url, safe_mode, params=params)
+        search_results = await _response_json_async(response)
 
-            return {
-                "total_count": search_results.get("total_count", 0),
-                "items": [
-                    {
-                        "name": repo["name"],
-                        "full_name": repo["full_name"],
-                        "description": repo.get("description", ""),
-                        "language": repo.get("language"),
-                        "stargazers_count": repo.get("stargazers_count", 0),
-                        "forks_count": repo.get("forks_count", 0),
-                        "updated_at": repo.get("updated_at"),
-                        "html_url": repo.get("html_url"),
-                        "clone_url": repo.get("clone_url"),
-                        "default_branch": repo.get("default_branch", "main"),
-                    }
-                    for repo in search_results.get("items", [])
-                ],
-            }
-
-        except Exception as e:
-            if safe_mode:
-                self.logger.debug(f"Safe mode: Repository search failed: {e}")
-                return {"total_count": 0, "items": []}
-            else:
-                raise
+        return {
+            "total_count": search_results.get("total_count", 0),
+            "items": [
+                {
+                    "name": repo["name"],
+                    "full_name": repo["full_name"],
+                    "description": repo.get("description", ""),
+                    "language": repo.get("language"),
+                    "stargazers_count": repo.get("stargazers_count", 0),
+                    "forks_count": repo.get("forks_count", 0),
+                    "updated_at": repo.get("updated_at"),
+                    "html_url": repo.get("html_url"),
+                    "clone_url": repo.get("clone_url"),
+                    "default_branch": repo.get("default_branch", "main"),
+                }
+                for repo in search_results.get("items", [])
+            ],
+        }
 
+    @_safe_mode_fallback("Failed to get user repositories", lambda args: [])
     async def get_user_repositories(
         self,
         username: str,
@@ -712,75 +1386,194 @@ class AsyncGitHubClient:
             "page": page,
         }
 
-        try:
-            if safe_mode:
-                response = await self.session.get(url, params=params, raise_on_error=False)
-                await self.rate_limit_manager.track_safe_api_call(response)
-                if not response.is_success:
-                    return []
-            else:
-                response = await self.rate_limit_manager.execute_api_call(
-                    lambda: self.session.get(url, params=params)
-                )
-
-            repositories = response.json()
-
-            return [
-                {
-                    "name": repo["name"],
-                    "full_name": repo["full_name"],
-                    "description": repo.get("description", ""),
-                    "language": repo.get("language"),
-                    "size": repo.get("size", 0),
-                    "stargazers_count": repo.get("stargazers_count", 0),
-                    "forks_count": repo.get("forks_count", 0),
-                    "created_at": repo.get("created_at"),
-                    "updated_at": repo.get("updated_at"),
-                    "html_url": repo.get("html_url"),
-                    "clone_url": repo.get("clone_url"),
-                    "default_branch": repo.get("default_branch", "main"),
-                    "private": repo.get("private", False),
-                    "archived": repo.get("archived", False),
-                }
-                for repo in repositories
-                if isinstance(repo, dict)
-            ]
-
-        except Exception as e:
-            if safe_mode:
-                self.logger.debug(f"Safe mode: Failed to get user repositories: {e}")
-                return []
-            else:
-                raise
+        response = await self._do_request(url, safe_mode, params=params)
+        repositories = await _response_json_async(response)
+
+        return [
+            {
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "description": repo.get("description", ""),
+                "language": repo.get("language"),
+                "size": repo.get("size", 0),
+                "stargazers_count": repo.get("stargazers_count", 0),
+                "forks_count": repo.get("forks_count", 0),
+                "created_at": repo.get("created_at"),
+                "updated_at": repo.get("updated_at"),
+                "html_url": repo.get("html_url"),
+                "clone_url": repo.get("clone_url"),
+                "default_branch": repo.get("default_branch", "main"),
+                "private": repo.get("private", False),
+                "archived": repo.get("archived", False),
+            }
+            for repo in repositories
+        ]
 
     async def get_rate_limit_status(self) -> Dict[str, Any]:
-        """Get current rate limit status"""
+        """Get current rate limit status (successful results are cached for a few seconds)"""
+        now = time.monotonic()
+        if now < self._rate_status_expiry:
+            return self._rate_status
+
+        # Recent API responses already reported the core quota in their headers;
+        # only the search quota has to come from the last full /rate_limit result
+        manager = self.rate_limit_manager
+        if (
+            self._rate_status is not None
+            and manager.updated_at is not None
+            and now - manager.updated_at < _RATE_HEADER_MAX_AGE
+        ):
+            core = {
+                "limit": manager.limit,
+                "remaining": manager.remaining,
+                "reset": manager.reset_time,
+            }
+            return {**self._rate_status, "core": core, "rate": core}
+
         url = "https://api.github.com/rate_limit"
 
         try:
-            response = await self.session.get(url, raise_on_error=False)
+            async with self._semaphore:
+                response = await self.session.get(url, raise_on_error=False)
             if response.is_success:
-                rate_data = response.json()
-                return {
+                rate_data = _response_json(response)
+                resources = rate_data["resources"]
+                core = resources["core"]
+                search = resources["search"]
+                status = {
                     "core": {
-                        "limit": rate_data["resources"]["core"]["limit"],
-                        "remaining": rate_data["resources"]["core"]["remaining"],
-                        "reset": rate_data["resources"]["core"]["reset"],
+                        "limit": core["limit"],
+                        "remaining": core["remaining"],
+                        "reset": core["reset"],
                     },
                     "search": {
-                        "limit": rate_data["resources"]["search"]["limit"],
-                        "remaining": rate_data["resources"]["search"]["remaining"],
-                        "reset": rate_data["resources"]["search"]["reset"],
+                        "limit": search["limit"],
+                        "remaining": search["remaining"],
+                        "reset": search["reset"],
                     },
                     "rate": rate_data.get("rate", {}),
                 }
+
+                # Recheck sooner once exhausted, and never serve a count past its reset
+                ttl = _RATE_STATUS_EXHAUSTED_TTL if core["remaining"] == 0 else _RATE_STATUS_TTL
+                until_reset = core["reset"] - time.time()
+                self._rate_status = status
+                self._rate_status_expiry = now + max(0.0, min(ttl, until_reset))
+                return status
             else:
                 return {"error": "Unable to fetch rate limit status"}
 
         except Exception as e:
             return {"error": f"Rate limit check failed: {e}"}
 
+    async def graphql(
+        self, query: str, variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        POST a GraphQL query over the pooled session and return its data
+        GraphQL reports failures in an errors list with HTTP 200, so those are raised here
+        """
+        payload = {"query": query, "variables": variables or {}}
+        async with self._semaphore:
+            response = await self.session.request(
+                "POST", Config.GITHUB_GRAPHQL_URL, json=payload
+            )
+
+        result = _response_json(response)
+        errors = result.get("errors")
+        if errors:
+            message = "; ".join(error.get("message", "unknown error") for error in errors)
+            if any(error.get("type") == "NOT_FOUND" for error in errors):
+                raise RepositoryNotFoundError(message)
+            raise GitHubAnalyzerError("GitHub GraphQL query failed", message)
+        return result["data"]
+
+    async def get_rate_limit_and_repo(self, owner: str, repo: str) -> Dict[str, Any]:
+        """
+        Fetch repository info and the GraphQL rate limit in a single request
+        Repository info has the get_repository_info shape; GraphQL needs a token
+        """
+        data = await self.graphql(
+            _RATE_LIMIT_AND_REPO_QUERY, {"owner": owner, "name": repo}
+        )
+        repo_data = data["repository"]
+        return {
+            "rate_limit": data["rateLimit"],
+            "repository": {
+                "name": repo_data["name"],
+                "full_name": repo_data["nameWithOwner"],
+                "description": repo_data.get("description") or "",
+                "language": (repo_data.get("primaryLanguage") or {}).get("name", "Unknown"),
+                "size": repo_data.get("diskUsage") or 0,
+                "default_branch": (repo_data.get("defaultBranchRef") or {}).get("name", "main"),
+                "private": repo_data.get("isPrivate", False),
+                "archived": repo_data.get("isArchived", False),
+                "disabled": repo_data.get("isDisabled", False),
+                "created_at": repo_data.get("createdAt"),
+                "updated_at": repo_data.get("updatedAt"),
+                "clone_url": f"{repo_data['url']}.git",
+                "html_url": repo_data["url"],
+                "topics": [
+                    node["topic"]["name"]
+                    for node in (repo_data.get("repositoryTopics") or {}).get("nodes", [])
+                ],
+                "license": (repo_data.get("licenseInfo") or {}).get("name"),
+            },
+        }
+
+    def _load_rate_state(self):
+        """Seed the rate limit manager from the last run's saved state if its window is still open"""
+        try:
+            state = _json_loads(_rate_state_path().read_bytes())[_rate_state_key(self.token)]
+            limit = int(state["limit"])
+            remaining = int(state["remaining"])
+            reset_time = int(state["reset"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        if reset_time > time.time():
+            manager = self.rate_limit_manager
+            manager.limit, manager.remaining, manager.reset_time = limit, remaining, reset_time
+
+    def _save_rate_state(self):
+        """
+        Save the last observed quota for the next run
+        Written to a temp file and swapped in with os.replace, so parallel runs never
+        see a partial file; the last writer wins, which is the freshest state anyway
+        """
+        manager = self.rate_limit_manager
+        if manager.updated_at is None:
+            return  # No response this run reported the quota
+
+        path = _rate_state_path()
+        try:
+            try:
+                states = _json_loads(path.read_bytes())
+                if not isinstance(states, dict):
+                    states = {}
+            except (OSError, ValueError):
+                states = {}
+            states[_rate_state_key(self.token)] = {
+                "limit": manager.limit,
+                "remaining": manager.remaining,
+                "reset": manager.reset_time,
+            }
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = tempfile.NamedTemporaryFile(dir=path.parent, delete=False)
+            try:
+                with tmp:
+                    tmp.write(_json_dumps(states))
+                os.replace(tmp.name, path)
+            except BaseException:
+                os.unlink(tmp.name)  # Don't leave the partial file in the cache directory
+                raise
+        except OSError as e:
+            self.logger.debug(f"Could not save rate limit state: {e}")
+
     async def close(self):
         """Close client and cleanup resources"""
+        if self._persist_rate_limit:
+            self._save_rate_state()
         if self.session:
             await self.session.close()
@@ -126,6 +126,12 @@ def create_argument_parser():
         help='Disable fallback mode on errors',
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-analyze even if the repository is unchanged since the last run',
+    )
+
     parser.add_argument(
         '--check-env',
         action='store_true',
@@ -429,6 +435,8 @@ async def async_main():
                 verbose=args.verbose,
                 dry_run=args.dry_run,
                 fallback=not args.no_fallback,
+                persist_rate_limit=True,
+                cache_results=not args.no_cache,
             )
 
         print_results_summary(result, mode)
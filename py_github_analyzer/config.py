@@ -6,18 +6,218 @@ Central configuration and constants
 
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set
+from types import MappingProxyType
+from typing import Dict, List, Set, Tuple
+
+
+# Lookup sets are frozen and kept at module level so hot-path membership checks
+# skip the Config attribute lookup; Config exposes them under their public names
+
+# Binary extensions to skip
+_BINARY_EXTENSIONS = frozenset({
+    # Executables
+    ".exe",
+    ".dll",
+    ".so",
+    ".dylib",
+    ".a",
+    ".lib",
+    ".o",
+    ".obj",
+    ".com",
+    ".bat",
+    ".cmd",
+    ".msi",
+    ".dmg",
+    ".pkg",
+    ".deb",
+    ".rpm",
+    # Archives
+    ".zip",
+    ".tar",
+    ".gz",
+    ".bz2",
+    ".xz",
+    ".7z",
+    ".rar",
+    ".ace",
+    ".arj",
+    ".cab",
+    ".lzh",
+    ".lha",
+    ".sit",
+    ".sea",
+    ".bin",
+    ".hqx",
+    ".uu",
+    ".whl",
+    # Images
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".bmp",
+    ".svg",
+    ".ico",
+    ".tiff",
+    ".tif",
+    ".webp",
+    ".psd",
+    ".ai",
+    ".eps",
+    ".raw",
+    ".cr2",
+    ".nef",
+    ".orf",
+    ".sr2",
+    # Audio/Video
+    ".mp3",
+    ".mp4",
+    ".avi",
+    ".mov",
+    ".wmv",
+    ".flv",
+    ".mkv",
+    ".webm",
+    ".m4v",
+    ".3gp",
+    ".ogv",
+    ".wav",
+    ".flac",
+    ".aac",
+    ".ogg",
+    ".wma",
+    # Documents
+    ".pdf",
+    ".doc",
+    ".docx",
+    ".xls",
+    ".xlsx",
+    ".ppt",
+    ".pptx",
+    ".odt",
+    ".ods",
+    ".odp",
+    ".rtf",
+    ".pages",
+    ".numbers",
+    ".key",
+    # Fonts
+    ".woff",
+    ".woff2",
+    ".ttf",
+    ".eot",
+    ".otf",
+    ".pfb",
+    ".pfm",
+    # Other
+    ".class",
+    ".jar",
+    ".war",
+    ".ear",
+    ".pyc",
+    ".pyo",
+    ".pyd",
+    ".node",
+    ".so",
+    ".bundle",
+})
+
+# Files to always skip
+_SKIP_FILES = frozenset({
+    ".gitignore",
+    ".gitattributes",
+    ".gitmodules",
+    ".gitkeep",
+    ".DS_Store",
+    "Thumbs.db",
+    "desktop.ini",
+    ".npmrc",
+    ".yarnrc",
+    ".bowerrc",
+    ".travis.yml",
+    ".appveyor.yml",
+    ".circleci",
+    ".gitlab-ci.yml",
+    ".buildkite",
+    "__pycache__",
+    "*.pyc",
+    "*.pyo",
+    "*.pyd",
+    ".coverage",
+    "coverage.xml",
+    ".nyc_output",
+    "node_modules",
+    "bower_components",
+    "vendor",
+    ".sass-cache",
+    ".tmp",
+    ".temp",
+    "logs",
+    "*.log",
+    "npm-debug.log*",
+    "yarn-debug.log*",
+    "yarn-error.log*",
+})
+
+# Directories to skip
+_SKIP_DIRECTORIES = frozenset({
+    ".git",
+    ".svn",
+    ".hg",
+    ".bzr",
+    ".fossil-settings",
+    "node_modules",
+    "__pycache__",
+    ".pytest_cache",
+    "venv",
+    "env",
+    ".env",
+    ".venv",
+    "virtualenv",
+    "build",
+    "dist",
+    "target",
+    "out",
+    "bin",
+    "obj",
+    ".idea",
+    ".vscode",
+    ".vs",
+    ".eclipse",
+    ".netbeans",
+    "coverage",
+    ".coverage",
+    ".nyc_output",
+    "logs",
+    "log",
+    "tmp",
+    "temp",
+    ".tmp",
+    ".temp",
+    ".sass-cache",
+    ".parcel-cache",
+    ".cache",
+    "vendor",
+    "packages",
+    "bower_components",
+})
 
 
 class Config:
-    """Central configuration class"""
+    """
+    Central configuration class
+    Lookup tables are read-only views (MappingProxyType / frozenset); copy before changing
+    """
 
     VERSION = "1.0.0"
     PACKAGE_NAME = "py-github-analyzer"
 
     # GitHub API configuration
     GITHUB_API_BASE = "https://api.github.com"
+    GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
     GITHUB_RAW_BASE = "https://raw.githubusercontent.com"
     GITHUB_ARCHIVE_BASE = "https://github.com"
 
@@ -35,6 +235,8 @@ class Config:
     DEFAULT_RATE_LIMIT = 60  # requests per hour without token
     AUTHENTICATED_RATE_LIMIT = 5000  # requests per hour with token
     RATE_LIMIT_BUFFER = 5  # safety buffer for rate limits
+    RATE_LIMIT_RETRIES = 2  # retries after a rate-limited (403/429) or 5xx response
+    RATE_LIMIT_MAX_BACKOFF = 60  # longest reactive wait (seconds) before giving up
 
     # Timeouts (in seconds)
     REQUEST_TIMEOUT = 30
@@ -52,7 +254,7 @@ class Config:
     DEFAULT_OUTPUT_FORMAT = "both"
 
     # Special filename patterns - files identified by exact name (case-insensitive)
-    SPECIAL_FILES = {
+    SPECIAL_FILES = MappingProxyType({
         # Docker related
         "dockerfile": "dockerfile",
         "dockerfile.dev": "dockerfile",
@@ -119,10 +321,10 @@ class Config:
         "changes": "text",
         "authors": "text",
         "contributors": "text",
-    }
+    })
 
     # Multi-part extensions (handled in order of specificity)
-    MULTI_PART_EXTENSIONS = {
+    MULTI_PART_EXTENSIONS = MappingProxyType({
         # Archives
         ".tar.gz": "binary",
         ".tar.bz2": "binary",
@@ -142,10 +344,10 @@ class Config:
         ".gitattributes": "config",
         ".gitignore": "config",
         ".gitmodules": "config",
-    }
+    })
 
     # Supported file extensions for analysis
-    SUPPORTED_EXTENSIONS = {
+    SUPPORTED_EXTENSIONS = MappingProxyType({
         "python": [".py", ".pyx", ".pyi", ".pyw"],
         "javascript": [".js", ".jsx", ".mjs", ".cjs"],
         "typescript": [".ts", ".tsx", ".d.ts"],
@@ -190,199 +392,74 @@ class Config:
         "nim": [".nim"],
         "crystal": [".cr"],
         "zig": [".zig"],
+    })
+
+    # Reverse lookups built once so classification is a dict hit per suffix
+    _EXT_TO_CATEGORY = {
+        ext.lower(): category
+        for category, extensions in SUPPORTED_EXTENSIONS.items()
+        for ext in extensions
+    }
+    _MULTI_EXT_TO_CATEGORY = {
+        ext.lower(): category for ext, category in MULTI_PART_EXTENSIONS.items()
+    }
+    _MULTI_EXT_SUFFIXES = tuple(_MULTI_EXT_TO_CATEGORY)
+
+    # Filename keyword fallbacks for unknown extensions, checked in order
+    # (test/spec wins over config so "test_config" stays text)
+    _KEYWORD_CATEGORIES = (
+        (("test", "spec"), "text"),
+        (("config", "conf", "cfg"), "config"),
+    )
+
+    # Base analysis priority by file category (get_file_priority)
+    _CATEGORY_PRIORITIES = {
+        "python": 800,
+        "javascript": 750,
+        "typescript": 750,
+        "java": 700,
+        "cpp": 650,
+        "csharp": 650,
+        "go": 650,
+        "rust": 650,
+        "php": 600,
+        "ruby": 600,
+        "dockerfile": 900,  # Very important
+        "config": 550,
+        "markdown": 400,
+        "yaml": 500,
+        "json": 500,
+        "xml": 400,
+        "text": 300,
+        "binary": 0,
+        "skip": 0,
     }
 
-    # Binary extensions to skip
-    BINARY_EXTENSIONS = {
-        # Executables
-        ".exe",
-        ".dll",
-        ".so",
-        ".dylib",
-        ".a",
-        ".lib",
-        ".o",
-        ".obj",
-        ".com",
-        ".bat",
-        ".cmd",
-        ".msi",
-        ".dmg",
-        ".pkg",
-        ".deb",
-        ".rpm",
-        # Archives
-        ".zip",
-        ".tar",
-        ".gz",
-        ".bz2",
-        ".xz",
-        ".7z",
-        ".rar",
-        ".ace",
-        ".arj",
-        ".cab",
-        ".lzh",
-        ".lha",
-        ".sit",
-        ".sea",
-        ".bin",
-        ".hqx",
-        ".uu",
-        # Images
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".gif",
-        ".bmp",
-        ".svg",
-        ".ico",
-        ".tiff",
-        ".tif",
-        ".webp",
-        ".psd",
-        ".ai",
-        ".eps",
-        ".raw",
-        ".cr2",
-        ".nef",
-        ".orf",
-        ".sr2",
-        # Audio/Video
-        ".mp3",
-        ".mp4",
-        ".avi",
-        ".mov",
-        ".wmv",
-        ".flv",
-        ".mkv",
-        ".webm",
-        ".m4v",
-        ".3gp",
-        ".ogv",
-        ".wav",
-        ".flac",
-        ".aac",
-        ".ogg",
-        ".wma",
-        # Documents
-        ".pdf",
-        ".doc",
-        ".docx",
-        ".xls",
-        ".xlsx",
-        ".ppt",
-        ".pptx",
-        ".odt",
-        ".ods",
-        ".odp",
-        ".rtf",
-        ".pages",
-        ".numbers",
-        ".key",
-        # Fonts
-        ".woff",
-        ".woff2",
-        ".ttf",
-        ".eot",
-        ".otf",
-        ".pfb",
-        ".pfm",
-        # Other
-        ".class",
-        ".jar",
-        ".war",
-        ".ear",
-        ".pyc",
-        ".pyo",
-        ".pyd",
-        ".node",
-        ".so",
-        ".bundle",
+    # Priority bonus for well-known files (get_file_priority)
+    _SPECIAL_FILE_BONUSES = {
+        "readme.md": 300,
+        "package.json": 200,
+        "requirements.txt": 200,
+        "dockerfile": 400,
+        "makefile": 300,
+        "setup.py": 200,
+        "main.py": 300,
+        "index.js": 300,
+        "app.py": 300,
+        "server.js": 300,
     }
 
+    # Binary extensions to skip
+    BINARY_EXTENSIONS = _BINARY_EXTENSIONS
+
     # Files to always skip
-    SKIP_FILES = {
-        ".gitignore",
-        ".gitattributes",
-        ".gitmodules",
-        ".gitkeep",
-        ".DS_Store",
-        "Thumbs.db",
-        "desktop.ini",
-        ".npmrc",
-        ".yarnrc",
-        ".bowerrc",
-        ".travis.yml",
-        ".appveyor.yml",
-        ".circleci",
-        ".gitlab-ci.yml",
-        ".buildkite",
-        "__pycache__",
-        "*.pyc",
-        "*.pyo",
-        "*.pyd",
-        ".coverage",
-        "coverage.xml",
-        ".nyc_output",
-        "node_modules",
-        "bower_components",
-        "vendor",
-        ".sass-cache",
-        ".tmp",
-        ".temp",
-        "logs",
-        "*.log",
-        "npm-debug.log*",
-        "yarn-debug.log*",
-        "yarn-error.log*",
-    }
+    SKIP_FILES = _SKIP_FILES
 
     # Directories to skip
-    SKIP_DIRECTORIES = {
-        ".git",
-        ".svn",
-        ".hg",
-        ".bzr",
-        ".fossil-settings",
-        "node_modules",
-        "__pycache__",
-        ".pytest_cache",
-        "venv",
-        "env",
-        ".env",
-        ".venv",
-        "virtualenv",
-        "build",
-        "dist",
-        "target",
-        "out",
-        "bin",
-        "obj",
-        ".idea",
-        ".vscode",
-        ".vs",
-        ".eclipse",
-        ".netbeans",
-        "coverage",
-        ".coverage",
-        ".nyc_output",
-        "logs",
-        "log",
-        "tmp",
-        "temp",
-        ".tmp",
-        ".temp",
-        ".sass-cache",
-        ".parcel-cache",
-        ".cache",
-        "vendor",
-        "packages",
-        "bower_components",
-    }
+    SKIP_DIRECTORIES = _SKIP_DIRECTORIES
 
     # Language detection patterns
-    LANGUAGE_PATTERNS = {
+    LANGUAGE_PATTERNS = MappingProxyType({
         "python": {
             "extensions": [".py"],
             "files": ["setup.py", "requirements.txt", "pyproject.toml"],
@@ -405,10 +482,10 @@ class Config:
         "rust": {"extensions": [".rs"], "files": ["Cargo.toml", "Cargo.lock"]},
         "php": {"extensions": [".php"], "files": ["composer.json"]},
         "ruby": {"extensions": [".rb"], "files": ["Gemfile", "Rakefile"]},
-    }
+    })
 
     # Dependency detection patterns
-    DEPENDENCY_FILES = {
+    DEPENDENCY_FILES = MappingProxyType({
         "python": [
             "requirements.txt",
             "Pipfile",
@@ -424,10 +501,10 @@ class Config:
         "rust": ["Cargo.toml", "Cargo.lock"],
         "php": ["composer.json", "composer.lock"],
         "ruby": ["Gemfile", "Gemfile.lock", ".gemspec"],
-    }
+    })
 
     # Priority patterns for different languages
-    LANGUAGE_PRIORITY_PATTERNS = {
+    LANGUAGE_PRIORITY_PATTERNS = MappingProxyType({
         "python": {
             "entry_points": ["main.py", "app.py", "__init__.py", "manage.py"],
             "config_files": [
@@ -453,7 +530,7 @@ class Config:
                 "express": ["server.js", "app.js", "index.js"],
             },
         },
-    }
+    })
 
     # Analysis methods
     ANALYSIS_METHODS = ["auto", "api", "zip"]
@@ -464,15 +541,21 @@ class Config:
     CHUNK_SIZE = 8192  # 8KB chunks for streaming
 
     # Timeout configuration
-    TIMEOUT_CONFIG = {"http_timeout": 30, "zip_timeout": 300, "api_timeout": 60}
+    TIMEOUT_CONFIG = MappingProxyType(
+        {"http_timeout": 30, "zip_timeout": 300, "api_timeout": 60}
+    )
 
     # Size limits
     MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE
     MAX_TOTAL_SIZE_BYTES = MAX_REPOSITORY_SIZE
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def get_file_category(cls, filename: str) -> str:
-        """Enhanced file category detection with special file handling"""
+        """
+        Enhanced file category detection with special file handling
+        Memoized: names such as __init__.py or index.js repeat across a repository
+        """
         if not filename:
             return "unknown"
 
@@ -480,7 +563,7 @@ class Config:
         normalized_name = filename.lower().strip()
 
         # Check if file should be skipped
-        if normalized_name in cls.SKIP_FILES:
+        if normalized_name in _SKIP_FILES:
             return "skip"
 
         # Step 1: Check special files by exact name (highest priority)
@@ -488,49 +571,43 @@ class Config:
             return cls.SPECIAL_FILES[normalized_name]
 
         # Step 2: Check multi-part extensions (e.g., .tar.gz)
-        for multi_ext, category in cls.MULTI_PART_EXTENSIONS.items():
-            if normalized_name.endswith(multi_ext.lower()):
-                return category
+        # One C-level endswith over all of them; the loop only runs on a hit
+        if normalized_name.endswith(cls._MULTI_EXT_SUFFIXES):
+            for multi_ext, category in cls._MULTI_EXT_TO_CATEGORY.items():
+                if normalized_name.endswith(multi_ext):
+                    return category
 
         # Step 3: Check single extensions
-        # Use pathlib to get all suffixes
-        path_obj = Path(filename)
-        suffixes = path_obj.suffixes
+        # Suffixes follow pathlib rules (last path component, leading dots
+        # ignored) but are sliced from the string instead of building a Path
+        name = filename.rstrip("/").rsplit("/", 1)[-1].lstrip(".")
+        dot = name.rfind(".")
 
-        if suffixes:
+        if dot > 0 and not name.endswith("."):
             # Try the last suffix first (most specific)
-            last_suffix = suffixes[-1].lower()
+            last_suffix = name[dot:].lower()
 
             # Check if it's a binary extension
-            if last_suffix in cls.BINARY_EXTENSIONS:
+            if last_suffix in _BINARY_EXTENSIONS:
                 return "binary"
 
             # Check supported extensions
-            for category, extensions in cls.SUPPORTED_EXTENSIONS.items():
-                if last_suffix in extensions:
-                    return category
+            category = cls._EXT_TO_CATEGORY.get(last_suffix)
+            if category:
+                return category
 
-            # If multiple suffixes, try combinations
-            if len(suffixes) > 1:
-                combined_suffix = "".join(suffixes).lower()
-                for category, extensions in cls.SUPPORTED_EXTENSIONS.items():
-                    if combined_suffix in extensions:
-                        return category
+            # If multiple suffixes, try combinations (e.g. .d.ts)
+            first_dot = name.find(".")
+            if first_dot != dot:
+                category = cls._EXT_TO_CATEGORY.get(name[first_dot:].lower())
+                if category:
+                    return category
 
         # Step 4: Fallback for files without extensions
-        # Check if filename contains language keywords
-        filename_lower = normalized_name
-
-        # Common patterns
-        if any(keyword in filename_lower for keyword in ["test", "spec"]):
-            return "text"
-        if any(keyword in filename_lower for keyword in ["config", "conf", "cfg"]):
-            return "config"
-        if any(
-            keyword in filename_lower
-            for keyword in ["readme", "license", "changelog"]
-        ):
-            return "text"
+        # Check if filename contains language keywords, first match wins
+        for keywords, category in cls._KEYWORD_CATEGORIES:
+            if any(keyword in normalized_name for keyword in keywords):
+                return category
 
         return "text"  # Default to text for unknown files
 
@@ -571,56 +648,28 @@ class Config:
 
         return category_to_language.get(category, "unknown")
 
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _filename_priority(cls, filename: str) -> Tuple[int, bool]:
+        """
+        Path-independent part of get_file_priority for a lowercased file name:
+        (category priority + special-file bonus, whether it looks like a test)
+        """
+        base_priority = cls._CATEGORY_PRIORITIES.get(cls.get_file_category(filename), 200)
+        base_priority += cls._SPECIAL_FILE_BONUSES.get(filename, 0)
+        return base_priority, "test" in filename or "spec" in filename
+
     @classmethod
     def get_file_priority(cls, filepath: str) -> int:
         """Calculate file priority for analysis"""
         if not filepath:
             return 100
 
-        filename = Path(filepath).name.lower()
-        category = cls.get_file_category(filename)
-
-        # Base priority by category
-        category_priorities = {
-            "python": 800,
-            "javascript": 750,
-            "typescript": 750,
-            "java": 700,
-            "cpp": 650,
-            "csharp": 650,
-            "go": 650,
-            "rust": 650,
-            "php": 600,
-            "ruby": 600,
-            "dockerfile": 900,  # Very important
-            "config": 550,
-            "markdown": 400,
-            "yaml": 500,
-            "json": 500,
-            "xml": 400,
-            "text": 300,
-            "binary": 0,
-            "skip": 0,
-        }
-
-        base_priority = category_priorities.get(category, 200)
-
-        # Bonus for special files
-        special_bonuses = {
-            "readme.md": 300,
-            "package.json": 200,
-            "requirements.txt": 200,
-            "dockerfile": 400,
-            "makefile": 300,
-            "setup.py": 200,
-            "main.py": 300,
-            "index.js": 300,
-            "app.py": 300,
-            "server.js": 300,
-        }
-
-        if filename in special_bonuses:
-            base_priority += special_bonuses[filename]
+        # Plain string split; Path is only needed for odd names like "dir/."
+        filename = filepath.rstrip("/").rpartition("/")[2]
+        if filename in ("", "."):
+            filename = Path(filepath).name
+        base_priority, is_test = cls._filename_priority(filename.lower())
 
         # Penalty for deep nesting
         depth = filepath.count("/")
@@ -628,7 +677,7 @@ class Config:
             base_priority -= (depth - 3) * 50
 
         # Penalty for test files (unless very important)
-        if "test" in filename or "spec" in filename:
+        if is_test:
             if base_priority < 600:
                 base_priority = max(base_priority - 200, 50)
 
@@ -637,7 +686,7 @@ class Config:
     @classmethod
     def is_excluded_directory(cls, dirname: str) -> bool:
         """Check if directory should be excluded"""
-        return dirname.lower() in cls.SKIP_DIRECTORIES
+        return dirname.lower() in _SKIP_DIRECTORIES
 
     @classmethod
     def is_binary_file(cls, filepath: str) -> bool:
@@ -1,5 +1,7 @@
 # py_github_analyzer/core.py
 import asyncio
+import weakref
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
 from .analysis import (
@@ -22,6 +24,7 @@ from .exceptions import TimeoutError as AnalyzerTimeoutError
 from .logger import AnalyzerLogger, get_logger
 from .output_writer import OutputWriter
 from .processing import FileProcessor
+from .result_cache import ResultCache
 from .utils import TokenUtils, URLParser
 
 
@@ -29,14 +32,48 @@ class EmptyRepositoryError(GitHubAnalyzerError):
     pass
 
 
+# Repository downloads in flight at once across every analyzer in the process;
+# each client only bounds its own requests, so batch callers could otherwise
+# trip GitHub's secondary rate limit by analyzing many repositories in parallel
+_MAX_CONCURRENT_ANALYSES = 8
+_analysis_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Archive failures that are routine reasons to retry through the API
+_EXPECTED_ARCHIVE_ERRORS = (NetworkError, AnalyzerTimeoutError, RepositoryTooLargeError)
+
+# Fixed fields of a dry-run result; containers are built per call so callers can mutate them
+_DRY_RUN_RESULT = MappingProxyType({"success": True, "dry_run": True, "fallback_mode": False})
+
+
+def _analysis_slot() -> asyncio.Semaphore:
+    """Process-wide download cap for the running event loop (semaphores are loop-bound)"""
+    loop = asyncio.get_running_loop()
+    slot = _analysis_slots.get(loop)
+    if slot is None:
+        slot = _analysis_slots[loop] = asyncio.Semaphore(_MAX_CONCURRENT_ANALYSES)
+    return slot
+
+
 class GitHubRepositoryAnalyzer:
-    def __init__(self, token: Optional[str] = None, logger: Optional[AnalyzerLogger] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        logger: Optional[AnalyzerLogger] = None,
+        persist_rate_limit: bool = False,
+        cache_results: bool = False,
+    ):
         self.github_token = self._resolve_github_token(token)
         self.logger = logger or get_logger()
 
-        self.client = AsyncGitHubClient(self.github_token, self.logger)
+        self.client = AsyncGitHubClient(
+            self.github_token, self.logger, persist_rate_limit=persist_rate_limit
+        )
         self.file_processor = FileProcessor(self.logger)
         self.output_writer = OutputWriter(self.logger)
+        self._result_cache = ResultCache(self.logger) if cache_results else None
 
         self._zip_strategy = ZipAnalysisStrategy(self.client, self.logger)
         self._api_strategy = ApiAnalysisStrategy(self.client, self.logger)
@@ -91,6 +128,7 @@ class GitHubRepositoryAnalyzer:
     ) -> Dict[str, Any]:
         original_error: Optional[Exception] = None
         fallback_error: Optional[Exception] = None
+        url_info: Optional[Dict[str, str]] = None
 
         try:
             url_info = URLParser.parse_github_url(repo_url)
@@ -101,12 +139,12 @@ class GitHubRepositoryAnalyzer:
                 self.logger.info(f"Method: {method} | Output: {output_dir} | Format: {output_format}")
 
             if dry_run:
+                full_name = f"{owner}/{repo}"
                 return {
-                    "success": True,
-                    "dry_run": True,
-                    "repository": f"{owner}/{repo}",
+                    **_DRY_RUN_RESULT,
+                    "repository": full_name,
                     "metadata": {
-                        "repo": f"{owner}/{repo}",
+                        "repo": full_name,
                         "owner": owner,
                         "name": repo,
                         "lang": ["Simulated"],
@@ -114,10 +152,29 @@ class GitHubRepositoryAnalyzer:
                     },
                     "files": [],
                     "output_paths": {},
-                    "fallback_mode": False,
                 }
 
-            files, repo_info = await self._run_strategy(owner, repo, method)
+            cache_key = await self._result_cache_key(owner, repo, method)
+            if cache_key:
+                cached = await asyncio.to_thread(self._result_cache.load, cache_key)
+                if cached:
+                    self.logger.info("Repository unchanged since the last analysis, reusing cached result")
+                    output_paths = await self.output_writer.write(
+                        output_dir, output_format, cached["metadata"], cached["files"], f"{owner}_{repo}"
+                    )
+                    return {
+                        "success": True,
+                        "repository": f"{owner}/{repo}",
+                        "metadata": cached["metadata"],
+                        "files": cached["files"],
+                        "output_paths": output_paths,
+                        "fallback_mode": False,
+                        "analysis_method": method,
+                        "token_used": bool(self.token),
+                        "from_cache": True,
+                    }
+
+            files, repo_info, complete = await self._run_strategy(owner, repo, method)
 
             if not files:
                 self.logger.warning(f"No files extracted from repository: {repo_url}")
@@ -153,6 +210,15 @@ class GitHubRepositoryAnalyzer:
                 output_dir, output_format, metadata, processed_files, f"{owner}_{repo}"
             )
 
+            if cache_key and not complete:
+                self.logger.debug("Some files could not be downloaded, not caching this result")
+            elif cache_key:
+                await asyncio.to_thread(
+                    self._result_cache.store,
+                    cache_key,
+                    {"metadata": metadata, "files": processed_files},
+                )
+
             return {
                 "success": True,
                 "repository": f"{owner}/{repo}",
@@ -171,7 +237,9 @@ class GitHubRepositoryAnalyzer:
             if fallback:
                 self.logger.warning("Attempting fallback analysis...")
                 try:
-                    url_info = URLParser.parse_github_url(repo_url)
+                    # Only reparse if the URL itself was what failed; this raises again
+                    if url_info is None:
+                        url_info = URLParser.parse_github_url(repo_url)
                     fallback_result = await self._run_fallback(
                         url_info["owner"],
                         url_info["repo"],
@@ -240,7 +308,7 @@ class GitHubRepositoryAnalyzer:
                     f"Method: {method} | include_docstring: {include_docstring} | public_only: {public_only}"
                 )
 
-            files, repo_info = await self._run_strategy(owner, repo, method)
+            files, repo_info, _ = await self._run_strategy(owner, repo, method)
 
             if not files:
                 self.logger.warning(f"No files extracted from repository: {repo_url}")
@@ -322,16 +390,36 @@ class GitHubRepositoryAnalyzer:
                 },
             }
 
+    async def _result_cache_key(self, owner: str, repo: str, method: str) -> Optional[str]:
+        if self._result_cache is None:
+            return None
+        commit_sha = await self.client.get_default_branch_sha(owner, repo, safe_mode=True)
+        if not commit_sha:
+            return None
+        return ResultCache.make_key(owner, repo, commit_sha, method)
+
     async def _run_strategy(
         self, owner: str, repo: str, method: str
+    ):
+        """
+        Returns (files, repo_info, complete); complete is False when the API strategy
+        had to drop files it could not download, so the result must not be cached
+        """
+        async with _analysis_slot():
+            return await self._dispatch_strategy(owner, repo, method)
+
+    async def _dispatch_strategy(
+        self, owner: str, repo: str, method: str
     ):
         if method == "api":
             self.logger.info("Using API-only mode (explicit)")
-            return await self._api_strategy.execute(owner, repo)
+            files, repo_info, failed = await self._api_strategy.fetch(owner, repo)
+            return files, repo_info, failed == 0
 
         if method == "zip":
             self.logger.info("Using ZIP-only mode (explicit)")
-            return await self._zip_strategy.execute(owner, repo)
+            files, repo_info = await self._zip_strategy.execute(owner, repo)
+            return files, repo_info, True
 
         self.logger.info("Using ZIP-first strategy (auto mode)")
         try:
@@ -340,37 +428,25 @@ class GitHubRepositoryAnalyzer:
                 self.logger.info(f"ZIP download successful! ({len(files)} files)")
             else:
                 self.logger.warning("ZIP download returned no files")
-            return files, repo_info
-        except PrivateRepositoryError as e:
-            if self.token:
+            return files, repo_info, True
+        except Exception as e:
+            # Without a token the API cannot do better than the archive did
+            if not self.token:
+                raise
+            if isinstance(e, PrivateRepositoryError):
                 self.logger.warning("Private repository detected, trying API with token...")
-                try:
-                    files, repo_info = await self._api_strategy.execute(owner, repo)
-                    self.logger.info(f"API access successful! ({len(files)} files)")
-                    return files, repo_info
-                except Exception as api_error:
-                    self.logger.error(f"API access also failed: {api_error}")
-            raise e
-        except (NetworkError, AnalyzerTimeoutError, RepositoryTooLargeError) as e:
-            if self.token:
+            elif isinstance(e, _EXPECTED_ARCHIVE_ERRORS):
                 self.logger.warning(f"ZIP failed ({type(e).__name__}), attempting API fallback...")
-                try:
-                    files, repo_info = await self._api_strategy.execute(owner, repo)
-                    self.logger.info(f"API fallback successful! ({len(files)} files)")
-                    return files, repo_info
-                except Exception as api_error:
-                    self.logger.error(f"API fallback also failed: {api_error}")
-            raise e
-        except Exception as e:
-            if self.token:
+            else:
                 self.logger.warning(f"ZIP failed with unexpected error, trying API fallback: {e}")
-                try:
-                    files, repo_info = await self._api_strategy.execute(owner, repo)
-                    self.logger.info(f"API fallback successful! ({len(files)} files)")
-                    return files, repo_info
-                except Exception as api_error:
-                    self.logger.error(f"API fallback also failed: {api_error}")
-            raise e
+            try:
+                files, repo_info, failed = await self._api_strategy.fetch(owner, repo)
+            except Exception as api_error:
+                self.logger.error(f"API fallback also failed: {api_error}")
+            else:
+                self.logger.info(f"API fallback successful! ({len(files)} files)")
+                return files, repo_info, failed == 0
+            raise
 
     async def _run_fallback(
         self,
@@ -492,6 +568,8 @@ async def analyze_repository_async(repo_url: str, **kwargs) -> Dict[str, Any]:
     analyzer = GitHubRepositoryAnalyzer(
         token=kwargs.pop("github_token", None),
         logger=kwargs.pop("logger", None),
+        persist_rate_limit=kwargs.pop("persist_rate_limit", False),
+        cache_results=kwargs.pop("cache_results", False),
     )
     try:
         return await analyzer.analyze_repository_async(repo_url, **kwargs)
@@ -523,7 +601,7 @@ async def analyze_signatures_async(
                 f"Method: {method} | include_docstring: {include_docstring} | public_only: {public_only}"
             )
 
-        files, repo_info = await self._run_strategy(owner, repo, method)
+        files, repo_info, _ = await self._run_strategy(owner, repo, method)
 
         if not files:
             self.logger.warning(f"No files extracted from repository: {repo_url}")
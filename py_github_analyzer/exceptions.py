@@ -6,19 +6,43 @@ Enhanced error handling with private repository detection
 
 """
 
+import copyreg
+from functools import lru_cache
+
 
 class GitHubAnalyzerError(Exception):
     """Base exception for GitHub Analyzer"""
+
+    # Attributes live in slots, so instances don't materialize a __dict__
+    __slots__ = ("details", "_rendered")
     
     def __init__(self, message: str, details: str = None):
-        self.message = message
+        super().__init__(message)
         self.details = details
-        super().__init__(self.message)
+        self._rendered = None
+
+    @property
+    def message(self) -> str:
+        # Exception already keeps the message in args; no second copy is stored
+        return self.args[0]
+
+    def __reduce__(self):
+        # BaseException only pickles __dict__, which would drop every slot
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if hasattr(self, name)
+        }
+        return copyreg.__newobj__, (type(self), *self.args), state
     
     def __str__(self):
-        if self.details:
-            return f"{self.message}: {self.details}"
-        return self.message
+        # Log handlers and traceback formatting often render the same error repeatedly
+        rendered = self._rendered
+        if rendered is None:
+            rendered = self.message + ": " + str(self.details) if self.details else self.message
+            self._rendered = rendered
+        return rendered
 
 
 class NetworkError(GitHubAnalyzerError):
@@ -28,6 +52,8 @@ class NetworkError(GitHubAnalyzerError):
 
 class RateLimitExceededError(GitHubAnalyzerError):
     """GitHub API rate limit exceeded"""
+
+    __slots__ = ("reset_time", "remaining")
     
     def __init__(self, message: str, reset_time: int = None, remaining: int = None):
         super().__init__(message)
@@ -47,6 +73,8 @@ class RepositoryNotFoundError(GitHubAnalyzerError):
 
 class PrivateRepositoryError(AuthenticationError):
     """Private repository detected - requires GitHub token"""
+
+    __slots__ = ("repo_url",)
     
     def __init__(self, message: str, repo_url: str = ""):
         super().__init__(message)
@@ -55,6 +83,8 @@ class PrivateRepositoryError(AuthenticationError):
 
 class RepositoryTooLargeError(GitHubAnalyzerError):
     """Repository exceeds size limits"""
+
+    __slots__ = ("size_mb", "limit_mb")
     
     def __init__(self, message: str, size_mb: float, limit_mb: float):
         super().__init__(message)
@@ -94,6 +124,8 @@ class OutputError(GitHubAnalyzerError):
 
 class AnalyzerTimeoutError(GitHubAnalyzerError):
     """Operation timeout exceeded (renamed to avoid Python builtin conflict)"""
+
+    __slots__ = ("timeout_seconds",)
     
     def __init__(self, message: str, timeout_seconds: int):
         super().__init__(message)
@@ -102,6 +134,8 @@ class AnalyzerTimeoutError(GitHubAnalyzerError):
 
 class EmptyRepositoryError(GitHubAnalyzerError):
     """Raised when repository exists but contains no analyzable files"""
+
+    __slots__ = ("repo_url", "file_count")
     
     def __init__(self, message: str, repo_url: str, file_count: int = 0):
         super().__init__(message)
@@ -111,6 +145,8 @@ class EmptyRepositoryError(GitHubAnalyzerError):
 
 class RepositoryContentError(GitHubAnalyzerError):
     """Raised when repository content cannot be analyzed"""
+
+    __slots__ = ("repo_url", "reason")
     
     def __init__(self, message: str, repo_url: str, reason: str):
         super().__init__(message)
@@ -118,129 +154,166 @@ class RepositoryContentError(GitHubAnalyzerError):
         self.reason = reason
 
 
-def handle_github_api_error(status_code: int, response_data: dict = None, repo_url: str = "") -> GitHubAnalyzerError:
+_AUTHENTICATION_FAILED_MESSAGE = (
+    "GitHub authentication failed. Your token may be invalid or expired.\n"
+    "Get a new token at: https://github.com/settings/tokens"
+)
+_RATE_LIMIT_EXCEEDED_MESSAGE = (
+    "GitHub API rate limit exceeded. Please wait or use a personal access token for higher limits."
+)
+_PRIVATE_REPOSITORY_MESSAGE = (
+    "Repository appears to be private or requires authentication.\n"
+    "If this is a private repository, you need a GitHub token with 'repo' scope.\n"
+    "Get a token at: https://github.com/settings/tokens"
+)
+_REPOSITORY_NOT_FOUND_MESSAGE = (
+    "Repository not found, private, or requires authentication.\n"
+    "Please verify the repository URL and access permissions."
+)
+_INVALID_REQUEST_MESSAGE = "Invalid request parameters. Please check the repository URL format."
+
+
+def _authentication_error(response_data, headers, repo_url) -> GitHubAnalyzerError:
+    return AuthenticationError(_AUTHENTICATION_FAILED_MESSAGE)
+
+
+def _forbidden_error(response_data, headers, repo_url) -> GitHubAnalyzerError:
+    data = response_data if isinstance(response_data, dict) else {}
+    headers = headers or {}
+    message = data.get("message")
+    is_rate_limited = (
+        isinstance(message, str) and "rate limit" in message.lower()
+    ) or headers.get("X-RateLimit-Remaining") == "0"
+    if is_rate_limited:
+        # GitHub reports the quota in X-RateLimit-* headers, not in the body
+        reset_header = headers.get("X-RateLimit-Reset")
+        remaining_header = headers.get("X-RateLimit-Remaining")
+        reset_time = int(reset_header) if reset_header else data.get('reset', 0)
+        remaining = int(remaining_header) if remaining_header else data.get('remaining', 0)
+        return RateLimitExceededError(
+            _RATE_LIMIT_EXCEEDED_MESSAGE,
+            reset_time=reset_time,
+            remaining=remaining
+        )
+    # Likely private repository or insufficient permissions
+    return PrivateRepositoryError(_PRIVATE_REPOSITORY_MESSAGE, repo_url)
+
+
+def _not_found_error(response_data, headers, repo_url) -> GitHubAnalyzerError:
+    # Could be private repo OR truly not found - will be refined by caller
+    return RepositoryNotFoundError(_REPOSITORY_NOT_FOUND_MESSAGE)
+
+
+def _validation_error(response_data, headers, repo_url) -> GitHubAnalyzerError:
+    return ValidationError(_INVALID_REQUEST_MESSAGE)
+
+
+# Status codes with a dedicated exception; 5xx and anything else are handled below
+_STATUS_ERROR_FACTORIES = {
+    401: _authentication_error,
+    403: _forbidden_error,
+    404: _not_found_error,
+    422: _validation_error,
+}
+
+
+def handle_github_api_error(
+    status_code: int, response_data: dict = None, repo_url: str = "", headers=None
+) -> GitHubAnalyzerError:
     """
     Convert GitHub API error responses to appropriate exceptions
-    Enhanced with private repository detection
+    Enhanced with private repository detection; headers is the response's
+    (case-insensitive) header mapping, which carries GitHub's rate limit state
     """
-    if status_code == 401:
-        return AuthenticationError(
-            "GitHub authentication failed. Your token may be invalid or expired.\n"
-            "Get a new token at: https://github.com/settings/tokens"
-        )
-    
-    elif status_code == 403:
-        if response_data and "rate limit" in str(response_data).lower():
-            # Rate limit error
-            reset_time = response_data.get('reset', 0) if response_data else 0
-            remaining = response_data.get('remaining', 0) if response_data else 0
-            return RateLimitExceededError(
-                "GitHub API rate limit exceeded. Please wait or use a personal access token for higher limits.",
-                reset_time=reset_time,
-                remaining=remaining
-            )
-        else:
-            # Likely private repository or insufficient permissions
-            return PrivateRepositoryError(
-                "Repository appears to be private or requires authentication.\n"
-                "If this is a private repository, you need a GitHub token with 'repo' scope.\n"
-                "Get a token at: https://github.com/settings/tokens",
-                repo_url
-            )
-    
-    elif status_code == 404:
-        # Could be private repo OR truly not found - will be refined by caller
-        return RepositoryNotFoundError(
-            "Repository not found, private, or requires authentication.\n"
-            "Please verify the repository URL and access permissions."
-        )
-    
-    elif status_code == 422:
-        return ValidationError(
-            "Invalid request parameters. Please check the repository URL format."
-        )
-    
-    elif status_code >= 500:
+    factory = _STATUS_ERROR_FACTORIES.get(status_code)
+    if factory is not None:
+        return factory(response_data, headers, repo_url)
+
+    if status_code >= 500:
         return NetworkError(
             f"GitHub server error (HTTP {status_code}). Please try again later."
         )
-    
-    else:
-        return GitHubAnalyzerError(
-            f"Unexpected GitHub API error (HTTP {status_code}). Please try again."
-        )
+
+    return GitHubAnalyzerError(
+        f"Unexpected GitHub API error (HTTP {status_code}). Please try again."
+    )
 
 
+_PRIVATE_REPO_NO_TOKEN_MESSAGE = (
+    "🔒 Repository '{repo_name}' appears to be private and requires authentication.\n\n"
+    "📋 To access private repositories:\n"
+    "  1. Visit: https://github.com/settings/tokens\n"
+    "  2. Click 'Generate new token (classic)'\n"
+    "  3. Select 'repo' scope for private repository access\n"
+    "  4. Copy the generated token\n"
+    "  5. Use it with your analysis\n\n"
+    "💡 CLI Example:\n"
+    "  py-github-analyzer {repo_url} --github-token YOUR_TOKEN\n\n"
+    "💡 Python Example:\n"
+    "  pga.analyze_repository('{repo_url}', github_token='YOUR_TOKEN')"
+)
+
+_PRIVATE_REPO_WITH_TOKEN_MESSAGE = (
+    "🔐 Repository '{repo_name}' is private and your token doesn't have access.\n\n"
+    "🔍 Please check:\n"
+    "  • Your token has 'repo' scope enabled\n"
+    "  • You have access permissions to this repository\n"
+    "  • The repository hasn't been deleted or moved\n\n"
+    "🔧 To fix token permissions:\n"
+    "  1. Visit: https://github.com/settings/tokens\n"
+    "  2. Edit your existing token\n"
+    "  3. Ensure 'repo' scope is selected\n"
+    "  4. Update the token if needed"
+)
+
+_REPO_NOT_FOUND_MESSAGE = (
+    "❌ Repository '{repo_name}' does not exist or is not accessible.\n\n"
+    "🔍 Please verify:\n"
+    "  • Repository URL is correct: {repo_url}\n"
+    "  • Repository is public OR you have a valid token\n"
+    "  • Repository owner and name are spelled correctly\n"
+    "  • Repository hasn't been deleted, renamed, or moved\n\n"
+    "💡 If this is a private repository, use:\n"
+    "  py-github-analyzer {repo_url} --github-token YOUR_TOKEN"
+)
+
+_TOKEN_CREATION_GUIDE = (
+    "🔑 GitHub Personal Access Token Required\n\n"
+    "📋 Create a token in 4 easy steps:\n"
+    "  1. Go to: https://github.com/settings/tokens\n"
+    "  2. Click 'Generate new token (classic)'\n"
+    "  3. Select scopes:\n"
+    "     • 'repo' - for private repositories\n"
+    "     • 'public_repo' - for public repositories (optional)\n"
+    "  4. Copy the generated token (starts with 'ghp_' or 'github_pat_')\n\n"
+    "⚠️ Important:\n"
+    "  • Save your token safely - you can't see it again!\n"
+    "  • Never share your token publicly\n"
+    "  • Tokens provide the same access as your GitHub password\n\n"
+    "💡 Usage examples:\n"
+    "  CLI: py-github-analyzer [URL] -t YOUR_TOKEN\n"
+    "  Python: pga.analyze_repository(url, github_token='YOUR_TOKEN')"
+)
+
+
+@lru_cache(maxsize=64)
 def create_private_repo_guidance_message(owner: str, repo: str, has_token: bool = False) -> str:
     """Create a helpful message for private repository access"""
-    repo_name = f"{owner}/{repo}"
-    repo_url = f"https://github.com/{repo_name}"
-    
-    if not has_token:
-        return (
-            f"🔒 Repository '{repo_name}' appears to be private and requires authentication.\n\n"
-            f"📋 To access private repositories:\n"
-            f"  1. Visit: https://github.com/settings/tokens\n"
-            f"  2. Click 'Generate new token (classic)'\n"
-            f"  3. Select 'repo' scope for private repository access\n"
-            f"  4. Copy the generated token\n"
-            f"  5. Use it with your analysis\n\n"
-            f"💡 CLI Example:\n"
-            f"  py-github-analyzer {repo_url} --github-token YOUR_TOKEN\n\n"
-            f"💡 Python Example:\n"
-            f"  pga.analyze_repository('{repo_url}', github_token='YOUR_TOKEN')"
-        )
-    else:
-        return (
-            f"🔐 Repository '{repo_name}' is private and your token doesn't have access.\n\n"
-            f"🔍 Please check:\n"
-            f"  • Your token has 'repo' scope enabled\n"
-            f"  • You have access permissions to this repository\n"
-            f"  • The repository hasn't been deleted or moved\n\n"
-            f"🔧 To fix token permissions:\n"
-            f"  1. Visit: https://github.com/settings/tokens\n"
-            f"  2. Edit your existing token\n"
-            f"  3. Ensure 'repo' scope is selected\n"
-            f"  4. Update the token if needed"
-        )
+    template = _PRIVATE_REPO_WITH_TOKEN_MESSAGE if has_token else _PRIVATE_REPO_NO_TOKEN_MESSAGE
+    return template.format(repo_name=f"{owner}/{repo}", repo_url=f"https://github.com/{owner}/{repo}")
 
 
+@lru_cache(maxsize=64)
 def create_repo_not_found_message(owner: str, repo: str) -> str:
     """Create a helpful message for repository not found errors"""
-    repo_name = f"{owner}/{repo}"
-    repo_url = f"https://github.com/{repo_name}"
-    
-    return (
-        f"❌ Repository '{repo_name}' does not exist or is not accessible.\n\n"
-        f"🔍 Please verify:\n"
-        f"  • Repository URL is correct: {repo_url}\n"
-        f"  • Repository is public OR you have a valid token\n"
-        f"  • Repository owner and name are spelled correctly\n"
-        f"  • Repository hasn't been deleted, renamed, or moved\n\n"
-        f"💡 If this is a private repository, use:\n"
-        f"  py-github-analyzer {repo_url} --github-token YOUR_TOKEN"
+    return _REPO_NOT_FOUND_MESSAGE.format(
+        repo_name=f"{owner}/{repo}", repo_url=f"https://github.com/{owner}/{repo}"
     )
 
 
 def suggest_token_creation() -> str:
     """Create a helpful token creation guide"""
-    return (
-        "🔑 GitHub Personal Access Token Required\n\n"
-        "📋 Create a token in 4 easy steps:\n"
-        "  1. Go to: https://github.com/settings/tokens\n"
-        "  2. Click 'Generate new token (classic)'\n"
-        "  3. Select scopes:\n"
-        "     • 'repo' - for private repositories\n"
-        "     • 'public_repo' - for public repositories (optional)\n"
-        "  4. Copy the generated token (starts with 'ghp_' or 'github_pat_')\n\n"
-        "⚠️ Important:\n"
-        "  • Save your token safely - you can't see it again!\n"
-        "  • Never share your token publicly\n"
-        "  • Tokens provide the same access as your GitHub password\n\n"
-        "💡 Usage examples:\n"
-        "  CLI: py-github-analyzer [URL] -t YOUR_TOKEN\n"
-        "  Python: pga.analyze_repository(url, github_token='YOUR_TOKEN')"
-    )
+    return _TOKEN_CREATION_GUIDE
 
 
 # Backward compatibility alias (in case the old name was used)
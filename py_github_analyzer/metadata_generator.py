@@ -12,6 +12,7 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from . import _json
 from .config import Config
 from .logger import AnalyzerLogger
 
@@ -513,7 +514,7 @@ class MetadataGenerator:
 
         try:
             if filename == "package.json":
-                data = json.loads(content)
+                data = _json.loads(content)
                 deps = {}
                 deps.update(data.get("dependencies", {}))
                 deps.update(data.get("devDependencies", {}))
@@ -531,7 +532,7 @@ class MetadataGenerator:
                             dependencies.append(package)
 
             elif filename == "composer.json":
-                data = json.loads(content)
+                data = _json.loads(content)
                 deps = {}
                 deps.update(data.get("require", {}))
                 deps.update(data.get("require-dev", {}))
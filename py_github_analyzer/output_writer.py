@@ -1,14 +1,63 @@
 # py_github_analyzer/output_writer.py
-import json
+import asyncio
+import gzip
 import pickle
+import time
 from pathlib import Path
-from typing import Any, Dict, List
-
-import aiofiles
+from typing import Any, Dict, List, Union
 
+from . import _json
 from .config import Config
 from .logger import AnalyzerLogger
 
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# .bin outputs are gzip-compressed pickles; source text shrinks 3-4x at level 3
+_BIN_COMPRESS_LEVEL = 3
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _write_json(path: Path, output_data: Dict[str, Any]) -> None:
+    """
+    Write output_data as indented JSON, serializing list items one at a time so
+    the whole document never exists as a single string in memory
+    """
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(output_data.items()):
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(_json.dumps(key) + b": ")
+            if isinstance(value, list) and value:
+                f.write(b"[")
+                for j, item in enumerate(value):
+                    f.write(b",\n    " if j else b"\n    ")
+                    # JSON strings escape newlines, so every raw newline is indentation
+                    f.write(_json.dumps(item, indent=True).replace(b"\n", b"\n    "))
+                f.write(b"\n  ]")
+            else:
+                f.write(_json.dumps(value, indent=True).replace(b"\n", b"\n  "))
+        f.write(b"\n}")
+
+
+def _write_pickle(path: Path, output_data: Dict[str, Any]) -> None:
+    """Pickle output_data through gzip straight into the file, without an intermediate bytes copy"""
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=_BIN_COMPRESS_LEVEL, mtime=0) as f:
+            # File contents are str, which pickle always serializes in-band, so
+            # protocol 5 out-of-band buffers would have nothing to hand off
+            pickle.dump(output_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_binary_output(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read a .bin output; detects the gzip header, so uncompressed files from older versions still load"""
+    with open(path, "rb") as f:
+        compressed = f.read(2) == _GZIP_MAGIC
+        f.seek(0)
+        if compressed:
+            with gzip.GzipFile(fileobj=f, mode="rb") as gz:
+                return pickle.load(gz)
+        return pickle.load(f)
+
 
 class OutputWriter:
     def __init__(self, logger: AnalyzerLogger):
@@ -26,29 +75,29 @@ class OutputWriter:
             output_dir_path = Path(output_dir)
             output_dir_path.mkdir(parents=True, exist_ok=True)
 
-            import asyncio
             output_data = {
                 "metadata": metadata,
                 "files": files,
-                "generated_at": asyncio.get_running_loop().time(),
+                "generated_at": time.time(),
                 "version": Config.VERSION,
             }
 
-            output_paths: Dict[str, str] = {}
-
+            writers = {}
             if output_format in ("json", "both"):
-                json_path = output_dir_path / f"{filename_prefix}.json"
-                async with aiofiles.open(json_path, "w", encoding="utf-8") as f:
-                    await f.write(json.dumps(output_data, indent=2, ensure_ascii=False))
-                output_paths["json"] = str(json_path)
-                self._logger.debug(f"Saved JSON output: {json_path}")
-
+                writers["json"] = (_write_json, output_dir_path / f"{filename_prefix}.json")
             if output_format in ("bin", "both"):
-                bin_path = output_dir_path / f"{filename_prefix}.bin"
-                async with aiofiles.open(bin_path, "wb") as f:
-                    await f.write(pickle.dumps(output_data))
-                output_paths["bin"] = str(bin_path)
-                self._logger.debug(f"Saved binary output: {bin_path}")
+                writers["bin"] = (_write_pickle, output_dir_path / f"{filename_prefix}.bin")
+
+            # Each output is serialized and written in its own worker thread, so the
+            # event loop never blocks and "both" writes the two files concurrently
+            await asyncio.gather(
+                *(asyncio.to_thread(write, path, output_data) for write, path in writers.values())
+            )
+
+            output_paths: Dict[str, str] = {}
+            for output_type, (_, path) in writers.items():
+                output_paths[output_type] = str(path)
+                self._logger.debug(f"Saved {output_type.upper()} output: {path}")
 
             return output_paths
         except Exception as e:
@@ -4,6 +4,27 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
+from .. import _json
+
+# Manifest and import patterns, compiled once for every file they are run against
+_REQUIREMENT_NAME = re.compile(r"^([a-zA-Z0-9_-]+)")
+_SETUP_INSTALL_REQUIRES = re.compile(r"install_requires\s*=\s*\[(.*?)\]", re.DOTALL)
+_PYPROJECT_DEPENDENCIES = re.compile(r"dependencies\s*=\s*\[(.*?)\]", re.DOTALL)
+_QUOTED_PACKAGE_NAME = re.compile(r'["\']([a-zA-Z0-9_-]+)')
+_PYTHON_IMPORT = re.compile(r"(?:^from\s+([a-zA-Z0-9_]+)|^import\s+([a-zA-Z0-9_]+))", re.MULTILINE)
+_JS_IMPORTS = [
+    re.compile(r'import.*?from\s+[\'"]([^\'"]+)[\'"]'),
+    re.compile(r'require\([\'"]([^\'"]+)[\'"]\)'),
+    re.compile(r'import\([\'"]([^\'"]+)[\'"]\)'),
+    re.compile(r'import\s+[\'"]([^\'"]+)[\'"]'),
+]
+_MAVEN_ARTIFACT = re.compile(r"<artifactId>(.*?)</artifactId>")
+_GRADLE_DEPENDENCY = re.compile(r'(?:implementation|compile|api)\s+[\'"]([^:]+):([^:\'"]+)')
+_GO_REQUIRE = re.compile(r"require\s+([^\s]+)")
+_GO_IMPORT = re.compile(r'import\s+(?:"([^"]+)"|`([^`]+)`)')
+_CARGO_DEPENDENCIES = re.compile(r"\[dependencies\](.*?)(?:\[|$)", re.DOTALL)
+_CSPROJ_PACKAGE = re.compile(r'<PackageReference\s+Include="([^"]+)"')
+
 
 class DependencyExtractor:
     def __init__(self):
@@ -41,21 +62,21 @@ class DependencyExtractor:
             for line in content.split("\n"):
                 line = line.strip()
                 if line and not line.startswith("#") and not line.startswith("-"):
-                    m = re.match(r"^([a-zA-Z0-9_-]+)", line)
+                    m = _REQUIREMENT_NAME.match(line)
                     if m:
                         deps.add(m.group(1))
         elif filename == "setup.py":
-            m = re.search(r"install_requires\s*=\s*\[(.*?)\]", content, re.DOTALL)
+            m = _SETUP_INSTALL_REQUIRES.search(content)
             if m:
-                for d in re.findall(r'["\']([a-zA-Z0-9_-]+)', m.group(1)):
+                for d in _QUOTED_PACKAGE_NAME.findall(m.group(1)):
                     deps.add(d)
         elif filename == "pyproject.toml":
-            m = re.search(r"dependencies\s*=\s*\[(.*?)\]", content, re.DOTALL)
+            m = _PYPROJECT_DEPENDENCIES.search(content)
             if m:
-                for d in re.findall(r'["\']([a-zA-Z0-9_-]+)', m.group(1)):
+                for d in _QUOTED_PACKAGE_NAME.findall(m.group(1)):
                     deps.add(d)
         elif filename.endswith(".py"):
-            for match in re.findall(r"(?:^from\s+([a-zA-Z0-9_]+)|^import\s+([a-zA-Z0-9_]+))", content, re.MULTILINE):
+            for match in _PYTHON_IMPORT.findall(content):
                 dep = match[0] or match[1]
                 if dep and not dep.startswith("_"):
                     deps.add(dep)
@@ -68,21 +89,15 @@ class DependencyExtractor:
         filename = Path(path).name.lower()
         if filename == "package.json":
             try:
-                package_data = json.loads(content)
+                package_data = _json.loads(content)
                 for dep_type in ("dependencies", "devDependencies", "peerDependencies"):
                     if dep_type in package_data:
                         deps.update(package_data[dep_type].keys())
             except json.JSONDecodeError:
                 pass
         elif filename.endswith((".js", ".ts", ".jsx", ".tsx")):
-            patterns = [
-                r'import.*?from\s+[\'"]([^\'"]+)[\'"]',
-                r'require\([\'"]([^\'"]+)[\'"]\)',
-                r'import\([\'"]([^\'"]+)[\'"]\)',
-                r'import\s+[\'"]([^\'"]+)[\'"]',
-            ]
-            for pattern in patterns:
-                for match in re.findall(pattern, content):
+            for pattern in _JS_IMPORTS:
+                for match in pattern.findall(content):
                     if not match.startswith("."):
                         base = match.split("/")[0]
                         if base.startswith("@"):
@@ -97,10 +112,10 @@ class DependencyExtractor:
         content = file_info.get("content", "")
         filename = Path(path).name.lower()
         if filename == "pom.xml":
-            for m in re.findall(r"<artifactId>(.*?)</artifactId>", content):
+            for m in _MAVEN_ARTIFACT.findall(content):
                 deps.add(m)
         elif filename in ("build.gradle", "build.gradle.kts"):
-            for m in re.findall(r'(?:implementation|compile|api)\s+[\'"]([^:]+):([^:\'"]+)', content):
+            for m in _GRADLE_DEPENDENCY.findall(content):
                 deps.add(m[1])
         return deps
 
@@ -110,10 +125,10 @@ class DependencyExtractor:
         content = file_info.get("content", "")
         filename = Path(path).name.lower()
         if filename == "go.mod":
-            for m in re.findall(r"require\s+([^\s]+)", content):
+            for m in _GO_REQUIRE.findall(content):
                 deps.add(m)
         elif filename.endswith(".go"):
-            for m in re.findall(r'import\s+(?:"([^"]+)"|`([^`]+)`)', content):
+            for m in _GO_IMPORT.findall(content):
                 deps.add(m[0] or m[1])
         return deps
 
@@ -123,7 +138,7 @@ class DependencyExtractor:
         content = file_info.get("content", "")
         filename = Path(path).name.lower()
         if filename == "cargo.toml":
-            m = re.search(r"\[dependencies\](.*?)(?:\[|$)", content, re.DOTALL)
+            m = _CARGO_DEPENDENCIES.search(content)
             if m:
                 for line in m.group(1).split("\n"):
                     line = line.strip()
@@ -137,6 +152,6 @@ class DependencyExtractor:
         content = file_info.get("content", "")
         filename = Path(path).name.lower()
         if filename.endswith(".csproj"):
-            for m in re.findall(r'<PackageReference\s+Include="([^"]+)"', content):
+            for m in _CSPROJ_PACKAGE.findall(content):
                 deps.add(m)
         return deps
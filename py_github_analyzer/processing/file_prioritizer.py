@@ -1,12 +1,45 @@
 # py_github_analyzer/processing/file_prioritizer.py
+import os
 import re
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from ..config import Config
 from ..logger import AnalyzerLogger
 from .language_detector import LanguageDetector
 
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+# Scoring is pure-Python regex work that holds the GIL, so big batches go to processes
+_PARALLEL_SCORING_MIN_FILES = 2000
+_CHUNKS_PER_WORKER = 4
+
+_scoring_pool: Optional["ProcessPoolExecutor"] = None
+_worker_prioritizer: Optional["FilePrioritizer"] = None
+
+
+def _get_scoring_pool() -> "ProcessPoolExecutor":
+    """Process pool shared by every prioritizer, created on first use"""
+    global _scoring_pool
+    if _scoring_pool is None:
+        # multiprocessing costs a few ms to import; only large repositories need it
+        from concurrent.futures import ProcessPoolExecutor
+
+        _scoring_pool = ProcessPoolExecutor()
+    return _scoring_pool
+
+
+def _score_chunk(
+    files: List[Dict[str, Any]], target_language: str, context: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Worker entry point; keeps one prioritizer per process"""
+    global _worker_prioritizer
+    if _worker_prioritizer is None:
+        _worker_prioritizer = FilePrioritizer()
+    return _worker_prioritizer._score_files(files, target_language, context)
+
 
 class FilePrioritizer:
     def __init__(self, logger: Optional[AnalyzerLogger] = None):
@@ -33,6 +66,17 @@ class FilePrioritizer:
         context = context or {}
         if not target_language:
             target_language = self._language_detector.detect_primary_language(files)
+        workers = os.cpu_count() or 1
+        if len(files) >= _PARALLEL_SCORING_MIN_FILES and workers > 1:
+            prioritized = self._score_files_parallel(files, target_language, context, workers)
+        else:
+            prioritized = self._score_files(files, target_language, context)
+        prioritized.sort(key=lambda x: x.get("priority", 100), reverse=True)
+        return prioritized
+
+    def _score_files(
+        self, files: List[Dict[str, Any]], target_language: str, context: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         prioritized = []
         for file_info in files:
             try:
@@ -41,9 +85,27 @@ class FilePrioritizer:
                 self._logger.warning(f"Error prioritizing {file_info.get('path', 'unknown')}: {e}")
                 file_info["priority"] = 100
                 prioritized.append(file_info)
-        prioritized.sort(key=lambda x: x.get("priority", 100), reverse=True)
         return prioritized
 
+    def _score_files_parallel(
+        self,
+        files: List[Dict[str, Any]],
+        target_language: str,
+        context: Dict[str, Any],
+        workers: int,
+    ) -> List[Dict[str, Any]]:
+        # Contiguous chunks joined in order keep ties sorted exactly as the serial path does
+        chunk_size = -(-len(files) // (workers * _CHUNKS_PER_WORKER))
+        chunks = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
+        try:
+            results = _get_scoring_pool().map(
+                _score_chunk, chunks, repeat(target_language), repeat(context)
+            )
+            return [file_info for chunk in results for file_info in chunk]
+        except Exception as e:
+            self._logger.debug(f"Parallel scoring unavailable, scoring serially: {e}")
+            return self._score_files(files, target_language, context)
+
     def _calculate_priority_score(
         self, file_info: Dict[str, Any], target_language: str, context: Dict[str, Any]
     ) -> Dict[str, Any]:
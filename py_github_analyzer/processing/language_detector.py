@@ -2,7 +2,174 @@
 import re
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]|()")
+
+
+def _literal_of(pattern: str) -> Optional[str]:
+    """The text a pattern matches if it is a plain literal (escapes allowed), else None"""
+    chars = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            # \s, \w, \b and friends are character classes, not literals
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                return None
+            chars.append(pattern[i + 1])
+            i += 2
+            continue
+        if char in _REGEX_METACHARACTERS:
+            return None
+        chars.append(char)
+        i += 1
+    return "".join(chars)
+
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """
+    Longest literal run every match of pattern must contain, or None when there is
+    no usable one (top-level alternation, or nothing of 3+ characters). Groups,
+    character classes and quantified characters are treated as breaks in the run
+    """
+    runs = []
+    run: List[str] = []
+    depth = 0
+    i = 0
+    n = len(pattern)
+    while i < n:
+        char = pattern[i]
+        token: Optional[str] = None
+        if char == "\\":
+            if i + 1 < n and not pattern[i + 1].isalnum():
+                token = pattern[i + 1]
+            i += 2
+        elif char == "[":
+            # Skip the whole character class, including escaped "]"
+            i += 1
+            while i < n and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+        elif char == "{":
+            # Repetition counts are not literal text
+            i = pattern.find("}", i) + 1 or n
+        elif char == "|" and depth == 0:
+            return None
+        elif char in _REGEX_METACHARACTERS:
+            depth += (char == "(") - (char == ")")
+            i += 1
+        else:
+            token = char
+            i += 1
+
+        quantifier = pattern[i] if i < n else ""
+        if quantifier in ("?", "*", "{"):
+            token = None
+        if token is not None and depth == 0:
+            run.append(token)
+        if token is None or depth != 0 or quantifier == "+":
+            runs.append("".join(run))
+            run = []
+    runs.append("".join(run))
+    longest = max(runs, key=len)
+    return longest if len(longest) >= 3 else None
+
+
+# (lowercased literal, lowercased required literal, compiled pattern); a plain
+# literal pattern has no separate required literal
+_CountedPattern = Tuple[Optional[str], Optional[str], "re.Pattern[str]"]
+
+
+def _counted_pattern(pattern: str, flags: int) -> _CountedPattern:
+    literal = _literal_of(pattern)
+    if literal is not None:
+        return literal.lower(), None, re.compile(pattern, flags)
+    required = _required_literal(pattern)
+    return None, (required.lower() if required is not None else None), re.compile(pattern, flags)
+
+
+def _count_matches(pattern: _CountedPattern, text: str, lowered: Optional[str]) -> int:
+    """
+    Case-insensitive match count; plain literals use str.count on the lowercased
+    text, which equals findall under IGNORECASE when the text is ASCII, and other
+    patterns are skipped when their required literal is absent. lowered is None
+    for non-ASCII text, where Unicode case folding needs the regex engine
+    """
+    literal, required, regex = pattern
+    if lowered is not None:
+        if literal is not None:
+            return lowered.count(literal)
+        if required is not None and required not in lowered:
+            return 0
+    return len(regex.findall(text))
+
+
+def _ascii_lower(text: str) -> Optional[str]:
+    return text.lower() if text.isascii() else None
+
+
+# Patterns are compiled once at import; the detectors run them for every file
+_PYTHON_SHEBANG = re.compile(r"^#!/usr/bin/env python|^#!/usr/bin/python|^#.*python")
+_SHELL_SHEBANG = re.compile(r"^#!/bin/bash|^#!/bin/sh")
+_NODE_SHEBANG = re.compile(r"^#!/usr/bin/env node")
+
+_CONTENT_PATTERN_SOURCES = {
+    "python": [r"def\s+\w+\s*\(", r"import\s+\w+", r"from\s+\w+\s+import", r"class\s+\w+"],
+    "javascript": [r"function\s+\w+\s*\(", r"var\s+\w+\s*=", r"let\s+\w+\s*=", r"const\s+\w+\s*=", r"require\s*\("],
+    "typescript": [r"interface\s+\w+", r"type\s+\w+\s*=", r"enum\s+\w+", r":\s*(string|number|boolean)"],
+    "java": [r"public\s+class\s+\w+", r"public\s+static\s+void\s+main", r"import\s+java\."],
+    "cpp": [r"#include\s*<\w+>", r"using\s+namespace", r"std::", r"int\s+main\s*\("],
+    "csharp": [r"using\s+System", r"namespace\s+\w+", r"public\s+class\s+\w+", r"Console\.WriteLine"],
+    "go": [r"package\s+\w+", r"import\s*\(", r"func\s+\w+\s*\(", r"var\s+\w+\s+\w+"],
+    "rust": [r"fn\s+\w+\s*\(", r"use\s+\w+", r"struct\s+\w+", r"impl\s+\w+"],
+    "php": [r"<\?php", r"\$\w+\s*=", r"function\s+\w+\s*\(", r"class\s+\w+"],
+    "ruby": [r"def\s+\w+", r"class\s+\w+", r"require\s+", r"puts\s+"],
+    "html": [r"<[^>]+>.*</\w+>"],
+    "css": [r"[\w-]+\s*:\s*[^;]+\s*;", r"@media", r"\.[\w-]+\s*\{", r"#[\w-]+\s*\{"],
+    "json": [r"^\s*{.*}\s*$", r"^\s*\[.*\]\s*$"],
+    "yaml": [r"^\s*\w+\s*:", r"^\s*-\s+\w+"],
+    "xml": [r"<\?xml", r"<\w+.*?>.*</\w+>"],
+    "sql": [r"SELECT\s+", r"INSERT\s+INTO", r"UPDATE\s+", r"DELETE\s+FROM"],
+    "dockerfile": [r"FROM\s+", r"RUN\s+", r"COPY\s+", r"WORKDIR\s+"],
+}
+_CONTENT_PATTERNS = {
+    language: [_counted_pattern(p, re.IGNORECASE | re.MULTILINE) for p in sources]
+    for language, sources in _CONTENT_PATTERN_SOURCES.items()
+}
+
+_COMPLEXITY_PATTERN_SOURCES = {
+    "python": [r"\bif\b", r"\belse\b", r"\belif\b", r"\bfor\b", r"\bwhile\b", r"\btry\b", r"\bexcept\b", r"\bwith\b", r"\bclass\b", r"\bdef\b"],
+    "javascript": [r"\bif\b", r"\belse\b", r"\bfor\b", r"\bwhile\b", r"\bswitch\b", r"\bcatch\b", r"\bfunction\b", r"\bclass\b", r"=>", r"\?.*:"],
+    "typescript": [r"\bif\b", r"\belse\b", r"\bfor\b", r"\bwhile\b", r"\bswitch\b", r"\bcatch\b", r"\bfunction\b", r"\bclass\b", r"=>", r"\?.*:"],
+    "java": [r"\bif\b", r"\belse\b", r"\bfor\b", r"\bwhile\b", r"\bswitch\b", r"\bcatch\b", r"\bclass\b", r"\bpublic\b", r"\bprivate\b"],
+    "cpp": [r"\bif\b", r"\belse\b", r"\bfor\b", r"\bwhile\b", r"\bswitch\b", r"\bcatch\b", r"\bclass\b", r"\bstruct\b", r"\btemplate\b"],
+}
+_KEYWORD_PATTERN = re.compile(r"\\b(\w+)\\b")
+
+
+def _fuse_complexity_patterns(sources: List[str]) -> List["re.Pattern[str]"]:
+    """
+    Merge the whole-word keyword patterns into one alternation so the content is
+    scanned once for all of them. Two whole-word matches can never overlap, so the
+    total count is unchanged; anything else (=>, ?...:) keeps its own pattern
+    """
+    keywords = []
+    others = []
+    for source in sources:
+        match = _KEYWORD_PATTERN.fullmatch(source)
+        if match:
+            keywords.append(match.group(1))
+        else:
+            others.append(source)
+    fused = [r"\b(?:" + "|".join(keywords) + r")\b"] if keywords else []
+    return [re.compile(p, re.IGNORECASE) for p in fused + others]
+
+
+_COMPLEXITY_PATTERNS = {
+    language: _fuse_complexity_patterns(sources)
+    for language, sources in _COMPLEXITY_PATTERN_SOURCES.items()
+}
 
 
 class LanguageDetector:
@@ -27,6 +194,16 @@ class LanguageDetector:
             },
         }
 
+        # Framework patterns carry no anchors, so one compiled form serves both the
+        # filename check and the content scan
+        self._framework_regexes = {
+            language: {
+                framework: [_counted_pattern(p, re.IGNORECASE | re.MULTILINE) for p in patterns]
+                for framework, patterns in frameworks.items()
+            }
+            for language, frameworks in self.framework_patterns.items()
+        }
+
         self.code_extensions = {
             ".py", ".js", ".ts", ".tsx", ".jsx", ".java", ".cpp", ".c", ".h", ".hpp",
             ".cs", ".go", ".rs", ".php", ".rb", ".swift", ".kt", ".scala", ".clj",
@@ -79,34 +256,16 @@ class LanguageDetector:
             if ext_lang != "unknown":
                 return ext_lang
         content_sample = content[:1000]
-        if re.search(r"^#!/usr/bin/env python|^#!/usr/bin/python|^#.*python", content):
+        sample_lower = _ascii_lower(content_sample)
+        if _PYTHON_SHEBANG.search(content):
             return "python"
-        elif re.search(r"^#!/bin/bash|^#!/bin/sh", content):
+        elif _SHELL_SHEBANG.search(content):
             return "shell"
-        elif re.search(r"^#!/usr/bin/env node", content):
+        elif _NODE_SHEBANG.search(content):
             return "javascript"
-        patterns = {
-            "python": [r"def\s+\w+\s*\(", r"import\s+\w+", r"from\s+\w+\s+import", r"class\s+\w+"],
-            "javascript": [r"function\s+\w+\s*\(", r"var\s+\w+\s*=", r"let\s+\w+\s*=", r"const\s+\w+\s*=", r"require\s*\("],
-            "typescript": [r"interface\s+\w+", r"type\s+\w+\s*=", r"enum\s+\w+", r":\s*(string|number|boolean)"],
-            "java": [r"public\s+class\s+\w+", r"public\s+static\s+void\s+main", r"import\s+java\."],
-            "cpp": [r"#include\s*<\w+>", r"using\s+namespace", r"std::", r"int\s+main\s*\("],
-            "csharp": [r"using\s+System", r"namespace\s+\w+", r"public\s+class\s+\w+", r"Console\.WriteLine"],
-            "go": [r"package\s+\w+", r"import\s*\(", r"func\s+\w+\s*\(", r"var\s+\w+\s+\w+"],
-            "rust": [r"fn\s+\w+\s*\(", r"use\s+\w+", r"struct\s+\w+", r"impl\s+\w+"],
-            "php": [r"<\?php", r"\$\w+\s*=", r"function\s+\w+\s*\(", r"class\s+\w+"],
-            "ruby": [r"def\s+\w+", r"class\s+\w+", r"require\s+", r"puts\s+"],
-            "html": [r"<[^>]+>.*</\w+>"],
-            "css": [r"[\w-]+\s*:\s*[^;]+\s*;", r"@media", r"\.[\w-]+\s*\{", r"#[\w-]+\s*\{"],
-            "json": [r"^\s*{.*}\s*$", r"^\s*\[.*\]\s*$"],
-            "yaml": [r"^\s*\w+\s*:", r"^\s*-\s+\w+"],
-            "xml": [r"<\?xml", r"<\w+.*?>.*</\w+>"],
-            "sql": [r"SELECT\s+", r"INSERT\s+INTO", r"UPDATE\s+", r"DELETE\s+FROM"],
-            "dockerfile": [r"FROM\s+", r"RUN\s+", r"COPY\s+", r"WORKDIR\s+"],
-        }
         scores: Dict[str, int] = {}
-        for language, lang_patterns in patterns.items():
-            score = sum(len(re.findall(p, content_sample, re.IGNORECASE | re.MULTILINE)) for p in lang_patterns)
+        for language, lang_patterns in _CONTENT_PATTERNS.items():
+            score = sum(_count_matches(p, content_sample, sample_lower) for p in lang_patterns)
             if score > 0:
                 scores[language] = score
         return max(scores.items(), key=lambda x: x[1])[0] if scores else "text"
@@ -131,15 +290,8 @@ class LanguageDetector:
         total_lines = len(lines)
         if total_lines == 0:
             return 1.0
-        complexity_indicators = {
-            "python": [r"\bif\b", r"\belse\b", r"\belif\b", r"\bfor\b", r"\bwhile\b", r"\btry\b", r"\bexcept\b", r"\bwith\b", r"\bclass\b", r"\bdef\b"],
-            "javascript": [r"\bif\b", r"\belse\b", r"\bfor\b", r"\bwhile\b", r"\bswitch\b", r"\bcatch\b", r"\bfunction\b", r"\bclass\b", r"=>", r"\?.*:"],
-            "typescript": [r"\bif\b", r"\belse\b", r"\bfor\b", r"\bwhile\b", r"\bswitch\b", r"\bcatch\b", r"\bfunction\b", r"\bclass\b", r"=>", r"\?.*:"],
-            "java": [r"\bif\b", r"\belse\b", r"\bfor\b", r"\bwhile\b", r"\bswitch\b", r"\bcatch\b", r"\bclass\b", r"\bpublic\b", r"\bprivate\b"],
-            "cpp": [r"\bif\b", r"\belse\b", r"\bfor\b", r"\bwhile\b", r"\bswitch\b", r"\bcatch\b", r"\bclass\b", r"\bstruct\b", r"\btemplate\b"],
-        }
-        patterns = complexity_indicators.get(language, complexity_indicators["python"])
-        complexity_count = sum(len(re.findall(p, content, re.IGNORECASE)) for p in patterns)
+        patterns = _COMPLEXITY_PATTERNS.get(language, _COMPLEXITY_PATTERNS["python"])
+        complexity_count = sum(len(p.findall(content)) for p in patterns)
         complexity_ratio = complexity_count / total_lines
         return min(1.0 + (complexity_ratio * 9.0), 10.0)
 
@@ -220,7 +372,7 @@ class LanguageDetector:
         if primary_language not in self.framework_patterns:
             return []
         framework_scores: Dict[str, int] = defaultdict(int)
-        framework_patterns = self.framework_patterns[primary_language]
+        framework_patterns = self._framework_regexes[primary_language]
         for file_info in files:
             path = file_info.get("path", "")
             content = file_info.get("content", "")
@@ -228,12 +380,14 @@ class LanguageDetector:
                 continue
             filename = Path(path).name.lower()
             content_sample = content[:5000]
+            filename_lower = _ascii_lower(filename)
+            sample_lower = _ascii_lower(content_sample)
             for framework, patterns in framework_patterns.items():
                 score = 0
                 for pattern in patterns:
-                    if re.search(pattern, filename, re.IGNORECASE):
+                    if _count_matches(pattern, filename, filename_lower):
                         score += 2
-                    score += len(re.findall(pattern, content_sample, re.IGNORECASE | re.MULTILINE))
+                    score += _count_matches(pattern, content_sample, sample_lower)
                 if score > 0:
                     framework_scores[framework] += score
         detected = [fw for fw, score in framework_scores.items() if score >= 3]
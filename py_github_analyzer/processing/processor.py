@@ -10,6 +10,15 @@ from .dependency_extractor import DependencyExtractor
 from .file_prioritizer import FilePrioritizer
 from .language_detector import LanguageDetector
 
+_BINARY_SUFFIXES = frozenset({
+    ".exe", ".dll", ".so", ".dylib", ".bin", ".img", ".iso",
+    ".zip", ".tar", ".gz", ".rar", ".7z",
+    ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".ico",
+    ".mp3", ".mp4", ".avi", ".mov",
+    ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
+})
+_IMPORTANT_EMPTY_FILES = frozenset({"__init__.py", ".gitkeep", ".keep"})
+
 
 class FileProcessor:
     def __init__(self, logger: Optional[AnalyzerLogger] = None):
@@ -73,41 +82,42 @@ class FileProcessor:
         analysis_info = self._generate_analysis_info(selected_files, languages, frameworks, dependencies, primary_language)
         return selected_files, analysis_info
 
+    @staticmethod
+    def should_include(path: str, size: int) -> bool:
+        """
+        The part of basic filtering that needs only a path and a size, so archive
+        readers can drop members before reading their bodies
+        """
+        from ..utils import ValidationUtils
+        if not ValidationUtils.validate_file_path(path):
+            return False
+        if size > Config.MAX_FILE_SIZE or Config.should_skip_file(path):
+            return False
+        name = Path(path).name.lower()
+        if Path(name).suffix in _BINARY_SUFFIXES:
+            return False
+        return size > 0 or name in _IMPORTANT_EMPTY_FILES
+
     def _apply_basic_filtering(self, files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         valid = []
         for file_info in files:
             path = file_info.get("path", "")
             size = file_info.get("size", 0)
             content = file_info.get("content", "")
-            if not self._is_valid_path(path):
-                continue
             if size > Config.MAX_FILE_SIZE:
                 self._logger.debug(f"Skipping oversized file: {path} ({size} bytes)")
                 continue
-            if Config.should_skip_file(path):
+            if not self.should_include(path, size):
                 continue
             if self._is_likely_binary(path, content):
                 continue
-            if size == 0 and not self._is_important_empty_file(path):
-                continue
             valid.append(file_info)
         return valid
 
-    def _is_valid_path(self, path: str) -> bool:
-        from ..utils import ValidationUtils
-        return ValidationUtils.validate_file_path(path)
-
     def _is_likely_binary(self, path: str, content: str) -> bool:
         if not path:
             return False
-        binary_exts = {
-            ".exe", ".dll", ".so", ".dylib", ".bin", ".img", ".iso",
-            ".zip", ".tar", ".gz", ".rar", ".7z",
-            ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".ico",
-            ".mp3", ".mp4", ".avi", ".mov",
-            ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
-        }
-        if Path(path).suffix.lower() in binary_exts:
+        if Path(path).suffix.lower() in _BINARY_SUFFIXES:
             return True
         if content:
             if "\x00" in content:
@@ -121,9 +131,6 @@ class FileProcessor:
                 return True
         return False
 
-    def _is_important_empty_file(self, path: str) -> bool:
-        return Path(path).name.lower() in {"__init__.py", ".gitkeep", ".keep"}
-
     def _perform_smart_selection(
         self, prioritized_files: List[Dict[str, Any]], context: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
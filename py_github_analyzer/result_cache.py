@@ -0,0 +1,71 @@
+# py_github_analyzer/result_cache.py
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import _json
+from .config import Config
+from .logger import AnalyzerLogger
+from .utils import FileUtils
+
+_MAX_CACHED_RESULTS = 50
+
+
+class ResultCache:
+    """
+    On-disk cache of finished analyses, one JSON file per repository snapshot
+    Entries are keyed by the default branch commit SHA, so a new commit simply
+    misses; the least recently used entries are evicted by modification time
+    """
+
+    def __init__(
+        self,
+        logger: AnalyzerLogger,
+        directory: Optional[Path] = None,
+        max_entries: int = _MAX_CACHED_RESULTS,
+    ):
+        self._logger = logger
+        self._directory = directory or FileUtils.user_cache_dir() / "results"
+        self._max_entries = max_entries
+
+    @staticmethod
+    def make_key(owner: str, repo: str, commit_sha: str, method: str) -> str:
+        raw = f"{owner}/{repo}@{commit_sha}@{method}@{Config.VERSION}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._directory / f"{key}.json"
+        try:
+            data = _json.loads(path.read_bytes())
+            # Touch the entry so eviction treats it as recently used
+            os.utime(path)
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                self._logger.debug(f"Ignoring unreadable cached result {path}: {e}")
+            return None
+        if not isinstance(data, dict) or "metadata" not in data or "files" not in data:
+            return None
+        return data
+
+    def store(self, key: str, data: Dict[str, Any]) -> None:
+        path = self._directory / f"{key}.json"
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            tmp = tempfile.NamedTemporaryFile(dir=self._directory, suffix=".tmp", delete=False)
+            try:
+                with tmp:
+                    tmp.write(_json.dumps(data))
+                os.replace(tmp.name, path)
+            except BaseException:
+                os.unlink(tmp.name)  # _evict only sweeps *.json, so nothing else would
+                raise
+            self._evict()
+        except (OSError, TypeError, ValueError) as e:
+            self._logger.debug(f"Could not cache analysis result: {e}")
+
+    def _evict(self) -> None:
+        entries = sorted(self._directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[: max(len(entries) - self._max_entries, 0)]:
+            stale.unlink(missing_ok=True)
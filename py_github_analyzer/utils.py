@@ -12,7 +12,7 @@ from typing import Dict, List, Union, Callable, Optional
 import tempfile
 import shutil
 from contextlib import contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
 
 from .config import Config
 from .exceptions import ValidationError, CompressionError
@@ -29,6 +29,13 @@ class URLParser:
     @classmethod
     def parse_github_url(cls, url: str) -> Dict[str, str]:
         """Parse GitHub URL and extract owner, repo, and optional path"""
+        # The same URL is parsed by the analyzer, metadata generator and CLI;
+        # each caller gets its own copy of the cached result
+        return dict(cls._parse_github_url(url))
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _parse_github_url(cls, url: str) -> Dict[str, str]:
         if not url:
             raise ValidationError("Empty URL provided")
 
@@ -309,6 +316,12 @@ class FileUtils:
         except (FileNotFoundError, PermissionError, OSError):
             return False
 
+    @staticmethod
+    def user_cache_dir() -> Path:
+        """Per-user cache directory for the analyzer ($XDG_CACHE_HOME or ~/.cache)"""
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return Path(cache_home) / "py-github-analyzer"
+
     @staticmethod
     def normalize_path(path: str) -> str:
         """Normalize file path for cross-platform compatibility"""
@@ -76,6 +76,25 @@ class TestAsyncRateLimitManager:
         assert manager.remaining == 4999
         assert manager.reset_time == 1640995200
 
+    @pytest.mark.asyncio
+    async def test_update_from_headers_tracks_core_only(self):
+        """core 이외 리소스의 헤더는 무시하고 갱신 시각을 기록하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncRateLimitManager
+
+        manager = AsyncRateLimitManager("test_token")
+        assert manager.updated_at is None
+
+        await manager.update_from_headers({"x-ratelimit-resource": "search", "x-ratelimit-remaining": "9"})
+        assert manager.remaining == 5000
+        assert manager.updated_at is None
+
+        await manager.update_from_headers({"x-ratelimit-resource": "core", "x-ratelimit-remaining": "4000"})
+        assert manager.remaining == 4000
+        assert manager.updated_at is not None
+
     @pytest.mark.asyncio
     async def test_check_rate_limit(self):
         """Rate limit 체크 테스트"""
@@ -111,6 +130,173 @@ class TestAsyncRateLimitManager:
         await manager.consume_calls(200)
         assert manager.remaining == 0
 
+    @pytest.mark.asyncio
+    async def test_execute_api_call_runs_concurrently(self):
+        """API 호출이 락으로 직렬화되지 않고 동시에 실행되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncRateLimitManager
+
+        manager = AsyncRateLimitManager("test_token")
+        in_flight = 0
+        max_in_flight = 0
+
+        async def api_call():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = Mock()
+            response.headers = {}
+            return response
+
+        await asyncio.gather(*(manager.execute_api_call(api_call) for _ in range(5)))
+
+        assert max_in_flight == 5
+        assert manager.remaining == 4995
+
+
+class TestSlidingWindowLimiter:
+    """_SlidingWindowLimiter 클래스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_oldest_bucket(self):
+        """윈도우가 가득 차면 가장 오래된 버킷이 빠질 때까지 대기하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import _SlidingWindowLimiter
+
+        clock = [600.0]
+
+        async def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with patch('time.time', side_effect=lambda: clock[0]), \
+             patch('asyncio.sleep', side_effect=fake_sleep) as mock_sleep:
+            limiter = _SlidingWindowLimiter(max_calls=2, buckets=3, bucket_seconds=10)
+            await limiter.acquire()
+            clock[0] = 615.0
+            await limiter.acquire()
+            mock_sleep.assert_not_called()
+
+            # 600초 버킷이 630초에 윈도우에서 빠질 때까지 대기
+            await limiter.acquire()
+            assert clock[0] == 630.0
+            assert limiter._total == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_gives_up_after_max_wait(self):
+        """윈도우가 계속 가득 차 있으면 경고를 남기고 최대 대기 후 예외를 발생시키는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import _SlidingWindowLimiter, _MAX_RATE_LIMIT_WAIT
+        from py_github_analyzer.exceptions import RateLimitExceededError
+
+        clock = [600.0]
+
+        async def fake_sleep(seconds):
+            clock[0] += seconds
+
+        logger = Mock()
+        with patch('time.time', side_effect=lambda: clock[0]), \
+             patch('asyncio.sleep', side_effect=fake_sleep):
+            limiter = _SlidingWindowLimiter(max_calls=1, logger=logger)
+            await limiter.acquire()
+            with pytest.raises(RateLimitExceededError):
+                await limiter.acquire(reset_time=4200)
+
+        assert clock[0] - 600.0 <= _MAX_RATE_LIMIT_WAIT
+        logger.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_acquire_forgets_calls_before_reset(self):
+        """GitHub 쿼터 리셋 시각이 지나면 그 이전 호출을 윈도우에서 제외하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import _SlidingWindowLimiter
+
+        clock = [600.0]
+        with patch('time.time', side_effect=lambda: clock[0]), \
+             patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            limiter = _SlidingWindowLimiter(max_calls=1)
+            await limiter.acquire()
+            clock[0] = 700.0
+            await limiter.acquire(reset_time=690)
+            mock_sleep.assert_not_called()
+            assert limiter._total == 1
+
+    @pytest.mark.asyncio
+    async def test_release_returns_slot(self):
+        """release()로 기록한 호출을 되돌리는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import _SlidingWindowLimiter
+
+        limiter = _SlidingWindowLimiter(max_calls=1)
+        bucket = await limiter.acquire()
+        limiter.release(bucket)
+        assert limiter._total == 0
+        await limiter.acquire()
+        assert limiter._total == 1
+
+
+def test_response_json_parsing():
+    """orjson 사용 여부와 관계없이 응답 JSON 파싱 결과가 같은지 테스트"""
+    if not HTTPX_AVAILABLE:
+        pytest.skip("httpx not available")
+
+    from py_github_analyzer import async_github_client
+
+    response = httpx.Response(200, json={"name": "repo", "items": [1, 2]})
+    expected = {"name": "repo", "items": [1, 2]}
+
+    assert async_github_client._response_json(response) == expected
+    with patch.object(async_github_client, "ORJSON_AVAILABLE", False):
+        assert async_github_client._response_json(response) == expected
+
+    # 원시 바이트가 없는 응답 객체는 response.json()으로 처리
+    mock_response = Mock()
+    mock_response.json.return_value = expected
+    assert async_github_client._response_json(mock_response) == expected
+
+
+@pytest.mark.asyncio
+async def test_response_json_async_offloads_large_bodies():
+    """큰 JSON 응답만 워커 스레드에서 파싱하는지 테스트"""
+    if not HTTPX_AVAILABLE:
+        pytest.skip("httpx not available")
+
+    from py_github_analyzer import async_github_client
+
+    small = httpx.Response(200, json={"name": "repo"})
+    large = httpx.Response(200, json={"tree": ["x" * 100] * 5000})
+
+    with patch("asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+        assert await async_github_client._response_json_async(small) == {"name": "repo"}
+        mock_to_thread.assert_not_called()
+
+        result = await async_github_client._response_json_async(large)
+        assert len(result["tree"]) == 5000
+        mock_to_thread.assert_called_once()
+
+
+def test_decode_b64_text():
+    """base64 파일 내용 디코딩 (UTF-8 / latin-1 / 잘못된 입력) 테스트"""
+    if not HTTPX_AVAILABLE:
+        pytest.skip("httpx not available")
+
+    from py_github_analyzer.async_github_client import _decode_b64_text
+
+    assert _decode_b64_text(base64.b64encode("안녕".encode()).decode()) == ("안녕", "utf-8")
+    assert _decode_b64_text(base64.b64encode(b"caf\xe9").decode()) == ("caf\xe9", "latin-1")
+    assert _decode_b64_text("not*base64") is None
+
 
 class TestAsyncGitHubSession:
     """AsyncGitHubSession 클래스 테스트"""
@@ -151,6 +337,24 @@ class TestAsyncGitHubSession:
         
         await session.close()
 
+    @pytest.mark.asyncio
+    async def test_token_performance_profile_cached(self):
+        """토큰 성능 프로필이 초기화 시 한 번 계산되고 읽기 전용인지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubSession
+
+        async with AsyncGitHubSession("ghp_test_token") as session:
+            profile = session._get_token_performance_profile()
+            assert profile is session._get_token_performance_profile()
+            assert profile["performance"] == "fast"
+            with pytest.raises(TypeError):
+                profile["zip_threshold"] = 0
+
+        async with AsyncGitHubSession("github_pat_test") as session:
+            assert session._get_token_performance_profile()["performance"] == "moderate"
+
     @pytest.mark.asyncio
     async def test_context_manager(self):
         """컨텍스트 매니저 테스트"""
@@ -163,6 +367,77 @@ class TestAsyncGitHubSession:
             assert session.token == "test_token"
             assert session.client is not None
 
+    @pytest.mark.asyncio
+    async def test_request_retries_after_rate_limit(self):
+        """429 응답 시 retry-after 만큼 대기 후 재시도하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubSession
+
+        limited = httpx.Response(429, headers={"retry-after": "2"})
+        ok = httpx.Response(200, json={})
+
+        async with AsyncGitHubSession("test_token") as session:
+            with patch.object(session.client, 'request', new=AsyncMock(side_effect=[limited, ok])) as mock_request, \
+                 patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+                response = await session.get("https://api.github.com/repos/user/repo")
+
+            assert response.status_code == 200
+            assert mock_request.await_count == 2
+            mock_sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_time(self):
+        """rate limit 응답별 대기 시간 계산 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubSession
+
+        wait_time = AsyncGitHubSession._rate_limit_wait_time
+
+        # rate limit이 아닌 403 (비공개 저장소 등)은 재시도하지 않음
+        assert wait_time(httpx.Response(403)) is None
+        assert wait_time(httpx.Response(200, headers={"retry-after": "1"})) is None
+        assert wait_time(httpx.Response(429, headers={"retry-after": "3"})) == 3.0
+        # 너무 긴 대기는 포기
+        assert wait_time(httpx.Response(429, headers={"retry-after": "3600"})) is None
+
+        with patch('time.time', return_value=1000.0):
+            reset = httpx.Response(403, headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": "1010"})
+            assert wait_time(reset) == 10.0
+
+
+    @pytest.mark.asyncio
+    async def test_retry_wait_time_backs_off_on_server_errors(self):
+        """5xx와 헤더 없는 429는 지수 백오프 + 지터로 재시도하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubSession
+
+        wait_time = AsyncGitHubSession._retry_wait_time
+
+        with patch('random.random', return_value=0.25):
+            assert wait_time(httpx.Response(502), 0) == 1.25
+            assert wait_time(httpx.Response(503), 2) == 4.25
+            assert wait_time(httpx.Response(429), 1) == 2.25
+        # 헤더가 있는 rate limit은 헤더 값을 따르고, 일반 오류는 재시도하지 않음
+        assert wait_time(httpx.Response(429, headers={"retry-after": "3"}), 0) == 3.0
+        assert wait_time(httpx.Response(429, headers={"retry-after": "3600"}), 0) is None
+        assert wait_time(httpx.Response(403), 0) is None
+        assert wait_time(httpx.Response(404), 0) is None
+
+        server_error = httpx.Response(503)
+        ok = httpx.Response(200, json={})
+        async with AsyncGitHubSession("test_token") as session:
+            with patch.object(session.client, 'request', new=AsyncMock(side_effect=[server_error, ok])), \
+                 patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+                response = await session.get("https://api.github.com/repos/user/repo")
+
+        assert response.status_code == 200
+        mock_sleep.assert_awaited_once()
 
 class TestAsyncGitHubClient:
     """AsyncGitHubClient 클래스 테스트"""
@@ -196,6 +471,178 @@ class TestAsyncGitHubClient:
             assert client.token == "test_token"
             assert client.session is not None
 
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_bounds_requests(self):
+        """concurrency 인자로 동시 요청 수가 제한되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"name": "repo", "full_name": "user/repo"})
+
+        async with AsyncGitHubClient("test_token", concurrency=2) as client:
+            await client.session.client.aclose()
+            client.session.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            await asyncio.gather(*(client.get_repository_info("user", f"repo{i}") for i in range(5)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_get_rate_limit_and_repo_graphql(self):
+        """GraphQL 한 번의 요청으로 저장소 정보와 rate limit을 가져오는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+        from py_github_analyzer.exceptions import RepositoryNotFoundError
+
+        requests = []
+        repository = {
+            "name": "repo",
+            "nameWithOwner": "user/repo",
+            "description": None,
+            "primaryLanguage": {"name": "Python"},
+            "diskUsage": 42,
+            "defaultBranchRef": {"name": "main"},
+            "isPrivate": False,
+            "isArchived": False,
+            "isDisabled": False,
+            "repositoryTopics": {"nodes": [{"topic": {"name": "cli"}}]},
+            "licenseInfo": None,
+            "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-02-01T00:00:00Z",
+            "url": "https://github.com/user/repo",
+        }
+
+        def handler(request):
+            body = json.loads(request.content)
+            requests.append(body)
+            if body["variables"]["name"] == "missing":
+                return httpx.Response(200, json={"data": {"repository": None}, "errors": [
+                    {"type": "NOT_FOUND", "message": "Could not resolve to a Repository"}
+                ]})
+            rate_limit = {"limit": 5000, "remaining": 4999, "resetAt": "2024-01-01T01:00:00Z"}
+            return httpx.Response(200, json={"data": {"rateLimit": rate_limit, "repository": repository}})
+
+        async with AsyncGitHubClient("test_token") as client:
+            await client.session.client.aclose()
+            client.session.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            result = await client.get_rate_limit_and_repo("user", "repo")
+            with pytest.raises(RepositoryNotFoundError):
+                await client.get_rate_limit_and_repo("user", "missing")
+
+        assert requests[0]["variables"] == {"owner": "user", "name": "repo"}
+        assert "rateLimit" in requests[0]["query"]
+        assert result["rate_limit"]["remaining"] == 4999
+        assert result["repository"]["full_name"] == "user/repo"
+        assert result["repository"]["language"] == "Python"
+        assert result["repository"]["description"] == ""
+        assert result["repository"]["topics"] == ["cli"]
+        assert result["repository"]["license"] is None
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_state_persisted_between_runs(self, tmp_path, monkeypatch):
+        """rate limit 상태가 캐시 파일로 저장되고 다음 실행에서 복원되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        import time
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        reset = int(time.time()) + 600
+
+        async with AsyncGitHubClient("test_token", persist_rate_limit=True) as client:
+            await client.rate_limit_manager.update_from_headers({
+                "x-ratelimit-limit": "5000",
+                "x-ratelimit-remaining": "1234",
+                "x-ratelimit-reset": str(reset),
+            })
+
+        state_file = tmp_path / "py-github-analyzer" / "rate.json"
+        assert state_file.exists()
+        assert "test_token" not in state_file.read_text()
+
+        async with AsyncGitHubClient("test_token", persist_rate_limit=True) as client:
+            assert client.rate_limit_manager.remaining == 1234
+            assert client.rate_limit_manager.reset_time == reset
+
+        # 다른 토큰이나 비활성화 시에는 복원하지 않음
+        async with AsyncGitHubClient("other_token", persist_rate_limit=True) as client:
+            assert client.rate_limit_manager.remaining == 5000
+        async with AsyncGitHubClient("test_token") as client:
+            assert client.rate_limit_manager.remaining == 5000
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_state_save_failure_removes_temp_file(self, tmp_path, monkeypatch):
+        """rate limit 상태 저장 실패 시 임시 파일이 남지 않는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        import time
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        async with AsyncGitHubClient("test_token", persist_rate_limit=True) as client:
+            await client.rate_limit_manager.update_from_headers({
+                "x-ratelimit-limit": "5000",
+                "x-ratelimit-remaining": "1234",
+                "x-ratelimit-reset": str(int(time.time()) + 600),
+            })
+            with patch("py_github_analyzer.async_github_client.os.replace", side_effect=OSError("disk full")):
+                client._save_rate_state()
+
+        cache_dir = tmp_path / "py-github-analyzer"
+        assert [p.name for p in cache_dir.iterdir()] == ["rate.json"]
+
+    @pytest.mark.asyncio
+    async def test_get_default_branch_sha(self):
+        """기본 브랜치 커밋 SHA를 sha 미디어 타입으로 조회하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        sha = "a" * 40
+
+        def handler(request):
+            assert request.url.path == "/repos/user/repo/commits/HEAD"
+            assert request.headers["accept"] == "application/vnd.github.sha"
+            return httpx.Response(200, text=sha, headers={"etag": '"s1"'})
+
+        async with AsyncGitHubClient("test_token") as client:
+            await client.session.client.aclose()
+            client.session.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            assert await client.get_default_branch_sha("user", "repo") == sha
+
+    @pytest.mark.asyncio
+    async def test_closed_client_fails_fast(self):
+        """닫힌 클라이언트 재사용 시 즉시 명확한 오류가 발생하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        async with AsyncGitHubClient("test_token") as client:
+            http_client = client.session.client
+
+        assert http_client.is_closed
+        with pytest.raises(RuntimeError, match="session is closed"):
+            await client.get_repository_info("user", "repo")
+
     @pytest.mark.asyncio
     async def test_get_repository_info_safe_mode(self):
         """저장소 정보 가져오기 (안전 모드) 테스트"""
@@ -315,6 +762,142 @@ class TestAsyncGitHubClient:
                 assert result[1]["name"] == "src"
                 assert result[1]["type"] == "dir"
 
+    @pytest.mark.asyncio
+    async def test_get_repository_contents_uses_git_tree(self):
+        """재귀 조회 시 Git Trees API 단일 호출 사용 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        tree_data = {
+            "truncated": False,
+            "tree": [
+                {"path": "src", "type": "tree", "sha": "sha1", "url": "tree_url"},
+                {"path": "src/main.py", "type": "blob", "sha": "sha2", "size": 42, "url": "blob_url"},
+            ],
+        }
+
+        mock_response = Mock()
+        mock_response.json.return_value = tree_data
+        mock_response.headers = {}
+
+        async with AsyncGitHubClient("test_token") as client:
+            with patch.object(client.session, 'get', new=AsyncMock(return_value=mock_response)) as mock_get:
+                result = await client.get_repository_contents("user", "repo", branch="main")
+
+            assert mock_get.call_count == 1
+            assert "git/trees/main" in mock_get.call_args[0][0]
+            assert [item["type"] for item in result] == ["dir", "file"]
+            assert result[1]["name"] == "main.py"
+            assert result[1]["size"] == 42
+            assert result[1]["download_url"].endswith("/user/repo/main/src/main.py")
+            assert result[0]["download_url"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_repository_tree_quotes_urls(self):
+        """브랜치와 경로의 특수 문자가 download_url/html_url에서 인코딩되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "truncated": False,
+            "tree": [{"path": "docs/a b#1.md", "type": "blob", "sha": "sha1", "size": 3}],
+        }
+        mock_response.headers = {}
+
+        async with AsyncGitHubClient("test_token") as client:
+            with patch.object(client.session, 'get', new=AsyncMock(return_value=mock_response)):
+                result = await client.get_repository_tree("user", "repo", branch="feature/x#y")
+
+        assert result[0]["path"] == "docs/a b#1.md"
+        assert result[0]["download_url"].endswith("/user/repo/feature/x%23y/docs/a%20b%231.md")
+        assert result[0]["html_url"] == "https://github.com/user/repo/blob/feature/x%23y/docs/a%20b%231.md"
+
+    @pytest.mark.asyncio
+    async def test_get_repository_contents_truncated_tree_fallback(self):
+        """잘린 트리 응답 시 Contents API로 대체되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        async with AsyncGitHubClient("test_token") as client:
+            with patch.object(client, 'get_repository_tree', new=AsyncMock(return_value=None)):
+                contents_response = Mock()
+                contents_response.json.return_value = [
+                    {"name": "a.py", "path": "a.py", "type": "file", "size": 1}
+                ]
+                contents_response.headers = {}
+                with patch.object(client.session, 'get', new=AsyncMock(return_value=contents_response)) as mock_get:
+                    result = await client.get_repository_contents("user", "repo")
+
+            assert "/contents" in mock_get.call_args[0][0]
+            assert [item["path"] for item in result] == ["a.py"]
+
+    @pytest.mark.asyncio
+    async def test_get_repository_contents_walks_subdirectories(self):
+        """Contents API 대체 경로에서 하위 디렉토리를 모두 순회하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        listings = {
+            "": [{"name": "src", "path": "src", "type": "dir"},
+                 {"name": "README.md", "path": "README.md", "type": "file"}],
+            "src": [{"name": "pkg", "path": "src/pkg", "type": "dir"},
+                    {"name": "broken", "path": "src/broken", "type": "dir"}],
+            "src/pkg": [{"name": "mod.py", "path": "src/pkg/mod.py", "type": "file"}],
+        }
+
+        async def fake_listing(owner, repo, path, branch=None, safe_mode=False):
+            if path not in listings:
+                raise Exception("not found")
+            return [dict(item) for item in listings[path]]
+
+        async with AsyncGitHubClient("test_token") as client:
+            with patch.object(client, 'get_repository_tree', new=AsyncMock(return_value=None)), \
+                 patch.object(client, '_get_directory_listing', side_effect=fake_listing):
+                result = await client.get_repository_contents("user", "repo")
+
+        assert sorted(item["path"] for item in result) == [
+            "README.md", "src", "src/broken", "src/pkg", "src/pkg/mod.py"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_repository_contents_fetches_siblings_concurrently(self):
+        """같은 레벨의 하위 디렉토리를 동시에 조회하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        dirs = [f"dir{i}" for i in range(4)]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_listing(owner, repo, path, branch=None, safe_mode=False):
+            nonlocal in_flight, max_in_flight
+            if not path:
+                return [{"name": d, "path": d, "type": "dir"} for d in dirs]
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [{"name": "f.py", "path": f"{path}/f.py", "type": "file"}]
+
+        async with AsyncGitHubClient("test_token") as client:
+            with patch.object(client, 'get_repository_tree', new=AsyncMock(return_value=None)), \
+                 patch.object(client, '_get_directory_listing', side_effect=fake_listing):
+                result = await client.get_repository_contents("user", "repo")
+
+        assert max_in_flight == len(dirs)
+        assert len(result) == 2 * len(dirs)
+
     @pytest.mark.asyncio
     async def test_get_file_content(self):
         """파일 내용 가져오기 테스트"""
@@ -368,6 +951,327 @@ class TestAsyncGitHubClient:
             assert isinstance(results, dict)
             assert len(results) == 0
 
+    @pytest.mark.asyncio
+    async def test_batch_download_files_uses_zip_above_threshold(self):
+        """임계값을 넘는 배치는 ZIP 아카이브 한 번으로 처리되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        file_paths = [f"src/file{i}.py" for i in range(20)]
+        archive = {path: f"# {path}" for path in file_paths[:-1]}
+
+        async with AsyncGitHubClient("ghp_test_token") as client:
+            fallback = {"path": "src/file19.py", "content": "x", "size": 1, "sha": None, "encoding": "utf-8"}
+            with patch.object(client, 'download_zip_archive', new=AsyncMock(return_value=archive)) as mock_zip, \
+                 patch.object(client, '_download_single_file_with_retry',
+                              new=AsyncMock(return_value=fallback)) as mock_single:
+                results = await client.batch_download_files("user", "repo", file_paths)
+
+            mock_zip.assert_awaited_once_with("user", "repo", "HEAD", False)
+            # 아카이브에 없는 파일만 파일별 다운로드로 재시도
+            mock_single.assert_awaited_once_with("user", "repo", "src/file19.py", None, False)
+            assert results["src/file0.py"]["content"] == "# src/file0.py"
+            assert results["src/file0.py"]["size"] == len("# src/file0.py")
+            assert results["src/file19.py"] == fallback
+            assert list(results) == file_paths
+
+    @pytest.mark.asyncio
+    async def test_stream_download_files_skips_archive_by_default(self):
+        """API 전용 스트리밍 다운로드는 파일 수와 관계없이 ZIP 아카이브를 받지 않는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        file_paths = [f"src/file{i}.py" for i in range(20)]
+
+        async def fake_download(owner, repo, file_path, branch, safe_mode):
+            return {"path": file_path, "content": "x", "size": 1, "sha": None, "encoding": "utf-8"}
+
+        async with AsyncGitHubClient("ghp_test_token") as client:
+            with patch.object(client, 'download_zip_archive', new=AsyncMock()) as mock_zip, \
+                 patch.object(client, '_download_single_file_with_retry', side_effect=fake_download):
+                downloaded = [path async for path, data in client.stream_download_files("user", "repo", file_paths)]
+
+            mock_zip.assert_not_called()
+            assert sorted(downloaded) == sorted(file_paths)
+
+    @pytest.mark.asyncio
+    async def test_batch_download_files_zip_failure_fallback(self):
+        """ZIP 다운로드 실패 시 파일별 다운로드로 대체되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        file_paths = [f"file{i}.py" for i in range(20)]
+
+        async def fake_download(owner, repo, file_path, branch, safe_mode):
+            return {"path": file_path, "content": "x", "size": 1, "sha": None, "encoding": "utf-8"}
+
+        async with AsyncGitHubClient("ghp_test_token") as client:
+            with patch.object(client, 'download_zip_archive', new=AsyncMock(side_effect=Exception("boom"))), \
+                 patch.object(client, '_download_single_file_with_retry', side_effect=fake_download), \
+                 patch('asyncio.sleep', new=AsyncMock()):
+                results = await client.batch_download_files("user", "repo", file_paths)
+
+            assert all(results[path]["content"] == "x" for path in file_paths)
+
+    @pytest.mark.asyncio
+    async def test_batch_download_files_worker_pool(self):
+        """batch_size 개수의 워커만 동시에 다운로드하고 결과 순서를 유지하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        file_paths = [f"file{i}.py" for i in range(5)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_download(owner, repo, file_path, branch, safe_mode):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if file_path == "file3.py":
+                raise RuntimeError("boom")
+            return {"path": file_path}
+
+        async with AsyncGitHubClient("ghp_test_token") as client:
+            with patch.object(client, '_download_single_file_with_retry', side_effect=fake_download):
+                results = await client.batch_download_files("user", "repo", file_paths, batch_size=2)
+
+        assert peak == 2
+        assert list(results) == file_paths
+        assert results["file3.py"] is None
+        assert results["file4.py"] == {"path": "file4.py"}
+
+    @pytest.mark.asyncio
+    async def test_batch_download_files_priority_order(self):
+        """분석 우선순위가 높은 파일부터 다운로드하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        file_paths = ["a/b/c/d/e/notes.txt", "docs/notes.txt", "README.md", "main.py"]
+        order = []
+
+        async def fake_download(owner, repo, file_path, branch, safe_mode):
+            order.append(file_path)
+            return {"path": file_path}
+
+        async with AsyncGitHubClient("ghp_test_token") as client:
+            with patch.object(client, '_download_single_file_with_retry', side_effect=fake_download):
+                results = await client.batch_download_files("user", "repo", file_paths, batch_size=1)
+
+        assert order == ["main.py", "README.md", "docs/notes.txt", "a/b/c/d/e/notes.txt"]
+        assert list(results) == file_paths
+
+    @pytest.mark.asyncio
+    async def test_stream_download_files_yields_as_completed(self):
+        """다운로드가 끝나는 순서대로 결과를 내보내고 조기 종료 시 워커를 정리하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        file_paths = ["slow.py", "fast.py", "other.py"]
+        completed = []
+
+        async def fake_download(owner, repo, file_path, branch, safe_mode):
+            await asyncio.sleep(0.05 if file_path == "slow.py" else 0)
+            completed.append(file_path)
+            return {"path": file_path}
+
+        async with AsyncGitHubClient("ghp_test_token") as client:
+            with patch.object(client, '_download_single_file_with_retry', side_effect=fake_download):
+                stream = client.stream_download_files("user", "repo", file_paths, batch_size=2)
+                first = await stream.__anext__()
+                await stream.aclose()
+
+        assert first == ("fast.py", {"path": "fast.py"})
+        assert "slow.py" not in completed
+
+    @pytest.mark.asyncio
+    async def test_download_single_file_retries_only_transient_errors(self):
+        """네트워크 오류만 재시도하고 그 외 오류는 즉시 전파되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+        from py_github_analyzer.exceptions import AuthenticationError, NetworkError
+
+        async with AsyncGitHubClient("ghp_test_token") as client:
+            flaky = AsyncMock(side_effect=[NetworkError("reset"), {"path": "a.py"}])
+            with patch.object(client, '_download_single_file', new=flaky), \
+                 patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+                assert await client._download_single_file_with_retry("user", "repo", "a.py") == {"path": "a.py"}
+            assert flaky.await_count == 2
+            mock_sleep.assert_awaited_once_with(0.5)
+
+            denied = AsyncMock(side_effect=AuthenticationError("denied"))
+            with patch.object(client, '_download_single_file', new=denied), \
+                 patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+                with pytest.raises(AuthenticationError):
+                    await client._download_single_file_with_retry("user", "repo", "a.py")
+            assert denied.await_count == 1
+            mock_sleep.assert_not_awaited()
+
+            down = AsyncMock(side_effect=NetworkError("down"))
+            with patch.object(client, '_download_single_file', new=down), \
+                 patch('asyncio.sleep', new=AsyncMock()):
+                assert await client._download_single_file_with_retry("user", "repo", "a.py") is None
+            assert down.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_download_single_file_prefers_raw_url(self):
+        """raw URL로 먼저 다운로드하고 실패 시 Contents API로 대체되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.host)
+            if request.url.host == "raw.githubusercontent.com":
+                if request.url.path.endswith("/HEAD/src/ok.py"):
+                    return httpx.Response(200, content=b"print('ok')\n")
+                return httpx.Response(404)
+            return httpx.Response(200, json={
+                "name": "missing.py",
+                "path": "src/missing.py",
+                "content": base64.b64encode(b"x = 1\n").decode(),
+                "encoding": "base64",
+                "sha": "abc",
+            })
+
+        async with AsyncGitHubClient("test_token") as client:
+            await client.session.client.aclose()
+            client.session.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            ok = await client._download_single_file_with_retry("user", "repo", "src/ok.py")
+            assert ok["content"] == "print('ok')\n"
+            assert requested == ["raw.githubusercontent.com"]
+
+            fallback = await client._download_single_file_with_retry("user", "repo", "src/missing.py")
+            assert fallback["content"] == "x = 1\n"
+            assert fallback["sha"] == "abc"
+            assert requested[1:] == ["raw.githubusercontent.com", "api.github.com"]
+
+    @pytest.mark.asyncio
+    async def test_safe_mode_fallback_decorator(self):
+        """safe_mode 위치/키워드 인자 모두에서 기본값 반환, 일반 모드에서는 예외 전파 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+        from py_github_analyzer.exceptions import NetworkError
+
+        async with AsyncGitHubClient("test_token") as client:
+            with patch.object(client.session, 'get', new=AsyncMock(side_effect=NetworkError("down"))):
+                assert await client.get_user_repositories("someone", safe_mode=True) == []
+                assert await client.get_file_content("user", "repo", "a.py", None, True) is None
+                info = await client.get_repository_info("user", "repo", safe_mode=True)
+                assert info["full_name"] == "user/repo"
+
+                with pytest.raises(NetworkError):
+                    await client.get_user_repositories("someone")
+
+    @pytest.mark.asyncio
+    async def test_file_content_url_is_quoted(self):
+        """경로와 브랜치의 특수문자가 인코딩되어 요청되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        seen = []
+
+        def handler(request):
+            seen.append(request.url)
+            return httpx.Response(404)
+
+        async with AsyncGitHubClient("test_token") as client:
+            await client.session.client.aclose()
+            client.session.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            result = await client.get_file_content(
+                "user", "repo", "docs/a b#1.md", branch="feature/x#y", safe_mode=True
+            )
+
+        assert result is None
+        assert seen[0].raw_path == b"/repos/user/repo/contents/docs/a%20b%231.md?ref=feature%2Fx%23y"
+
+    async def test_conditional_get_with_etag(self):
+        """ETag 캐시로 조건부 요청을 보내고 304 응답 시 캐시를 재사용하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        seen_etags = []
+
+        def handler(request):
+            seen_etags.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(200, json={"name": "repo", "full_name": "user/repo"}, headers={"etag": '"v1"'})
+
+        async with AsyncGitHubClient("test_token") as client:
+            await client.session.client.aclose()
+            client.session.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            first = await client.get_repository_info("user", "repo")
+            second = await client.get_repository_info("user", "repo")
+
+        assert seen_etags == [None, '"v1"']
+        assert first == second
+        assert second["full_name"] == "user/repo"
+        # 304 응답은 클라이언트 측 시간당 한도에서 차감하지 않음
+        assert client._limiter._total == 1
+
+    @pytest.mark.asyncio
+    async def test_etag_cache_keyed_by_accept_and_skips_file_content(self):
+        """Accept 헤더가 다른 요청은 캐시를 공유하지 않고 파일 내용은 캐시하지 않는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        sha = "a" * 40
+
+        def handler(request):
+            if request.headers.get("if-none-match"):
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            if request.url.path.endswith("/commits/HEAD"):
+                if request.headers.get("accept") == "application/vnd.github.sha":
+                    return httpx.Response(200, text=sha, headers={"etag": '"v1"'})
+                return httpx.Response(200, json={"sha": sha}, headers={"etag": '"v1"'})
+            return httpx.Response(
+                200,
+                json={"name": "a.py", "path": "a.py", "content": "eA==", "size": 1},
+                headers={"etag": '"v1"'},
+            )
+
+        async with AsyncGitHubClient("test_token") as client:
+            await client.session.client.aclose()
+            client.session.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            assert await client.get_default_branch_sha("user", "repo") == sha
+            url = "https://api.github.com/repos/user/repo/commits/HEAD"
+            response = await client._do_request(url, headers={"Accept": "application/vnd.github+json"})
+            assert response.json() == {"sha": sha}
+
+            await client.get_file_content("user", "repo", "a.py")
+            assert len(client._etag_cache) == 2
+
     @pytest.mark.asyncio
     async def test_download_zip_archive(self):
         """ZIP 아카이브 다운로드 테스트 - 기본 동작 확인"""
@@ -380,6 +1284,107 @@ class TestAsyncGitHubClient:
             # 메서드 존재 여부만 확인
             assert hasattr(client, 'download_zip_archive')
 
+    @pytest.mark.asyncio
+    async def test_download_zip_archive_streams_and_skips_binaries(self):
+        """ZIP 아카이브 스트리밍 다운로드 및 바이너리 파일 제외 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        import io
+        import zipfile
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("user-repo-abc123/", "")
+            zf.writestr("user-repo-abc123/main.py", "print('hi')\n")
+            zf.writestr("user-repo-abc123/lib/native.so", b"\x7fELF\x00")
+        zip_bytes = buffer.getvalue()
+
+        def handler(request):
+            assert request.url.path.endswith("/zipball/main")
+            return httpx.Response(200, content=zip_bytes)
+
+        async with AsyncGitHubClient("test_token") as client:
+            await client.session.client.aclose()
+            client.session.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            result = await client.download_zip_archive("user", "repo", "main")
+
+        assert result == {"main.py": "print('hi')\n"}
+
+    @pytest.mark.asyncio
+    async def test_download_tarball_files_returns_file_entries(self):
+        """tar.gz 아카이브를 스트리밍으로 읽어 파일 항목 목록으로 반환하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        import io
+        import tarfile
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tf:
+            for name, data in [
+                ("user-repo-abc123/main.py", b"print('hi')\n"),
+                ("user-repo-abc123/logo.png", b"\x89PNG"),
+            ]:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+
+        def handler(request):
+            assert request.url.path.endswith("/tarball/main")
+            return httpx.Response(200, content=buffer.getvalue())
+
+        async with AsyncGitHubClient("test_token") as client:
+            await client.session.client.aclose()
+            client.session.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            result = await client.download_tarball_files("user", "repo", "main")
+
+        assert result == [
+            {"path": "main.py", "content": "print('hi')\n", "size": 12, "type": "file"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_download_tarball_files_skips_excluded_members_unread(self):
+        """include 필터에서 제외된 멤버는 본문을 읽지 않고 건너뛰는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        import io
+        import tarfile
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tf:
+            for name, data in [
+                ("user-repo-abc123/main.py", b"print('hi')\n"),
+                ("user-repo-abc123/vendor/lib.py", b"x = 1\n"),
+            ]:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+
+        def handler(request):
+            return httpx.Response(200, content=buffer.getvalue())
+
+        checked = []
+
+        def include(path, size):
+            checked.append((path, size))
+            return not path.startswith("vendor/")
+
+        async with AsyncGitHubClient("test_token") as client:
+            await client.session.client.aclose()
+            client.session.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with patch.object(tarfile.TarFile, "extractfile", autospec=True,
+                              side_effect=tarfile.TarFile.extractfile) as extractfile:
+                result = await client.download_tarball_files("user", "repo", "main", include=include)
+
+        assert [entry["path"] for entry in result] == ["main.py"]
+        assert checked == [("main.py", 12), ("vendor/lib.py", 6)]
+        assert [call.args[1].name for call in extractfile.call_args_list] == ["user-repo-abc123/main.py"]
+
     @pytest.mark.asyncio
     async def test_search_repositories(self):
         """저장소 검색 테스트"""
@@ -518,6 +1523,62 @@ class TestAsyncGitHubClient:
                 assert result["core"]["limit"] == 5000
                 assert result["core"]["remaining"] == 4999
 
+    @pytest.mark.asyncio
+    async def test_get_rate_limit_status_is_cached(self):
+        """Rate limit 상태가 짧은 TTL 동안 캐시되는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        import time
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        reset = int(time.time()) + 3600
+
+        def rate_response(remaining):
+            resource = {"limit": 5000, "remaining": remaining, "reset": reset}
+            return httpx.Response(200, json={"resources": {"core": resource, "search": resource}})
+
+        async with AsyncGitHubClient("test_token") as client:
+            with patch.object(client.session, 'get', return_value=rate_response(4999)) as mock_get:
+                first = await client.get_rate_limit_status()
+                second = await client.get_rate_limit_status()
+            assert mock_get.await_count == 1
+            assert first is second
+
+            # 만료 후에는 다시 조회하고, 소진 상태면 TTL이 짧아짐
+            client._rate_status_expiry = 0.0
+            with patch.object(client.session, 'get', return_value=rate_response(0)), \
+                 patch('time.monotonic', return_value=1000.0):
+                exhausted = await client.get_rate_limit_status()
+            assert exhausted["core"]["remaining"] == 0
+            assert client._rate_status_expiry == 1001.0
+
+    @pytest.mark.asyncio
+    async def test_get_rate_limit_status_uses_response_headers(self):
+        """최근 응답 헤더의 core 한도로 /rate_limit 재조회를 생략하는지 테스트"""
+        if not HTTPX_AVAILABLE:
+            pytest.skip("httpx not available")
+
+        import time
+        from py_github_analyzer.async_github_client import AsyncGitHubClient
+
+        resource = {"limit": 5000, "remaining": 4999, "reset": int(time.time()) + 3600}
+        response = httpx.Response(200, json={"resources": {"core": resource, "search": resource}})
+
+        async with AsyncGitHubClient("test_token") as client:
+            with patch.object(client.session, 'get', return_value=response) as mock_get:
+                await client.get_rate_limit_status()
+                client._rate_status_expiry = 0.0
+
+                await client.rate_limit_manager.update_from_headers(
+                    {"x-ratelimit-limit": "5000", "x-ratelimit-remaining": "4100", "x-ratelimit-reset": "123"}
+                )
+                status = await client.get_rate_limit_status()
+
+            assert mock_get.await_count == 1
+            assert status["core"] == {"limit": 5000, "remaining": 4100, "reset": 123}
+            assert status["search"]["remaining"] == 4999
+
     @pytest.mark.asyncio
     async def test_safe_mode_fallback(self):
         """안전 모드 fallback 테스트"""
@@ -178,6 +178,29 @@ class TestConfig:
         # 백업 파일
         assert ".backup" in Config.MULTI_PART_EXTENSIONS
 
+    def test_extension_lookup_tables(self):
+        """확장자 역방향 조회 테이블이 원본 정의와 일치하는지 테스트"""
+        from py_github_analyzer.config import Config
+
+        for category, extensions in Config.SUPPORTED_EXTENSIONS.items():
+            for ext in extensions:
+                assert Config._EXT_TO_CATEGORY[ext.lower()] == category
+
+        assert Config._MULTI_EXT_TO_CATEGORY[".tar.z"] == "binary"
+        assert Config.get_file_category("backup.TAR.Z") == "binary"
+
+    def test_file_category_is_memoized(self):
+        """반복되는 파일명 분류가 캐시되는지 테스트"""
+        from py_github_analyzer.config import Config
+
+        Config.get_file_category.cache_clear()
+        assert Config.get_file_category("__init__.py") == "python"
+        assert Config.get_file_category("__init__.py") == "python"
+
+        info = Config.get_file_category.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
     def test_language_patterns(self):
         """언어 패턴 테스트"""
         from py_github_analyzer.config import Config
@@ -418,6 +441,12 @@ class TestConfig:
         # .d.ts 파일 (TypeScript definition)
         assert Config.get_file_category("types.d.ts") == "typescript"
 
+        # 경로, 선행 점, 후행 점 처리 (pathlib 규칙과 동일)
+        assert Config.get_file_category("src.v2/types.d.ts") == "typescript"
+        assert Config.get_file_category("pkg/.hidden.py") == "python"
+        assert Config.get_file_category("docs.v1/notes") == "text"
+        assert Config.get_file_category("script.py.") == "text"
+
     def test_special_filename_patterns(self):
         """특수 파일명 패턴 테스트"""
         from py_github_analyzer.config import Config
@@ -458,6 +487,12 @@ class TestConfig:
         assert Config.VERSION == original_version
         assert Config.MAX_FILE_SIZE == original_max_file_size
 
+        # 조회 테이블은 읽기 전용
+        with pytest.raises(TypeError):
+            Config.SPECIAL_FILES["newfile"] = "text"
+        with pytest.raises(AttributeError):
+            Config.SKIP_DIRECTORIES.add("newdir")
+
     def test_file_category_comprehensive(self):
         """포괄적인 파일 카테고리 테스트"""
         from py_github_analyzer.config import Config
@@ -328,4 +328,144 @@ class TestGitHubRepositoryAnalyzer:
             result = await analyzer.analyze_repository_async("https://github.com/test/repo", fallback=False)
 
             assert result['success'] is False
-            assert 'Analysis failed: NetworkError' in result['error_message']
\ No newline at end of file
+            assert 'Analysis failed: NetworkError' in result['error_message']
+
+    @pytest.mark.asyncio
+    async def test_unchanged_repository_reuses_cached_result(self, mock_token_utils, temp_dir, monkeypatch):
+        """기본 브랜치 SHA가 같으면 다운로드 없이 캐시된 결과를 재사용하는지 테스트"""
+        from py_github_analyzer.core import GitHubRepositoryAnalyzer
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+        files = [{"path": "main.py", "content": "def main():\n    return 1\n", "size": 26, "type": "file"}]
+        repo_info = {"name": "repo", "full_name": "test/repo"}
+
+        analyzer = GitHubRepositoryAnalyzer(token="test_token", cache_results=True)
+        try:
+            with patch.object(analyzer.client, "get_default_branch_sha", new=AsyncMock(return_value="a" * 40)), \
+                 patch.object(analyzer, "_run_strategy", new=AsyncMock(return_value=(files, repo_info, True))) as strategy:
+                first = await analyzer.analyze_repository_async(
+                    "https://github.com/test/repo", str(temp_dir / "out"), "json"
+                )
+                second = await analyzer.analyze_repository_async(
+                    "https://github.com/test/repo", str(temp_dir / "out"), "json"
+                )
+        finally:
+            await analyzer.close()
+
+        assert first["success"] is True and "from_cache" not in first
+        assert second["from_cache"] is True
+        assert second["files"] == first["files"]
+        assert strategy.await_count == 1
+        assert (temp_dir / "out" / "test_repo.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_incomplete_result_is_not_cached(self, mock_token_utils, temp_dir, monkeypatch):
+        """다운로드에 실패한 파일이 있는 결과는 캐시하지 않는지 테스트"""
+        from py_github_analyzer.core import GitHubRepositoryAnalyzer
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+        files = [{"path": "main.py", "content": "def main():\n    return 1\n", "size": 26, "type": "file"}]
+        repo_info = {"name": "repo", "full_name": "test/repo"}
+
+        analyzer = GitHubRepositoryAnalyzer(token="test_token", cache_results=True)
+        try:
+            with patch.object(analyzer.client, "get_default_branch_sha", new=AsyncMock(return_value="a" * 40)), \
+                 patch.object(analyzer, "_run_strategy", new=AsyncMock(return_value=(files, repo_info, False))) as strategy:
+                for _ in range(2):
+                    result = await analyzer.analyze_repository_async(
+                        "https://github.com/test/repo", str(temp_dir / "out"), "json"
+                    )
+                    assert result["success"] is True and "from_cache" not in result
+        finally:
+            await analyzer.close()
+
+        assert strategy.await_count == 2
+
+    def test_result_cache_store_failure_removes_temp_file(self, temp_dir):
+        """결과 캐시 저장 실패 시 임시 파일이 남지 않는지 테스트"""
+        from py_github_analyzer.result_cache import ResultCache
+
+        cache = ResultCache(Mock(), directory=temp_dir)
+        cache.store("ok", {"metadata": {}, "files": []})
+        cache.store("bad", {"metadata": {}, "files": [object()]})
+
+        assert [p.name for p in temp_dir.iterdir()] == ["ok.json"]
+
+    def test_fallback_metadata_handles_non_dict_repo_info(self, mock_token_utils):
+        """저장소 정보가 딕셔너리가 아니어도 기본값으로 fallback 메타데이터를 만드는지 테스트"""
+        from py_github_analyzer.core import GitHubRepositoryAnalyzer
+
+        analyzer = GitHubRepositoryAnalyzer(token="test_token")
+        strategy = analyzer._fallback_strategy
+
+        metadata = strategy.build_metadata("test", "repo", None)
+        assert metadata["lang"] == ["Unknown"]
+        assert (metadata["size"], metadata["stars"], metadata["forks"]) == (0, 0, 0)
+        assert metadata["created"] is None and metadata["description"] is None
+
+        metadata = strategy.build_metadata(
+            "test", "repo", {"language": "Python", "size": "12", "stargazers_count": 3}
+        )
+        assert metadata["lang"] == ["Python"]
+        assert metadata["size"] == 12
+        assert metadata["stars"] == 3
+
+    @pytest.mark.asyncio
+    async def test_repository_downloads_are_bounded_across_analyzers(self, mock_token_utils, monkeypatch):
+        """여러 분석기 인스턴스의 동시 저장소 다운로드 수가 제한되는지 테스트"""
+        from py_github_analyzer import core
+        from py_github_analyzer.core import GitHubRepositoryAnalyzer
+
+        monkeypatch.setattr(core, "_MAX_CONCURRENT_ANALYSES", 2)
+        in_flight = 0
+        peak = 0
+
+        async def fake_dispatch(owner, repo, method):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [], {}, True
+
+        analyzers = [GitHubRepositoryAnalyzer(token="test_token") for _ in range(5)]
+        try:
+            for analyzer in analyzers:
+                monkeypatch.setattr(analyzer, "_dispatch_strategy", fake_dispatch)
+            await asyncio.gather(*(a._run_strategy("test", f"repo{i}", "zip") for i, a in enumerate(analyzers)))
+        finally:
+            for analyzer in analyzers:
+                await analyzer.close()
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("zip_error", [
+        NetworkError("ZIP failed"),
+        RuntimeError("unexpected"),
+    ])
+    async def test_auto_mode_falls_back_to_api_with_token(self, mock_token_utils, zip_error):
+        """auto 모드에서 ZIP 실패 시 토큰이 있으면 API로, 없으면 원래 예외를 다시 발생시키는지 테스트"""
+        from py_github_analyzer.core import GitHubRepositoryAnalyzer
+
+        api_files, api_info = [{"path": "main.py"}], {"name": "repo"}
+        analyzer = GitHubRepositoryAnalyzer(token="test_token")
+        try:
+            with patch.object(analyzer._zip_strategy, "execute", new=AsyncMock(side_effect=zip_error)), \
+                 patch.object(analyzer._api_strategy, "fetch", new=AsyncMock(return_value=(api_files, api_info, 0))):
+                assert await analyzer._run_strategy("test", "repo", "auto") == (api_files, api_info, True)
+
+                analyzer._api_strategy.fetch.return_value = (api_files, api_info, 2)
+                assert await analyzer._run_strategy("test", "repo", "auto") == (api_files, api_info, False)
+
+                analyzer.github_token = None
+                with pytest.raises(type(zip_error)):
+                    await analyzer._run_strategy("test", "repo", "auto")
+
+                analyzer.github_token = "test_token"
+                analyzer._api_strategy.fetch.side_effect = NetworkError("API failed")
+                with pytest.raises(type(zip_error)) as excinfo:
+                    await analyzer._run_strategy("test", "repo", "auto")
+                assert excinfo.value is zip_error
+        finally:
+            await analyzer.close()
@@ -231,6 +231,17 @@ def test_github_api_error_handler():
     assert error.reset_time == 1640995200
     assert error.remaining == 0
     
+    # 403 Forbidden (rate limit, 헤더 기반) 테스트
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1640995200"}
+    error = handle_github_api_error(403, response_data={"message": "Forbidden"}, headers=headers)
+    assert isinstance(error, RateLimitExceededError)
+    assert error.reset_time == 1640995200
+    assert error.remaining == 0
+
+    # 403 Forbidden (본문의 다른 필드에만 등장하는 문구는 무시) 테스트
+    error = handle_github_api_error(403, response_data={"message": "Forbidden", "note": "rate limit"})
+    assert isinstance(error, PrivateRepositoryError)
+
     # 403 Forbidden (private repo) 테스트
     error = handle_github_api_error(403, repo_url="https://github.com/user/private")
     assert isinstance(error, PrivateRepositoryError)
@@ -367,6 +378,19 @@ def test_exception_serialization():
         # 피클링이 지원되지 않을 수도 있음
         pytest.skip("Serialization not supported")
 
+def test_slotted_exception_serialization():
+    """슬롯에 저장된 하위 클래스 속성이 피클링 후에도 유지되는지 테스트"""
+    from py_github_analyzer.exceptions import RateLimitExceededError, RepositoryTooLargeError
+    import pickle
+
+    rate_error = pickle.loads(pickle.dumps(RateLimitExceededError("Rate limit", reset_time=123, remaining=0)))
+    assert (rate_error.message, rate_error.reset_time, rate_error.remaining) == ("Rate limit", 123, 0)
+
+    size_error = pickle.loads(pickle.dumps(RepositoryTooLargeError("Too large", 600.0, 500.0)))
+    assert (size_error.size_mb, size_error.limit_mb) == (600.0, 500.0)
+    assert str(size_error) == "Too large"
+    assert size_error.__dict__ == {}
+
 def test_error_message_formatting():
     """에러 메시지 포맷팅 테스트"""
     from py_github_analyzer.exceptions import GitHubAnalyzerError
@@ -199,6 +199,54 @@ def complex_function(data):
         complexity_complex = detector.calculate_complexity(complex_code, "python")
         assert complexity_complex >= complexity  # Should be equal or higher
 
+    @pytest.mark.parametrize("language", ["python", "javascript", "java", "cpp"])
+    def test_fused_complexity_patterns_count_like_individual_patterns(self, language):
+        """키워드 패턴을 하나로 합친 정규식이 개별 패턴과 같은 개수를 세는지 테스트"""
+        import re
+        from py_github_analyzer.processing import language_detector
+
+        content = (
+            "if x: pass\nelif y: pass\nelse: pass\nELSE elseif iffy _if\n"
+            "for i in xs: while True: try: except: with f: class A: def f(): "
+            "switch catch function public private struct template a => b ? c : d\n"
+        )
+        sources = language_detector._COMPLEXITY_PATTERN_SOURCES[language]
+        fused = language_detector._COMPLEXITY_PATTERNS[language]
+
+        expected = sum(len(re.findall(p, content, re.IGNORECASE)) for p in sources)
+        assert sum(len(p.findall(content)) for p in fused) == expected
+        assert len(fused) < len(sources)
+
+    @pytest.mark.parametrize("text", [
+        "import React from 'react'; React.useState(); REACT.x; <Template></TEMPLATE>",
+        "İmport django; ſettings.py DJANGO_SETTINGS_MODULE from Django",
+    ])
+    def test_literal_patterns_count_like_regex(self, text):
+        """리터럴 패턴을 str.count로 센 결과가 IGNORECASE 정규식과 같은지 테스트 (비ASCII 포함)"""
+        import re
+        from py_github_analyzer.processing import language_detector
+
+        lowered = language_detector._ascii_lower(text)
+        for source in ["React.", "<template>", "from django", "settings.py", "DJANGO_SETTINGS_MODULE", r"import.*react"]:
+            pattern = language_detector._counted_pattern(source, re.IGNORECASE | re.MULTILINE)
+            expected = len(re.findall(source, text, re.IGNORECASE | re.MULTILINE))
+            assert language_detector._count_matches(pattern, text, lowered) == expected
+
+    @pytest.mark.parametrize("pattern,required", [
+        (r"@app\.(get|post|put|delete)", "@app."),
+        (r"from.*react", "react"),
+        (r"def\s+\w+\s*\(", "def"),
+        (r"useState|useEffect", None),
+        (r"abc?d", None),
+        (r"ab{100}cde", "cde"),
+        (r"[abc]defg", "defg"),
+    ])
+    def test_required_literal(self, pattern, required):
+        """정규식의 모든 매치에 반드시 포함되는 리터럴을 올바르게 추출하는지 테스트"""
+        from py_github_analyzer.processing import language_detector
+
+        assert language_detector._required_literal(pattern) == required
+
     def test_detect_languages(self, sample_files):
         """언어 감지 종합 테스트"""
         from py_github_analyzer.file_processor import LanguageDetector
@@ -328,6 +376,25 @@ class TestFilePrioritizer:
             result = prioritizer.prioritize_files(sample_files)
             assert isinstance(result, list)
 
+    def test_parallel_scoring_matches_serial(self, sample_files):
+        """대량 파일 병렬 점수 계산 결과가 순차 계산과 동일한지 테스트"""
+        from py_github_analyzer.file_processor import FilePrioritizer
+        from py_github_analyzer.processing import file_prioritizer
+
+        files = [
+            {**f, "path": f"pkg{i}/{f['path']}"}
+            for i in range(8)
+            for f in sample_files
+        ]
+        prioritizer = FilePrioritizer()
+        serial = prioritizer.prioritize_files(files, "python")
+
+        with patch.object(file_prioritizer, "_PARALLEL_SCORING_MIN_FILES", 1), \
+             patch.object(file_prioritizer.os, "cpu_count", return_value=2):
+            parallel = prioritizer.prioritize_files(files, "python")
+
+        assert parallel == serial
+
 
 class TestFileProcessor:
     """FileProcessor 메인 클래스 테스트"""
@@ -392,6 +459,26 @@ class TestFileProcessor:
             assert isinstance(selected_files, list)
             assert isinstance(analysis_info, dict)
 
+    def test_should_include_matches_basic_filtering(self, sample_files):
+        """경로와 크기만으로 판단하는 should_include가 기본 필터링과 같은 결과를 내는지 테스트"""
+        from py_github_analyzer.file_processor import FileProcessor
+
+        processor = FileProcessor()
+        candidates = sample_files + [
+            {"path": "assets/logo.png", "content": "", "size": 2048},
+            {"path": "../escape.py", "content": "x = 1\n", "size": 6},
+            {"path": "pkg/__init__.py", "content": "", "size": 0},
+            {"path": "empty.py", "content": "", "size": 0},
+        ]
+
+        kept = [f["path"] for f in processor._apply_basic_filtering(candidates)]
+
+        assert kept == [
+            f["path"] for f in candidates if FileProcessor.should_include(f["path"], f["size"])
+        ]
+        assert "pkg/__init__.py" in kept
+        assert "assets/logo.png" not in kept and "empty.py" not in kept
+
     def test_empty_files_handling(self):
         """빈 파일 목록 처리 테스트"""
         from py_github_analyzer.file_processor import FileProcessor
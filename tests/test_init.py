@@ -310,3 +310,139 @@ def test_token_utils_integration():
             
     except ImportError as e:
         pytest.skip(f"TokenUtils integration test failed: {e}")
+
+def test_env_state_cache(temp_dir):
+    """.env 파싱 결과 캐시 및 변경 시 무효화 테스트"""
+    from py_github_analyzer import _load_env_state, check_env_file, get_token_sources
+
+    env_file = temp_dir / ".env"
+    env_file.write_text("GH_TOKEN=first_token\n")
+
+    original_cwd = os.getcwd()
+    try:
+        os.chdir(temp_dir)
+        _load_env_state.cache_clear()
+
+        check_env_file()
+        get_token_sources()
+        check_env_file()
+        # 파일이 바뀌지 않았으므로 한 번만 파싱
+        assert _load_env_state.cache_info().misses == 1
+        assert _load_env_state.cache_info().hits == 2
+
+        # mtime이 바뀌면 다시 파싱
+        stat = env_file.stat()
+        os.utime(env_file, (stat.st_atime, stat.st_mtime + 10))
+        get_token_sources()
+        assert _load_env_state.cache_info().misses == 2
+    finally:
+        os.chdir(original_cwd)
+        _load_env_state.cache_clear()
+
+def test_lazy_submodule_imports():
+    """패키지 임포트 시 무거운 서브모듈 지연 로딩 테스트"""
+    import subprocess
+
+    code = (
+        "import sys, py_github_analyzer as pga\n"
+        "assert 'py_github_analyzer.async_github_client' not in sys.modules\n"
+        "assert 'py_github_analyzer.core' not in sys.modules\n"
+        "pga.check_env_file()\n"
+        "assert 'py_github_analyzer.core' not in sys.modules\n"
+        "assert pga.AsyncGitHubClient.__name__ == 'AsyncGitHubClient'\n"
+        "assert 'AsyncGitHubClient' in vars(pga)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(Path(__file__).parent.parent),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+    import py_github_analyzer
+    with pytest.raises(AttributeError):
+        py_github_analyzer.does_not_exist
+
+def test_env_file_check_error_state():
+    """check_env_file 오류 응답 구조 테스트"""
+    from py_github_analyzer import check_env_file, _load_env_state
+
+    _load_env_state.cache_clear()
+    with patch("py_github_analyzer.utils.TokenUtils._find_env_files", side_effect=OSError("boom")):
+        first = check_env_file()
+        second = check_env_file()
+
+    assert first["token_status"] == "error"
+    assert first["error"] == "boom"
+    assert first["env_file_paths"] == [] and first["token_sources"] == []
+    first["env_file_paths"].append("x")
+    assert second["env_file_paths"] == []
+
+def test_check_env_status_namedtuple():
+    """check_env_status NamedTuple 반환 및 dict 호환성 테스트"""
+    from py_github_analyzer import EnvFileStatus, check_env_file, check_env_status
+
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_" + "a" * 36}, clear=True):
+        status = check_env_status()
+        legacy = check_env_file()
+
+    assert isinstance(status, EnvFileStatus)
+    assert status.token_status == "provided"
+    assert status.token_type == "classic"
+    assert "GITHUB_TOKEN (system)" in status.token_sources
+    assert status.as_dict() == legacy
+    assert "error" not in legacy
+
+def test_check_env_file_without_token_info():
+    """include_token_info=False 시 get_token_info 생략 테스트"""
+    from py_github_analyzer import check_env_file
+    from py_github_analyzer.utils import TokenUtils
+
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_" + "a" * 36}, clear=True):
+        with patch.object(TokenUtils, "get_token_info") as get_info:
+            result = check_env_file(include_token_info=False)
+            get_info.assert_not_called()
+
+    assert result["token_status"] == "provided"
+    assert result["token_type"] == "unknown"
+    assert result["token_sources"] == ["GITHUB_TOKEN (system)"]
+
+def test_env_checks_propagate_unexpected_errors():
+    """예상하지 못한 예외는 오류 결과로 숨기지 않고 전파되는지 테스트"""
+    from py_github_analyzer import check_env_file, get_token_sources
+
+    with patch("py_github_analyzer.utils.TokenUtils._find_env_files", side_effect=RuntimeError("bug")):
+        with pytest.raises(RuntimeError):
+            check_env_file()
+        with pytest.raises(RuntimeError):
+            get_token_sources()
+
+def test_lazy_import_error_reported_to_stderr(capsys):
+    """지연 임포트 실패 시 stderr 출력 및 예외 재발생 테스트"""
+    import py_github_analyzer
+
+    py_github_analyzer.__dict__.pop("Config", None)
+    with patch("importlib.import_module", side_effect=ImportError("no httpx")):
+        with pytest.raises(ImportError):
+            py_github_analyzer.__getattr__("Config")
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == "Import error: no httpx\nMake sure all required dependencies are installed.\n"
+
+async def test_env_check_async_variants():
+    """check_env_file_async / get_token_sources_async 결과가 동기 버전과 같은지 테스트"""
+    from py_github_analyzer import (
+        check_env_file,
+        check_env_file_async,
+        get_token_sources,
+        get_token_sources_async,
+    )
+
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "ghp_" + "a" * 36}, clear=True):
+        assert await check_env_file_async() == check_env_file()
+        assert await check_env_file_async(include_token_info=False) == check_env_file(
+            include_token_info=False
+        )
+        assert await get_token_sources_async() == get_token_sources()
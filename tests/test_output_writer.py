@@ -0,0 +1,91 @@
+"""
+Tests for py_github_analyzer output_writer.py module
+출력 파일 저장 모듈 테스트
+"""
+
+import json
+import pickle
+
+import pytest
+
+from py_github_analyzer import _json, output_writer
+from py_github_analyzer.logger import AnalyzerLogger
+from py_github_analyzer.output_writer import OutputWriter
+
+
+@pytest.fixture
+def output_payload():
+    """출력 데이터 픽스처"""
+    metadata = {"repo": "user/repo", "desc": "한글 설명", "files": 2}
+    files = [
+        {"path": "main.py", "content": "print('안녕')\n", "size": 15},
+        {"path": "README.md", "content": "# Test\n", "size": 7},
+    ]
+    return metadata, files
+
+
+class TestOutputWriter:
+    """OutputWriter 클래스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_write_both_formats(self, tmp_path, output_payload):
+        """JSON과 바이너리 출력이 모두 올바르게 저장되는지 테스트"""
+        metadata, files = output_payload
+        writer = OutputWriter(AnalyzerLogger())
+
+        paths = await writer.write(str(tmp_path), "both", metadata, files, "user_repo")
+
+        raw = (tmp_path / "user_repo.json").read_bytes()
+        assert "한글 설명".encode("utf-8") in raw
+        data = json.loads(raw)
+        assert data["metadata"] == metadata
+        assert data["files"] == files
+        assert "generated_at" in data and "version" in data
+
+        with open(paths["bin"], "rb") as f:
+            assert f.read(2) == b"\x1f\x8b"
+        assert output_writer.load_binary_output(paths["bin"])["files"] == files
+
+    def test_load_binary_output_reads_uncompressed_pickle(self, tmp_path, output_payload):
+        """이전 버전의 비압축 pickle 출력도 읽을 수 있는지 테스트"""
+        metadata, files = output_payload
+        legacy_path = tmp_path / "legacy.bin"
+        legacy_path.write_bytes(pickle.dumps({"metadata": metadata, "files": files}))
+
+        assert output_writer.load_binary_output(legacy_path)["metadata"] == metadata
+
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_streamed_json_matches_json_dumps(self, tmp_path, output_payload, monkeypatch, use_orjson):
+        """파일 단위로 스트리밍 저장한 JSON이 json.dumps(indent=2) 결과와 동일한지 테스트"""
+        if use_orjson and not _json.ORJSON_AVAILABLE:
+            pytest.skip("orjson not available")
+        monkeypatch.setattr(_json, "ORJSON_AVAILABLE", use_orjson)
+        metadata, files = output_payload
+        output_data = {
+            "metadata": {**metadata, "lang": ["Python"], "deps": [], "size": {"total": 22}},
+            "files": files,
+            "empty": [],
+            "generated_at": 12.5,
+            "version": "1.0.0",
+        }
+        json_path = tmp_path / "out.json"
+
+        output_writer._write_json(json_path, output_data)
+
+        expected = json.dumps(output_data, indent=2, ensure_ascii=False)
+        assert json_path.read_text(encoding="utf-8") == expected
+
+    @pytest.mark.asyncio
+    async def test_generated_at_is_wall_clock_time(self, tmp_path, output_payload):
+        """generated_at이 이벤트 루프 시계가 아닌 실제 시각(epoch)으로 기록되는지 테스트"""
+        import time
+
+        metadata, files = output_payload
+        writer = OutputWriter(AnalyzerLogger())
+
+        before = time.time()
+        await writer.write(str(tmp_path), "json", metadata, files, "user_repo")
+        after = time.time()
+
+        data = json.loads((tmp_path / "user_repo.json").read_bytes())
+        assert before <= data["generated_at"] <= after
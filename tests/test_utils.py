@@ -66,6 +66,17 @@ class TestURLParser:
         assert result["owner"] == "user"
         assert result["repo"] == "repo"
 
+    def test_parse_github_url_returns_independent_copies(self):
+        """캐시된 파싱 결과를 호출자가 수정해도 다음 호출에 영향이 없는지 테스트"""
+        from py_github_analyzer.utils import URLParser
+
+        first = URLParser.parse_github_url("https://github.com/user/cached-repo")
+        first["owner"] = "changed"
+
+        second = URLParser.parse_github_url("https://github.com/user/cached-repo")
+        assert second["owner"] == "user"
+        assert second is not first
+
     def test_parse_github_url_invalid(self):
         """잘못된 URL 파싱 테스트"""
         from py_github_analyzer.utils import URLParser